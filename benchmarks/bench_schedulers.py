@@ -0,0 +1,186 @@
+"""Benchmark the scheduling engines across workload sizes and shapes.
+
+Times every engine (FCFS, both SJF modes, Round Robin at several quanta and
+both Priority modes, CFS) on synthetic workloads of 10 to 10^6 processes and
+reports wall time, peak traced memory and the number of timeline segments.
+Results can be saved as a JSON baseline and later runs compared against it.
+
+    python benchmarks/bench_schedulers.py --sizes 10,1000,100000 --save baseline.json
+    python benchmarks/bench_schedulers.py --compare baseline.json --threshold 0.25
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from cpusched import CFS, FCFS, SJF, PriorityScheduling, RoundRobin  # noqa: E402
+from cpusched.generator import WorkloadGenerator  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10_000, 100_000, 1_000_000)
+
+# name -> constructor taking a list of (pid, at, bt, priority) tuples
+CASES = {
+    "fcfs": lambda processes: FCFS([(pid, at, bt) for pid, at, bt, _ in processes]),
+    "sjf-preemptive": lambda processes: SJF([(pid, at, bt) for pid, at, bt, _ in processes], True),
+    "sjf-non-preemptive": lambda processes: SJF([(pid, at, bt) for pid, at, bt, _ in processes], False),
+    "rr-q2": lambda processes: RoundRobin([(pid, at, bt) for pid, at, bt, _ in processes], 2),
+    "rr-q8": lambda processes: RoundRobin([(pid, at, bt) for pid, at, bt, _ in processes], 8),
+    "rr-q32": lambda processes: RoundRobin([(pid, at, bt) for pid, at, bt, _ in processes], 32),
+    "priority-preemptive": lambda processes: PriorityScheduling(processes, True),
+    "priority-non-preemptive": lambda processes: PriorityScheduling(processes, False),
+    "cfs": lambda processes: CFS(processes),
+}
+
+
+# name -> WorkloadGenerator parameters, all at roughly 90% CPU load
+WORKLOADS = {
+    "poisson-exponential": dict(arrivals="poisson", bursts="exponential"),
+    "poisson-pareto": dict(arrivals="poisson", bursts="pareto"),
+    "bursty-bimodal": dict(arrivals="bursty", bursts="bimodal", priorities="skewed", idle_gap=700.0),
+}
+
+
+def make_workload(name, n, seed=0):
+    """Return n (pid, at, bt, priority) tuples for one of the WORKLOADS shapes."""
+    return list(WorkloadGenerator(seed=seed, **WORKLOADS[name]).processes(n))
+
+
+def run_case(case, processes, repeat, measure_memory):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        timeline = CASES[case](processes).calculate_completion_time()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        segments = len(timeline)
+        del timeline
+
+    peak = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        timeline = CASES[case](processes).calculate_completion_time()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del timeline
+
+    return {"seconds": best, "peak_bytes": peak, "segments": segments}
+
+
+def run_benchmarks(cases, workloads, sizes, repeat=1, measure_memory=True, seed=0):
+    results = []
+    for workload in workloads:
+        for size in sizes:
+            processes = make_workload(workload, size, seed)
+            for case in cases:
+                result = run_case(case, processes, repeat, measure_memory)
+                result.update(case=case, workload=workload, size=size)
+                results.append(result)
+                print(format_result(result), flush=True)
+    return results
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+
+
+def format_result(result):
+    return (f"{result['workload']:<20} {result['size']:>9} {result['case']:<24} "
+            f"{result['seconds'] * 1000:>11.2f} ms {format_bytes(result['peak_bytes']):>12} "
+            f"{result['segments']:>10} segments")
+
+
+def compare(results, baseline, threshold, min_delta=0.001):
+    """Return a list of regression messages against a baseline result list.
+
+    Slowdowns smaller than ``min_delta`` seconds are ignored as timer noise.
+    """
+    previous = {(r["case"], r["workload"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        key = (result["case"], result["workload"], result["size"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        label = f"{result['case']} on {result['workload']} n={result['size']}"
+        if result["seconds"] - old["seconds"] > max(old["seconds"] * threshold, min_delta):
+            regressions.append(f"{label}: time {old['seconds'] * 1000:.2f} -> {result['seconds'] * 1000:.2f} ms")
+        if result["peak_bytes"] and old.get("peak_bytes") and result["peak_bytes"] > old["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{label}: peak memory {format_bytes(old['peak_bytes'])} -> {format_bytes(result['peak_bytes'])}")
+        if result["segments"] != old["segments"]:
+            regressions.append(f"{label}: segments {old['segments']} -> {result['segments']} (schedule changed)")
+    return regressions
+
+
+def parse_list(value, choices=None):
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if choices is not None:
+        unknown = [item for item in items if item not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown value(s): {', '.join(unknown)}; choose from {', '.join(choices)}")
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in parse_list(v)], default=list(DEFAULT_SIZES),
+                        help="comma-separated process counts (default: 10 to 10^6)")
+    parser.add_argument("--cases", type=lambda v: parse_list(v, CASES), default=list(CASES),
+                        help=f"comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--workloads", type=lambda v: parse_list(v, WORKLOADS), default=list(WORKLOADS),
+                        help=f"comma-separated subset of: {', '.join(WORKLOADS)}")
+    parser.add_argument("--repeat", type=int, default=1, help="report the best of this many timed runs")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results to this JSON baseline file")
+    parser.add_argument("--compare", help="compare against this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown or memory growth counted as a regression (default: 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this many milliseconds (default: 1)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.cases, args.workloads, args.sizes, args.repeat, not args.no_memory, args.seed)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "seed": args.seed,
+                "results": results,
+            }, f, indent=2)
+        print(f"saved {len(results)} results to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"no regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
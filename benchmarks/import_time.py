@@ -0,0 +1,64 @@
+"""Check that ``import cpusched`` stays within its import-time budget.
+
+Runs ``python -X importtime -c "import cpusched"`` in fresh interpreters and
+reports the best cumulative import time of the package. Exits non-zero if it
+exceeds the budget or if the import pulled in PyQt5.
+
+    python benchmarks/import_time.py [--budget-ms 50] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 50
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module="cpusched"):
+    """Return (cumulative import time in ms, whether PyQt5 was imported) for one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative_us = None
+    qt_imported = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        if name == module:
+            cumulative_us = int(fields[1])
+        elif name.split(".")[0] == "PyQt5":
+            qt_imported = True
+    if cumulative_us is None:
+        raise RuntimeError(f"no importtime entry for {module}")
+    return cumulative_us / 1000, qt_imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    samples = [measure_import() for _ in range(args.runs)]
+    best = min(ms for ms, _ in samples)
+    qt_imported = any(qt for _, qt in samples)
+
+    print(f"import cpusched: {best:.1f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    if qt_imported:
+        print("FAIL: importing cpusched pulled in PyQt5")
+        return 1
+    if best > args.budget_ms:
+        print("FAIL: import-time budget exceeded")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Qt-free scheduling engines, metrics and headless entry points.
+
+Importing this package must stay cheap and must never pull in PyQt5;
+``benchmarks/import_time.py`` checks it against a fixed budget. Modules
+therefore import NumPy, and other costly modules only some calls need
+(hashing and pickling in the cache, fractions for exact percentiles),
+inside the functions that use them rather than at the top.
+"""
+
+from cpusched.cfs import CFS
+from cpusched.fcfs import FCFS
+from cpusched.metrics import calculate_turnaround_time, calculate_waiting_time
+from cpusched.priorityScheduling import PriorityScheduling
+from cpusched.process import Process
+from cpusched.result import ScheduleResult
+from cpusched.roundRobin import RoundRobin
+from cpusched.sjf import SJF
+from cpusched.smp import SMP
+from cpusched.timeline import Timeline
+
+__all__ = [
+    "FCFS",
+    "SJF",
+    "RoundRobin",
+    "PriorityScheduling",
+    "CFS",
+    "SMP",
+    "Process",
+    "ScheduleResult",
+    "Timeline",
+    "calculate_turnaround_time",
+    "calculate_waiting_time",
+]
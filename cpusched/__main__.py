@@ -0,0 +1,5 @@
+import sys
+
+from cpusched.cli import main
+
+sys.exit(main())
@@ -0,0 +1,231 @@
+"""Content-addressed cache of schedule results.
+
+Results are keyed by a hash of the algorithm, its parameters and the workload
+itself, so identical inputs hit the cache however they were produced. The
+cache has a bounded in-memory LRU tier and, optionally, a directory of
+pickled results that is trimmed to a byte budget by evicting the least
+recently used files. Cached results are shared, so callers must not modify
+them.
+"""
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+from cpusched.process import Process
+from cpusched.result import ScheduleResult
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = ".pickle"
+FORMAT = 2  # Part of every key; bumped when cached results change shape
+
+
+def workload_digest(processes, priority=False, columns=False):
+    """Return a BLAKE2 digest of the pid, at, bt (and optionally priority) columns of a workload.
+
+    ``processes`` is a sequence of (pid, at, bt[, priority]) tuples or Process
+    records or, with ``columns``, parallel pid/at/bt(/priority) columns.
+    Both forms of the same workload have the same digest.
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=20)
+    fields = 4 if priority else 3
+    if columns:
+        import numpy as np
+
+        for column in processes[:fields]:
+            digest.update(np.ascontiguousarray(column, dtype="<i8").tobytes())
+        return digest.hexdigest()
+
+    rows = [row.as_tuple() if isinstance(row, Process) else row for row in processes]
+    for field in range(fields):
+        column = array("q", [row[field] if field < len(row) else 0 for row in rows])
+        if sys.byteorder == "big":
+            column.byteswap()  # Same keys as the little-endian NumPy path
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+def schedule_key(algorithm, params, processes, priority=False, columns=False):
+    """Return the cache key of scheduling ``processes`` with ``algorithm`` and its ``params`` dict.
+
+    ``priority`` and ``columns`` are as for ``workload_digest``.
+    """
+    import hashlib
+    import json
+
+    header = json.dumps([FORMAT, algorithm, params], sort_keys=True)
+    digest = workload_digest(processes, priority, columns)
+    return hashlib.blake2b(f"{header}:{digest}".encode(), digest_size=20).hexdigest()
+
+
+class Cacheable:
+    """Mixin giving a scheduler ``cache_key()`` and ``schedule(cache=None)``.
+
+    Schedulers name their ``algorithm``, return the parameters that shape
+    the schedule from ``cache_params()`` and set ``uses_priority`` when
+    priorities matter. They keep the workload in ``processes``.
+    """
+
+    algorithm = None
+    uses_priority = False
+
+    def cache_params(self):
+        return {}
+
+    def cache_key(self):
+        return schedule_key(self.algorithm, self.cache_params(), self.processes, priority=self.uses_priority)
+
+    def schedule(self, cache=None):
+        """Run the scheduler and return a ScheduleResult, reused from ``cache`` for identical inputs."""
+        if cache is not None:
+            return cache.schedule(self)
+        return self.compute_result()
+
+    def compute_result(self):
+        return ScheduleResult.from_timeline(self.calculate_completion_time(), self.processes)
+
+
+class CacheStats:
+    __slots__ = ("hits", "disk_hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0  # All hits, including disk_hits
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "evictions": self.evictions, "hit_rate": self.hit_rate}
+
+    def __str__(self):
+        return (f"{self.hits} hits ({self.disk_hits} from disk), {self.misses} misses, "
+                f"{self.hit_rate:.0%} hit rate, {self.evictions} evictions")
+
+
+class ScheduleCache:
+    """Bounded LRU of results in memory, optionally backed by a directory on disk.
+
+    ``max_entries`` bounds the in-memory tier; ``directory`` enables the disk
+    tier, whose files are evicted oldest-used first once they exceed
+    ``max_bytes`` in total. Several processes may share one directory.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.stats = CacheStats()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries or (self.directory is not None and os.path.exists(self.path(key)))
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """Return the cached value for ``key``, or None on a miss."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return self.entries[key]
+
+        if self.directory is not None:
+            import pickle
+
+            path = self.path(key)
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                os.utime(path)  # Mark as recently used for eviction
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass  # Missing, or evicted or half-written by another process
+            else:
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                self.remember(key, value)
+                return value
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.remember(key, value)
+        if self.directory is not None:
+            import pickle
+            import tempfile
+
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path(key))
+            self.trim_disk()
+
+    def remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def trim_disk(self):
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats.evictions += 1
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        self.entries.clear()
+        if self.directory is not None:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(SUFFIX):
+                    os.remove(entry.path)
+
+    def schedule(self, scheduler, compute=None):
+        """Return ``scheduler.schedule()``, reusing a cached result for identical inputs.
+
+        ``compute`` optionally replaces ``scheduler.schedule`` on a miss, e.g.
+        to reschedule incrementally. Schedulers with a tracer always run,
+        since their events are the point.
+        """
+        compute = compute or scheduler.schedule
+        if scheduler.tracer is not None:
+            return compute()
+        key = scheduler.cache_key()
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
@@ -0,0 +1,164 @@
+"""Completely Fair Scheduler (CFS): weighted virtual runtime, as on Linux.
+
+Every runnable process accrues virtual runtime at a rate inversely
+proportional to its weight, which comes from its nice value (the priority
+column, clamped to -20..19; lower is heavier, as with priorities). The
+process with the least virtual runtime runs next, for a slice of the
+scheduling period in proportion to its share of the total weight. The
+period is ``target_latency``, stretched to ``min_granularity`` per process
+once so many are runnable that their slices would be shorter. Arrivals start
+at the run queue's minimum virtual runtime and wait for the running slice to
+end. The run queue is a heap, so a pick costs O(log n) however many
+processes are runnable.
+"""
+import heapq
+
+from cpusched.cache import Cacheable
+from cpusched.process import ProcessTable
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE, PREEMPT
+
+# Load weight of nice -20..19 (Linux's sched_prio_to_weight); each step is about 10% of CPU time
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+
+def nice_weight(nice):
+    """Return the load weight of a nice value, clamped to -20..19."""
+    return NICE_TO_WEIGHT[min(max(nice, -20), 19) + 20]
+
+
+class CFS(Cacheable):
+    about = (
+        "Completely Fair Scheduler (CFS):\n\n"
+        "CFS, the default Linux scheduler, aims to give every runnable process its fair share of the CPU. Each process "
+        "accumulates virtual runtime as it runs, more slowly the higher its weight (set by its nice value, taken here from "
+        "the priority column: lower values get more CPU). The process with the least virtual runtime always runs next, for a "
+        "slice of the target latency proportional to its weight, but never less than the minimum granularity. Newly "
+        "arrived processes start at the smallest virtual runtime, so no one starves."
+    )
+
+    algorithm = "cfs"
+    uses_priority = True  # Nice values set the weights
+
+    def __init__(self, processes, target_latency=6, min_granularity=1, tracer=None):
+        if min_granularity < 1:
+            raise ValueError("min_granularity must be at least 1")
+        if target_latency < min_granularity:
+            raise ValueError("target_latency must be at least min_granularity")
+        self.processes = processes  # (pid, at, bt, nice) tuples or Process records (priority is the nice value)
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.tracer = tracer
+
+    def iter_timeline(self):
+        """Yield (pid, start, end) segments as soon as each one is final."""
+        processes = ProcessTable(self.processes)
+        pids, arrivals, remaining = processes.pid, processes.at, processes.remaining
+        weights = [nice_weight(nice) for nice in processes.priority]
+        n = len(processes)
+        latency, granularity = self.target_latency, self.min_granularity
+        latency_tasks = latency // granularity  # Most runnable processes the target latency has room for
+        vruntime = [0.0] * n
+        run_queue = []  # Min-heap of (vruntime, i); earlier arrival breaks ties
+        load = 0  # Total weight of the runnable processes, including the running one
+        min_vruntime = 0.0  # Never decreases
+        current_time = 0
+        index = 0
+        running = None  # i of the process whose segment is open
+        segment_start = 0
+        tracer = self.tracer
+
+        while index < n or run_queue:
+            # Arrivals while the CPU is free start at the queue's minimum virtual runtime
+            while index < n and arrivals[index] <= current_time:
+                if run_queue:
+                    min_vruntime = max(min_vruntime, run_queue[0][0])
+                load += self.admit(processes, index, min_vruntime, vruntime, run_queue, weights)
+                index += 1
+
+            if not run_queue:
+                if index == n:
+                    break  # The last arrivals had zero burst time
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = arrivals[index]
+                continue
+
+            _, i = heapq.heappop(run_queue)
+            if i != running:
+                # Back-to-back slices of the same process form a single segment, which
+                # is final once another process is picked
+                if running is not None:
+                    if tracer is not None:
+                        tracer.emit(PREEMPT, current_time, pids[running])
+                    yield (pids[running], segment_start, current_time)
+                if tracer is not None:
+                    tracer.emit(DISPATCH, current_time, pids[i])
+                running = i
+                segment_start = current_time
+
+            # The process's share of the scheduling period, at least the granularity
+            runnable = len(run_queue) + 1
+            period = latency if runnable <= latency_tasks else runnable * granularity
+            time_slice = max(granularity, period * weights[i] // load)
+            if run_queue:
+                execution_time = min(time_slice, remaining[i])
+            elif index < n:
+                # Nobody else is runnable: keep running whole slices until one ends
+                # at or after the next arrival
+                slices = max(1, -(-(arrivals[index] - current_time) // time_slice))
+                execution_time = min(slices * time_slice, remaining[i])
+            else:
+                execution_time = remaining[i]
+
+            start_time, start_vruntime = current_time, vruntime[i]
+            rate = NICE_0_WEIGHT / weights[i]  # Virtual runtime per unit of CPU time
+            current_time += execution_time
+            remaining[i] -= execution_time
+            vruntime[i] += execution_time * rate
+
+            # Arrivals during the slice start at the minimum virtual runtime as of their arrival
+            while index < n and arrivals[index] <= current_time:
+                running_vruntime = start_vruntime + (arrivals[index] - start_time) * rate
+                if run_queue:
+                    running_vruntime = min(running_vruntime, run_queue[0][0])
+                min_vruntime = max(min_vruntime, running_vruntime)
+                load += self.admit(processes, index, min_vruntime, vruntime, run_queue, weights)
+                index += 1
+
+            if remaining[i] > 0:
+                heapq.heappush(run_queue, (vruntime[i], i))
+            else:
+                load -= weights[i]
+                if tracer is not None:
+                    tracer.emit(COMPLETE, current_time, pids[i])
+                running = None
+                yield (pids[i], segment_start, current_time)
+
+    def admit(self, processes, i, min_vruntime, vruntime, run_queue, weights):
+        """Queue arrival ``i`` at ``min_vruntime`` and return the weight it adds to the run queue."""
+        if self.tracer is not None:
+            self.tracer.emit(ARRIVAL, processes.at[i], processes.pid[i])
+        if processes.bt[i] == 0:
+            if self.tracer is not None:
+                self.tracer.emit(COMPLETE, processes.at[i], processes.pid[i])  # Zero burst time never runs
+            return 0
+        vruntime[i] = min_vruntime
+        heapq.heappush(run_queue, (min_vruntime, i))
+        return weights[i]
+
+    def calculate_completion_time(self):
+        return Timeline(self.iter_timeline())
+
+    def cache_params(self):
+        return {"target_latency": self.target_latency, "min_granularity": self.min_granularity}
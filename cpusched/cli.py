@@ -0,0 +1,360 @@
+import argparse
+import json
+import sys
+
+from cpusched.cfs import CFS
+from cpusched.fcfs import FCFS
+from cpusched.ingest import FORMATS as TRACE_FORMATS, TraceStats, chunks, guess_format as guess_trace_format, iter_trace
+from cpusched.metrics import PerformanceMetrics, compute_metrics
+from cpusched.priorityScheduling import PriorityScheduling
+from cpusched.roundRobin import RoundRobin
+from cpusched.sjf import SJF
+from cpusched.smp import QUEUES, SMP
+from cpusched.timeline import Timeline
+from cpusched.tracing import JsonLinesTracer
+from cpusched.workload import read_workload, write_chunks
+
+# Same constructors InnerWindow.get_scheduler uses, keyed by short CLI names
+ALGORITHMS = {
+    "fcfs": lambda processes, args, tracer: FCFS([(pid, at, bt) for pid, at, bt, _ in processes], tracer),
+    "sjf": lambda processes, args, tracer: SJF([(pid, at, bt) for pid, at, bt, _ in processes], args.preemptive, tracer),
+    "rr": lambda processes, args, tracer: RoundRobin([(pid, at, bt) for pid, at, bt, _ in processes], args.quantum, tracer),
+    "priority": lambda processes, args, tracer: PriorityScheduling(processes, args.preemptive, tracer),
+    "cfs": lambda processes, args, tracer: CFS(processes, args.latency, args.min_granularity, tracer),
+}
+
+
+def make_scheduler(processes, args, tracer):
+    if args.cores > 1:
+        return SMP(processes, args.cores, args.algo, args.preemptive, args.quantum, args.queues, tracer)
+    return ALGORITHMS[args.algo](processes, args, tracer)
+
+
+def metric_rows(processes, metrics):
+    """Return per-process rows (pid, at, bt, priority, ct, tat, wt, rt) in input order; rt is the response time."""
+    return list(zip(
+        metrics.pid.tolist(), metrics.at.tolist(), metrics.bt.tolist(),
+        [priority for _, _, _, priority in processes],
+        metrics.ct.tolist(), metrics.tat.tolist(), metrics.wt.tolist(), metrics.response.tolist(),
+    ))
+
+
+def echo_timeline(out, segments):
+    """Write each segment as the scheduler decides it, passing it on to the metrics."""
+    out.write("Timeline:\n")
+    for pid, start, end in segments:
+        out.write(f"P{pid}\t{start}\t{end}\n")
+        yield pid, start, end
+
+
+def write_timeline(out, timeline):
+    out.write("Timeline:\n")
+    out.writelines(f"P{pid}\t{start}\t{end}\n" for pid, start, end in timeline)
+
+
+def write_lanes(out, lanes):
+    for core, lane in enumerate(lanes):
+        out.write(f"Timeline (CPU {core}):\n")
+        out.writelines(f"P{pid}\t{start}\t{end}\n" for pid, start, end in lane)
+
+
+def open_cache(args):
+    """Return a disk-backed ScheduleCache for --cache-dir, or None."""
+    if not args.cache_dir:
+        return None
+    from cpusched.cache import ScheduleCache
+
+    return ScheduleCache(directory=args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+
+def report_cache(args, cache):
+    if cache is not None and args.cache_stats:
+        print(f"cpusched: cache: {cache.stats}", file=sys.stderr)
+
+
+def write_text(out, rows, summary, summary_only, performance):
+    if not summary_only:
+        out.write("\nPID\tAT\tBT\tPriority\tCT\tTAT\tWT\tRT\n")
+        for pid, at, bt, priority, ct, tat, wt, rt in rows:
+            out.write(f"P{pid}\t{at}\t{bt}\t{priority}\t{ct}\t{tat}\t{wt}\t{rt}\n")
+        out.write("\n")
+    out.write(f"Average Waiting Time: {summary['average_waiting_time']:.2f}\n")
+    out.write(f"Average Turnaround Time: {summary['average_turnaround_time']:.2f}\n")
+    out.write(f"Total Execution Time: {summary['total_execution_time']}\n")
+    out.write(f"CPU Utilization: {performance.utilization:.2%} (idle {performance.idle_time})\n")
+    if performance.cores > 1:
+        out.writelines(f"  CPU {core}: {value:.2%}\n" for core, value in enumerate(performance.core_utilization))
+    out.write(f"Throughput: {performance.throughput:.4f} per time unit "
+              f"(peak {performance.peak_throughput:.4f} over {performance.throughput_window})\n")
+    out.write(f"Average Response Time: {performance.average_response_time:.2f}\n")
+    out.write(f"Context Switches: {performance.context_switches} (preemptions: {performance.preemptions})\n")
+    out.write(f"Max Waiting Time: {performance.max_waiting_time} (variance {performance.waiting_time_variance:.2f})\n")
+    for label, percentiles in zip(("WT", "TAT", "RT"), performance.latency.percentiles().values()):
+        out.write(f"{label} Percentiles: " + ", ".join(f"{name} {value}" for name, value in percentiles.items()) + "\n")
+
+
+def write_json(out, args, timeline, rows, summary, summary_only, performance, result=None):
+    report = {
+        "algorithm": args.algo,
+        "preemptive": args.preemptive,
+        "quantum": args.quantum if args.algo == "rr" else None,
+        "processes": len(rows),
+        **summary,
+        "performance": performance.as_dict(),
+    }
+    if args.algo == "cfs":
+        report.update(target_latency=args.latency, min_granularity=args.min_granularity)
+    if args.cores > 1:
+        report.update(cores=args.cores, queues=args.queues, utilization=result.utilization())
+    if not summary_only and args.cores > 1:
+        report["lanes"] = [[list(segment) for segment in lane] for lane in result.lanes]
+    elif not summary_only:
+        report["timeline"] = [list(segment) for segment in timeline]
+        report["metrics"] = [
+            dict(zip(("pid", "at", "bt", "priority", "ct", "tat", "wt", "rt"), row)) for row in rows
+        ]
+    json.dump(report, out)
+    out.write("\n")
+
+
+def run(args):
+    processes = read_workload(args.workload)
+    tracer = JsonLinesTracer(args.trace) if args.trace else None
+    cache = open_cache(args)
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        scheduler = make_scheduler(processes, args, tracer)
+        result = None
+        if isinstance(scheduler, SMP):
+            # Every core's lane is needed for the report, so the schedule is built in full
+            result = scheduler.schedule(cache)
+            timeline, metrics = result.timeline, result.metrics
+            if args.format == "text" and not args.summary_only:
+                write_lanes(out, result.lanes)
+        elif cache is not None:
+            result = scheduler.schedule(cache)
+            timeline, metrics = result.timeline, result.metrics
+            if args.format == "text" and not args.summary_only:
+                write_timeline(out, timeline)
+        else:
+            # Segments stream straight into the metrics (and the text report), so the
+            # timeline is only kept in memory when the JSON report needs it
+            timeline = None
+            segments = scheduler.iter_timeline()
+            if args.format == "json" and not args.summary_only:
+                segments = timeline = Timeline(segments)
+            elif args.format == "text" and not args.summary_only:
+                segments = echo_timeline(out, segments)
+
+            metrics = compute_metrics(
+                segments,
+                [pid for pid, _, _, _ in processes],
+                [at for _, at, _, _ in processes],
+                [bt for _, _, bt, _ in processes],
+            )
+        rows = metric_rows(processes, metrics)
+        summary = metrics.summary()
+        window = args.throughput_window
+        performance = result.performance(window) if result is not None else PerformanceMetrics(metrics, window=window)
+
+        if args.format == "json":
+            write_json(out, args, timeline, rows, summary, args.summary_only, performance, result)
+        else:
+            write_text(out, rows, summary, args.summary_only, performance)
+    finally:
+        if tracer is not None:
+            tracer.close()
+        if out is not sys.stdout:
+            out.close()
+    report_cache(args, cache)
+    return 0
+
+
+def generate(args):
+    # NumPy-backed, so only imported for this command
+    from cpusched.generator import WorkloadGenerator
+
+    generator = WorkloadGenerator(
+        arrivals=args.arrivals, bursts=args.bursts, priorities=args.priorities, seed=args.seed,
+        rate=args.rate, burst_size=args.burst_size, idle_gap=args.idle_gap,
+        mean_burst=args.mean_burst, pareto_alpha=args.pareto_alpha, levels=args.levels, skew=args.skew,
+    )
+    count = write_chunks(args.output, generator.chunks(args.count, args.chunk_size))
+    print(f"wrote {count} processes to {args.output}", file=sys.stderr)
+    return 0
+
+
+def import_trace(args):
+    options = {}
+    if args.tick is not None:
+        options["tick"] = args.tick
+    if args.origin is not None:
+        options["origin"] = args.origin
+    if (args.format or guess_trace_format(args.trace)) == "csv":
+        options.update(start=args.start_column, duration=args.duration_column, end=args.end_column,
+                       priority=args.priority_column)
+    stats = TraceStats()
+    processes = iter_trace(args.trace, args.format, stats, **options)
+    count = write_chunks(args.output, chunks(processes, args.chunk_size))
+    print(f"wrote {count} processes to {args.output}", file=sys.stderr)
+    print(f"parsed {stats}", file=sys.stderr)
+    return 0
+
+
+def parse_quanta(value):
+    """Parse a quantum list such as "1-8,16,32" (ranges are inclusive)."""
+    quanta = []
+    for item in value.split(","):
+        low, _, high = item.strip().partition("-")
+        try:
+            quanta.extend(range(int(low), int(high or low) + 1))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid quantum list {value!r}")
+    return quanta
+
+
+def parse_algorithms(value):
+    algorithms = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in algorithms if item not in ALGORITHMS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown algorithm(s) {', '.join(unknown)}; choose from {', '.join(sorted(ALGORITHMS))}")
+    return algorithms
+
+
+def write_sweep_text(out, rows):
+    out.write("Workload\tAlgorithm\tPreemptive\tQuantum\tAvg WT\tAvg TAT\tMakespan\tContext Switches\n")
+    for row in rows:
+        quantum = "-" if row["quantum"] is None else row["quantum"]
+        out.write(f"{row['workload']}\t{row['algorithm']}\t{'yes' if row['preemptive'] else 'no'}\t{quantum}\t"
+                  f"{row['average_waiting_time']:.2f}\t{row['average_turnaround_time']:.2f}\t"
+                  f"{row['makespan']}\t{row['context_switches']}\n")
+
+
+def sweep(args):
+    # Only the sweep command needs the process pool
+    from cpusched.sweep import grid, sweep as run_sweep
+
+    workloads = {path: read_workload(path) for path in args.workloads}
+    modes = {"off": (False,), "on": (True,), "both": (False, True)}[args.preemptive]
+    cache = open_cache(args)
+    rows = run_sweep(workloads, grid(args.algos, modes, args.quanta), args.workers, args.chunksize, cache)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(rows, out)
+            out.write("\n")
+        else:
+            write_sweep_text(out, rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    report_cache(args, cache)
+    return 0
+
+
+def gui(args):
+    # PyQt5 is only imported here, when the GUI is actually launched
+    import main
+
+    return main.run()
+
+
+def add_cache_arguments(parser):
+    parser.add_argument("--cache-dir", help="reuse schedules cached in this directory (and cache new ones)")
+    parser.add_argument("--cache-max-mb", type=int, default=256, help="size limit of the cache directory (default: 256)")
+    parser.add_argument("--cache-stats", action="store_true", help="print cache hits and misses to stderr")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cpusched", description="Headless CPU scheduling simulator.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="schedule a workload file and report the timeline and metrics")
+    run_parser.add_argument("workload", help="CSV file with pid, at, bt and optional priority columns")
+    run_parser.add_argument("--algo", choices=sorted(ALGORITHMS), required=True)
+    run_parser.add_argument("--preemptive", action="store_true", help="preemptive mode for sjf and priority")
+    run_parser.add_argument("--quantum", type=int, default=2, help="time quantum for rr (default: 2)")
+    run_parser.add_argument("--latency", type=int, default=6, help="target latency for cfs (default: 6)")
+    run_parser.add_argument("--min-granularity", type=int, default=1,
+                            help="minimum slice for cfs (default: 1)")
+    run_parser.add_argument("--cores", type=int, default=1, help="simulated cores (default: 1)")
+    run_parser.add_argument("--queues", choices=QUEUES, default="global",
+                            help="one ready queue shared by all cores, or one per core with work stealing")
+    run_parser.add_argument("--throughput-window", type=int,
+                            help="time units over which peak throughput is measured (default: a tenth of the makespan)")
+    run_parser.add_argument("--format", choices=("text", "json"), default="text")
+    run_parser.add_argument("-o", "--output", help="write the report to this file instead of stdout")
+    run_parser.add_argument("--summary-only", action="store_true", help="omit the timeline and per-process rows")
+    run_parser.add_argument("--trace", help="write scheduler events to this JSON-lines file")
+    add_cache_arguments(run_parser)
+    run_parser.set_defaults(func=run)
+
+    gen_parser = subparsers.add_parser("gen", help="write a seeded synthetic workload (CSV, or binary for .bin)")
+    gen_parser.add_argument("count", type=int, help="number of processes")
+    gen_parser.add_argument("-o", "--output", required=True, help="output file; a .bin suffix writes raw int64 rows")
+    gen_parser.add_argument("--arrivals", choices=("poisson", "bursty"), default="poisson")
+    gen_parser.add_argument("--bursts", choices=("exponential", "pareto", "bimodal"), default="exponential")
+    gen_parser.add_argument("--priorities", choices=("uniform", "skewed"), default="uniform")
+    gen_parser.add_argument("--seed", type=int, default=0)
+    gen_parser.add_argument("--rate", type=float, default=0.09, help="poisson arrivals per time unit")
+    gen_parser.add_argument("--burst-size", type=float, default=50, help="mean arrivals per burst (bursty)")
+    gen_parser.add_argument("--idle-gap", type=float, default=500.0, help="mean gap between bursts (bursty)")
+    gen_parser.add_argument("--mean-burst", type=float, default=10.0, help="mean burst time")
+    gen_parser.add_argument("--pareto-alpha", type=float, default=1.5)
+    gen_parser.add_argument("--levels", type=int, default=10, help="number of priority levels")
+    gen_parser.add_argument("--skew", type=float, default=1.5, help="exponent of the skewed priority model")
+    gen_parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    gen_parser.set_defaults(func=generate)
+
+    import_parser = subparsers.add_parser("import", help="convert a perf/ftrace sched dump or a cluster CSV trace to a workload")
+    import_parser.add_argument("trace", help="trace file, read incrementally")
+    import_parser.add_argument("-o", "--output", required=True, help="output file; a .bin suffix writes raw int64 rows")
+    import_parser.add_argument("--format", choices=TRACE_FORMATS,
+                               help="trace format (default: csv for .csv files, sched otherwise)")
+    import_parser.add_argument("--tick", type=float,
+                               help="trace time per simulated time unit (default: 0.001 s for sched, 1 for csv)")
+    import_parser.add_argument("--origin", type=float, help="trace time of time 0 (default: the first timestamp of a sched dump, 0 for CSV)")
+    import_parser.add_argument("--start-column", help="csv column of start times")
+    import_parser.add_argument("--duration-column", help="csv column of durations")
+    import_parser.add_argument("--end-column", help="csv column of end times, used without a duration column")
+    import_parser.add_argument("--priority-column", help="csv column of priorities")
+    import_parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    import_parser.set_defaults(func=import_trace)
+
+    sweep_parser = subparsers.add_parser("sweep", help="run a grid of algorithms and quanta over workloads in parallel")
+    sweep_parser.add_argument("workloads", nargs="+", help="workload files (CSV, or binary for .bin)")
+    sweep_parser.add_argument("--algos", type=parse_algorithms, default=sorted(ALGORITHMS),
+                              help="comma-separated algorithms (default: all)")
+    sweep_parser.add_argument("--preemptive", choices=("off", "on", "both"), default="both",
+                              help="modes to run for sjf and priority (default: both)")
+    sweep_parser.add_argument("--quanta", type=parse_quanta, default=[2],
+                              help='rr quanta, e.g. "1-16,32" (default: 2)')
+    sweep_parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    sweep_parser.add_argument("--chunksize", type=int, help="tasks sent to a worker at a time")
+    sweep_parser.add_argument("--format", choices=("text", "json"), default="text")
+    sweep_parser.add_argument("-o", "--output", help="write the table to this file instead of stdout")
+    add_cache_arguments(sweep_parser)
+    sweep_parser.set_defaults(func=sweep)
+
+    gui_parser = subparsers.add_parser("gui", help="launch the PyQt5 simulator")
+    gui_parser.set_defaults(func=gui)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "quantum", 1) < 1:
+        parser.error("--quantum must be at least 1")
+    if getattr(args, "throughput_window", None) is not None and args.throughput_window < 1:
+        parser.error("--throughput-window must be at least 1")
+    if getattr(args, "cores", 1) < 1:
+        parser.error("--cores must be at least 1")
+    if getattr(args, "cores", 1) > 1 and args.algo == "cfs":
+        parser.error("cfs only runs on one core")
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"cpusched: error: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,142 @@
+from itertools import islice
+
+from cpusched.cache import Cacheable, schedule_key
+from cpusched.metrics import compute_metrics
+from cpusched.process import Process, ProcessTable
+from cpusched.result import ScheduleResult
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE
+
+
+class FCFS(Cacheable):
+    about = (
+        "First Come First Serve (FCFS) Scheduling:\n\n"
+        "FCFS is a non-preemptive scheduling algorithm where processes are executed in the order they arrive. "
+        "The process that arrives first is allocated the CPU first, and it runs to completion before the next process starts. "
+        "This algorithm is simple and fair but may lead to the convoy effect, where short processes wait behind a long process, "
+        "resulting in higher average waiting times."
+    )
+
+    algorithm = "fcfs"
+
+    def __init__(self, processes, tracer=None):
+        self.processes = processes  # List of (pid, at, bt[, priority]) tuples or Process records
+        self.tracer = tracer
+        self.columns = None
+
+    @classmethod
+    def from_columns(cls, pid, at, bt, tracer=None):
+        """Build a scheduler from parallel pid/at/bt arrays without creating per-process tuples."""
+        scheduler = cls([], tracer)
+        scheduler.columns = (pid, at, bt)
+        return scheduler
+
+    def calculate_columns(self, start_time=0, skip=0):
+        """Return the schedule as (pid, start, end) NumPy arrays in execution order.
+
+        Completion times follow the prefix recurrence ct_i = max(ct_{i-1}, at_i) + bt_i
+        over processes sorted by arrival, with the clock starting at ``start_time``
+        (ct_{-1}). Unrolled with S_i the running sum of bursts,
+        ct_i = S_i + max(start_time, max_{j<=i}(at_j - S_{j-1})), i.e. one
+        cumulative sum and one running maximum. The first ``skip`` processes
+        in arrival order are left out.
+        """
+        import numpy as np
+
+        if self.columns is not None:
+            pid, at, bt = (np.asarray(column, dtype=np.int64) for column in self.columns)
+        elif self.processes and isinstance(self.processes[0], Process):
+            pid, at, bt = np.array([(p.pid, p.at, p.bt) for p in self.processes], dtype=np.int64).reshape(-1, 3).T
+        elif self.processes:
+            rows = np.asarray(self.processes, dtype=np.int64)
+            if rows.ndim != 2 or rows.shape[1] not in (3, 4):
+                raise ValueError("processes must be (pid, at, bt) or (pid, at, bt, priority) tuples")
+            pid, at, bt = rows[:, :3].T  # Any priority column is ignored
+        else:
+            pid = at = bt = np.empty(0, dtype=np.int64)
+
+        order = np.argsort(at, kind="stable")[skip:]  # Sort by arrival time, ties keep input order
+        pid, at, bt = pid[order], at[order], bt[order]
+
+        end = np.cumsum(bt)
+        slack = at - (end - bt)  # at_j - S_{j-1}
+        np.maximum.accumulate(slack, out=slack)
+        np.maximum(slack, start_time, out=slack)
+        end += slack
+        return pid, end - bt, end
+
+    def sorted_processes(self, skip=0):
+        """Yield (pid, at, bt) in arrival order, ties keeping input order, after the first ``skip``."""
+        if self.columns is None:
+            processes = ProcessTable(self.processes)
+            yield from islice(zip(processes.pid, processes.at, processes.bt), skip, None)
+            return
+
+        import numpy as np
+
+        pid, at, bt = (np.asarray(column, dtype=np.int64) for column in self.columns)
+        order = np.argsort(at, kind="stable")[skip:]
+        for first in range(0, len(order), 65536):
+            chunk = order[first:first + 65536]
+            yield from zip(pid[chunk].tolist(), at[chunk].tolist(), bt[chunk].tolist())
+
+    def iter_timeline(self):
+        """Yield (pid, start, end) segments as soon as each one is final."""
+        return self.resume(0)
+
+    def resume(self, start_time, skip=0):
+        """Yield the segments after the first ``skip`` processes in arrival order, with the CPU free from ``start_time``."""
+        current_time = start_time
+        tracer = self.tracer
+
+        for pid, at, bt in self.sorted_processes(skip):
+            # If the CPU is idle, fast-forward to the arrival time
+            if current_time < at:
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = at
+            start_time = current_time
+            current_time += bt
+
+            if tracer is not None:
+                tracer.emit(ARRIVAL, at, pid)
+                tracer.emit(DISPATCH, start_time, pid)
+                tracer.emit(COMPLETE, current_time, pid)
+
+            yield (pid, start_time, current_time)
+
+    def calculate_completion_time(self):
+        """Calculate completion time using FCFS scheduling."""
+        if self.tracer is not None:
+            # Events need the step-by-step walk
+            return Timeline(self.iter_timeline())
+
+        return Timeline.from_columns(*self.calculate_columns())
+
+    def reschedule(self, previous, since):
+        """Return the Timeline for the current processes, reusing ``previous`` up to ``since``.
+
+        ``previous`` is the timeline of an earlier version of this workload and
+        ``since`` the earliest time an edit could matter (see
+        ``cpusched.process.earliest_change``). Segments starting before it are
+        kept, and scheduling resumes from the end of the last one. Every kept
+        process arrived before ``since``, where arrival order is unaffected by
+        the edit, so they are exactly the first processes in arrival order.
+        """
+        timeline = (previous if isinstance(previous, Timeline) else Timeline(previous)).before(since)
+        if self.tracer is not None:
+            timeline.extend(self.resume(timeline.makespan, len(timeline)))
+        else:
+            timeline.extend(Timeline.from_columns(*self.calculate_columns(timeline.makespan, len(timeline))))
+        return timeline
+
+    def cache_key(self):
+        if self.columns is not None:
+            return schedule_key(self.algorithm, {}, self.columns, columns=True)
+        return super().cache_key()
+
+    def compute_result(self):
+        timeline = self.calculate_completion_time()
+        if self.columns is not None:
+            return ScheduleResult(timeline, compute_metrics(timeline, *self.columns))
+        return ScheduleResult.from_timeline(timeline, self.processes)
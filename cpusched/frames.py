@@ -0,0 +1,253 @@
+"""Frame index for animating a finished schedule one tick at a time.
+
+Frame ``t`` describes the schedule during [t, t + 1): the running process
+of every core, the ready queue (processes that have arrived and not
+completed, other than the running ones, in arrival order) and how much CPU
+time every process has received by t + 1. ``FrameIndex`` compiles a
+timeline once; a ``FrameCursor`` then steps through consecutive frames
+touching only what changed, so a tick costs O(cores) plus the number of
+changes however long the schedule is. Jumping to any frame costs
+O(processes * log(segments)), however far it is.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from itertools import islice
+
+# running: pid or None, on the first (usually the only) core. ready: a
+# ReadyQueue, or None if unchanged since the previous frame. progressed:
+# (row, executed, last) for rows whose executed time changed, where last is
+# when the row last ran (0 if it has not). completed: rows that finished
+# since the previous frame. cores: the running pid or None of every core.
+Frame = namedtuple("Frame", ["time", "running", "ready", "progressed", "completed", "cores"])
+
+
+class ReadyQueue:
+    """The pids of a frame's ready queue in display order, without copying them all.
+
+    A view of the cursor's state: it stays valid while later frames report
+    the ready queue unchanged (``ready`` is None).
+    """
+
+    __slots__ = ("pid", "rows", "running")
+
+    def __init__(self, pid, rows, running):
+        self.pid = pid
+        self.rows = rows  # Row -> None, including the running rows
+        self.running = running  # Set of running rows
+
+    def __len__(self):
+        return len(self.rows) - sum(row in self.rows for row in self.running)
+
+    def __iter__(self):
+        pid, running = self.pid, self.running
+        return (pid[row] for row in self.rows if row not in running)
+
+    def __getitem__(self, item):
+        """Return the pids of a slice (only non-negative bounds and step 1), or a single pid."""
+        if isinstance(item, slice):
+            return list(islice(self, item.start, item.stop))
+        return next(islice(self, item, None))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"ReadyQueue({list(self)})"
+
+
+class FrameIndex:
+    """A Timeline and its processes compiled for playback.
+
+    ``processes`` are Process records (rows in display order) and ``ct`` the
+    completion time of each row, e.g. ``ScheduleMetrics.ct``. A multi-core
+    schedule passes its per-core ``lanes`` too, with ``timeline`` holding
+    every lane's segments ordered by end time (see ``SMPResult``).
+    """
+
+    def __init__(self, timeline, processes, ct, lanes=None):
+        self.timeline = timeline
+        self.lanes = [timeline] if lanes is None else lanes
+        self.pid = [process.pid for process in processes]
+        self.at = [process.at for process in processes]
+        self.bt = [process.bt for process in processes]
+        self.ct = [int(value) for value in ct]
+        self.row = {pid: row for row, pid in enumerate(self.pid)}
+        rows = range(len(self.pid))
+        self.by_arrival = sorted(rows, key=lambda row: (self.at[row], row))
+        self.by_completion = sorted(rows, key=lambda row: (self.ct[row], row))
+        self.arrivals = [self.at[row] for row in self.by_arrival]
+        self.completions = [self.ct[row] for row in self.by_completion]
+        self.index_runs()
+
+    def index_runs(self):
+        """Group the segments by row, with each row's running total of executed time."""
+        import numpy as np
+
+        pid, start, end = self.timeline.arrays()
+        ran = end > start  # Zero-length segments never run
+        pid, start, end = pid[ran], start[ran], end[ran]
+        pids = np.asarray(self.pid, dtype=np.int64)
+        sorter = np.argsort(pids)
+        rows = sorter[np.searchsorted(pids, pid, sorter=sorter)] if len(pids) else pid
+        order = np.argsort(rows, kind="stable")
+        rows = rows[order]
+        self.run_end = end[order]
+        self.run_done = np.cumsum((end - start)[order])
+        self.run_offsets = np.searchsorted(rows, np.arange(len(pids) + 1))
+        # Total before each row's first segment, subtracted to restart the sum per row
+        before = np.concatenate(([0], self.run_done))[self.run_offsets[:-1]]
+        self.run_done -= np.repeat(before, np.diff(self.run_offsets))
+        # (row, end) as one sorted key, so every row is searched at once
+        self.run_span = self.timeline.makespan + 2
+        self.run_key = rows * self.run_span + self.run_end
+
+    def __len__(self):
+        """Number of frames, up to the end of the last segment."""
+        return self.timeline.makespan
+
+    def segment_at(self, t, lane=0):
+        """Return the index of the lane's segment running during [t, t + 1), or None if the core is idle."""
+        timeline = self.lanes[lane]
+        i = bisect_right(timeline.start, t) - 1
+        if i >= 0 and t < timeline.end[i]:
+            return i
+        return None
+
+    def running_at(self, t, lane=0):
+        i = self.segment_at(t, lane)
+        return None if i is None else self.lanes[lane].pid[i]
+
+    def cores_at(self, t):
+        """Return the running pid (or None) of every core during [t, t + 1)."""
+        return tuple(self.running_at(t, lane) for lane in range(len(self.lanes)))
+
+    def ready_at(self, t):
+        """Return the ready queue of frame ``t`` as rows in arrival order."""
+        running = set(self.cores_at(t))
+        return [row for row in self.by_arrival
+                if self.at[row] <= t < self.ct[row] and self.pid[row] not in running]
+
+    def executed_at(self, t):
+        """Return the CPU time every row has received by t + 1, and when each last ran (0 if not yet)."""
+        import numpy as np
+
+        n = len(self.pid)
+        if not len(self.run_key) or t < 0:
+            return [0] * n, [0] * n
+        # Last segment of each row that ended by t + 1
+        # Clamped so the key stays within the row's range (nothing runs after the makespan)
+        last = np.searchsorted(self.run_key, np.arange(n) * self.run_span + min(t + 1, self.run_span - 1),
+                               side="right") - 1
+        ran = last >= self.run_offsets[:-1]
+        executed = np.where(ran, self.run_done[last], 0).tolist()
+        last_end = np.where(ran, self.run_end[last], 0).tolist()
+
+        for lane, timeline in enumerate(self.lanes):
+            i = self.segment_at(t, lane)
+            if i is not None and timeline.end[i] > t + 1:
+                row = self.row[timeline.pid[i]]
+                executed[row] += t + 1 - timeline.start[i]
+                last_end[row] = t + 1
+        return executed, last_end
+
+
+class FrameCursor:
+    """Playback over a FrameIndex; ``frame(t)`` is cheap when t shortly follows the previous call."""
+
+    STEP_LIMIT = 256  # Frames stepped through one by one before seeking is cheaper
+
+    def __init__(self, index):
+        self.index = index
+        self.time = None
+        self.segments = [0] * len(index.lanes)  # First segment of each lane that has not ended by the current frame
+        self.arrived = 0  # Rows of index.by_arrival that have arrived
+        self.left = 0  # Rows of index.by_completion that have completed
+        self.ready = {}  # Row -> None for arrived, uncompleted rows, in arrival order
+        self.executed = [0] * len(index.pid)
+        self.completed = [False] * len(index.pid)
+        self.cores = (None,) * len(index.lanes)
+
+    def frame(self, t):
+        """Return frame ``t`` with the changes since the previous call."""
+        if self.time is None or not self.time < t <= self.time + self.STEP_LIMIT:
+            return self.seek(t)
+        if t == self.time + 1:
+            return self.step(t)
+
+        ready, progressed, completed = None, {}, []
+        for time in range(self.time + 1, t + 1):
+            frame = self.step(time)
+            if frame.ready is not None:
+                ready = frame.ready
+            for change in frame.progressed:
+                progressed[change[0]] = change
+            completed.extend(frame.completed)
+        return Frame(t, frame.running, ready, list(progressed.values()), completed, frame.cores)
+
+    def step(self, t):
+        self.time = t
+        index = self.index
+
+        changed = False
+        while self.arrived < len(index.by_arrival) and index.at[index.by_arrival[self.arrived]] <= t:
+            self.ready[index.by_arrival[self.arrived]] = None
+            self.arrived += 1
+            changed = True
+        completed = []
+        while self.left < len(index.by_completion) and index.ct[index.by_completion[self.left]] <= t:
+            row = index.by_completion[self.left]
+            self.ready.pop(row, None)
+            self.left += 1
+            changed = True
+            if index.bt[row] == 0 and not self.completed[row]:
+                self.completed[row] = True  # Never runs, see seek
+                completed.append(row)
+
+        cores = []
+        segments = self.segments
+        for lane, timeline in enumerate(index.lanes):
+            segment = segments[lane]
+            while segment < len(timeline) and timeline.end[segment] <= t:
+                segment += 1
+            segments[lane] = segment
+            cores.append(timeline.pid[segment] if segment < len(timeline) and timeline.start[segment] <= t else None)
+        cores = tuple(cores)
+        changed = changed or cores != self.cores
+        self.cores = cores
+
+        progressed = []
+        for running in cores:
+            if running is None:
+                continue
+            row = index.row[running]
+            self.executed[row] += 1
+            progressed.append((row, self.executed[row], t + 1))
+            if self.executed[row] >= index.bt[row] and not self.completed[row]:
+                self.completed[row] = True
+                completed.append(row)
+
+        return Frame(t, cores[0], self.ready_pids() if changed else None, progressed, completed, cores)
+
+    def seek(self, t):
+        """Jump to frame ``t``; every row is reported as progressed."""
+        index = self.index
+        self.time = t
+        self.cores = index.cores_at(t)
+        self.segments = [bisect_right(timeline.end, t) for timeline in index.lanes]
+        self.arrived = bisect_right(index.arrivals, t)
+        self.left = bisect_right(index.completions, t)
+        self.ready = {row: None for row in index.by_arrival[:self.arrived] if index.ct[row] > t}
+        self.executed, last_end = index.executed_at(t)
+
+        # A row without burst time has nothing to run, so it completes once its completion time is reached
+        completed = [row for row, done in enumerate(self.executed)
+                     if done >= index.bt[row] and (index.bt[row] or index.ct[row] <= t)]
+        self.completed = [False] * len(index.pid)
+        for row in completed:
+            self.completed[row] = True
+        progressed = list(zip(range(len(index.pid)), self.executed, last_end))
+        return Frame(t, self.cores[0], self.ready_pids(), progressed, completed, self.cores)
+
+    def ready_pids(self):
+        running = frozenset(self.index.row[pid] for pid in self.cores if pid is not None)
+        return ReadyQueue(self.index.pid, self.ready, running)
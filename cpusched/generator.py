@@ -0,0 +1,111 @@
+"""Seeded synthetic workload generator.
+
+Produces (pid, at, bt, priority) workloads in fixed-size NumPy chunks, so
+arbitrarily large workloads can be streamed to a scheduler or straight to a
+file without holding them in memory. Arrivals, bursts and priorities are
+drawn from independent random streams (one per kind of draw), so a given
+seed yields the same workload whatever the chunk size (up to float rounding
+of the arrival clock at chunk boundaries).
+"""
+import numpy as np
+
+ARRIVAL_MODELS = ("poisson", "bursty")
+BURST_MODELS = ("exponential", "pareto", "bimodal")
+PRIORITY_MODELS = ("uniform", "skewed")
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+class WorkloadGenerator:
+    """Configurable arrival, burst and priority models.
+
+    Arrivals:
+      - ``poisson``: exponential inter-arrival times at ``rate`` arrivals per time unit.
+      - ``bursty``: bursts of about ``burst_size`` arrivals at ``burst_rate`` per time
+        unit, separated by exponential gaps averaging ``idle_gap``.
+    Bursts (all rounded to integers of at least 1):
+      - ``exponential`` with mean ``mean_burst``.
+      - ``pareto`` with shape ``pareto_alpha`` scaled to mean ``mean_burst`` (heavy tail).
+      - ``bimodal``: exponential around ``short_burst`` or, with probability
+        ``long_fraction``, around ``long_burst``.
+    Priorities in ``0 .. levels - 1`` (lower number = higher priority):
+      - ``uniform`` over all levels.
+      - ``skewed``: Zipf-like with exponent ``skew``, most processes at the lowest
+        priority and few urgent ones.
+    """
+
+    def __init__(self, arrivals="poisson", bursts="exponential", priorities="uniform", seed=0,
+                 rate=0.09, burst_rate=1.0, burst_size=50, idle_gap=500.0,
+                 mean_burst=10.0, pareto_alpha=1.5, short_burst=3.0, long_burst=100.0, long_fraction=0.1,
+                 levels=10, skew=1.5):
+        if arrivals not in ARRIVAL_MODELS:
+            raise ValueError(f"unknown arrival model {arrivals!r}, choose from {', '.join(ARRIVAL_MODELS)}")
+        if bursts not in BURST_MODELS:
+            raise ValueError(f"unknown burst model {bursts!r}, choose from {', '.join(BURST_MODELS)}")
+        if priorities not in PRIORITY_MODELS:
+            raise ValueError(f"unknown priority model {priorities!r}, choose from {', '.join(PRIORITY_MODELS)}")
+        if pareto_alpha <= 1:
+            raise ValueError("pareto_alpha must be greater than 1 for the mean to exist")
+
+        self.arrivals = arrivals
+        self.bursts = bursts
+        self.priorities = priorities
+        self.seed = seed
+        self.rate = rate
+        self.burst_rate = burst_rate
+        self.burst_size = burst_size
+        self.idle_gap = idle_gap
+        self.mean_burst = mean_burst
+        self.pareto_alpha = pareto_alpha
+        self.short_burst = short_burst
+        self.long_burst = long_burst
+        self.long_fraction = long_fraction
+        self.levels = levels
+        self.skew = skew
+
+    def chunks(self, n, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (pid, at, bt, priority) int64 array tuples covering ``n`` processes."""
+        streams = [np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(5)]
+        arrival_rngs, burst_rngs, priority_rng = streams[0:2], streams[2:4], streams[4]
+        if self.priorities == "skewed":
+            weights = np.arange(self.levels, 0, -1, dtype=np.float64) ** -self.skew
+            priority_weights = weights / weights.sum()
+
+        clock = 0.0
+        for first in range(0, n, chunk_size):
+            size = min(chunk_size, n - first)
+            pid = np.arange(first + 1, first + size + 1, dtype=np.int64)
+
+            gaps = self.arrival_gaps(*arrival_rngs, size)
+            times = clock + np.cumsum(gaps)
+            clock = float(times[-1])
+            at = np.floor(times).astype(np.int64)
+
+            bt = np.maximum(1, np.rint(self.burst_times(*burst_rngs, size))).astype(np.int64)
+
+            if self.priorities == "uniform":
+                priority = priority_rng.integers(0, self.levels, size, dtype=np.int64)
+            else:
+                priority = priority_rng.choice(self.levels, size, p=priority_weights).astype(np.int64)
+
+            yield pid, at, bt, priority
+
+    def arrival_gaps(self, select_rng, rng, size):
+        if self.arrivals == "poisson":
+            return rng.exponential(1 / self.rate, size)
+        new_burst = select_rng.random(size) < 1 / self.burst_size
+        return rng.standard_exponential(size) * np.where(new_burst, self.idle_gap, 1 / self.burst_rate)
+
+    def burst_times(self, select_rng, rng, size):
+        if self.bursts == "exponential":
+            return rng.exponential(self.mean_burst, size)
+        if self.bursts == "pareto":
+            alpha = self.pareto_alpha
+            return (rng.pareto(alpha, size) + 1) * self.mean_burst * (alpha - 1) / alpha
+        is_long = select_rng.random(size) < self.long_fraction
+        return rng.standard_exponential(size) * np.where(is_long, self.long_burst, self.short_burst)
+
+    def processes(self, n, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield ``n`` (pid, at, bt, priority) tuples one at a time."""
+        for chunk in self.chunks(n, chunk_size):
+            yield from zip(*(column.tolist() for column in chunk))
@@ -0,0 +1,188 @@
+"""Streaming, mergeable percentile histograms of waiting, turnaround and response times.
+
+A ``Histogram`` counts non-negative integers in log-linear (HDR-style)
+buckets: values below ``2 * 10 ** significant_digits`` (rounded up to a
+power of two) are counted exactly, and larger values in buckets no wider than
+that share of their magnitude. Memory grows with the logarithm of the largest
+value recorded, not with the number of values, and histograms of separate
+runs add up bucket by bucket, so percentiles of any number of processes
+can be gathered in parallel and merged.
+"""
+from array import array
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class Histogram:
+    """Counts of non-negative integers, to ``significant_digits`` decimal digits of precision."""
+
+    __slots__ = ("significant_digits", "sub_bits", "counts", "total", "sum", "min", "max")
+
+    def __init__(self, significant_digits=3):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        # Values below 2 ** sub_bits are exact; each power of two above it is split into 2 ** (sub_bits - 1) buckets
+        self.sub_bits = (2 * 10 ** significant_digits - 1).bit_length()
+        self.counts = array("q")
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.total
+
+    def index(self, value):
+        shift = value.bit_length() - self.sub_bits
+        if shift <= 0:
+            return value
+        return (shift << (self.sub_bits - 1)) + (value >> shift)
+
+    def highest_equivalent(self, index):
+        """Return the largest value counted in bucket ``index``."""
+        half = 1 << (self.sub_bits - 1)
+        shift = index // half - 1
+        if shift <= 0:
+            return index
+        return ((index - shift * half + 1) << shift) - 1
+
+    def record(self, value, count=1):
+        value = int(value)
+        if value < 0:
+            raise ValueError("histogram values must be non-negative")
+        index = self.index(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += count
+        self.total += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_array(self, values):
+        """Record every value of an integer sequence or NumPy array at once."""
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.int64)
+        if not len(values):
+            return
+        low, high = int(values.min()), int(values.max())
+        if low < 0:
+            raise ValueError("histogram values must be non-negative")
+        # Bit lengths from the float exponent, one too long for values that round up to a power of two
+        shift = np.maximum(np.frexp(values.astype(np.float64))[1] - self.sub_bits, 0)
+        shift -= (shift > 0) & ((values >> shift) < (1 << (self.sub_bits - 1)))
+        indices = np.where(shift > 0, (shift << (self.sub_bits - 1)) + (values >> shift), values)
+        self.add_counts(np.bincount(indices))
+        self.total += len(values)
+        self.sum += (int((values >> 32).sum()) << 32) + int((values & 0xFFFFFFFF).sum())  # Without overflow
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def add_counts(self, counts):
+        import numpy as np
+
+        if len(counts) > len(self.counts):
+            self.counts.extend([0] * (len(counts) - len(self.counts)))
+        view = np.frombuffer(self.counts, dtype=np.int64)
+        view[:len(counts)] += counts
+        del view  # Releases the buffer so the array can grow again
+
+    def merge(self, other):
+        """Add the counts of ``other`` (same precision) to this histogram and return it."""
+        import numpy as np
+
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("only histograms of the same precision can be merged")
+        if other.total:
+            self.add_counts(np.frombuffer(other.counts, dtype=np.int64))
+            self.total += other.total
+            self.sum += other.sum
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    __iadd__ = merge
+
+    @property
+    def mean(self):
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, percentile):
+        """Return the value at ``percentile`` (0 to 100): at least that share of the values is no larger."""
+        return self.percentiles((percentile,))[f"p{percentile:g}"]
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Return {"p50": value, ...} for each of ``percentiles``; 0 when nothing was recorded."""
+        from fractions import Fraction
+
+        import numpy as np
+
+        if not self.total:
+            return {f"p{percentile:g}": 0 for percentile in percentiles}
+        cumulative = np.cumsum(np.frombuffer(self.counts, dtype=np.int64))
+        result = {}
+        for percentile in percentiles:
+            rank = max(1, -(-self.total * Fraction(str(percentile)) // 100))  # Exact, e.g. for 99.9
+            index = int(np.searchsorted(cumulative, rank))
+            result[f"p{percentile:g}"] = min(self.highest_equivalent(index), self.max)
+        return result
+
+    def as_dict(self):
+        return {"count": self.total, "min": self.min or 0, "max": self.max or 0, "mean": self.mean,
+                **self.percentiles()}
+
+
+class LatencyHistograms:
+    """Waiting, turnaround and response time histograms of one or more schedules.
+
+    Fed one completed process at a time with ``record`` (see
+    ``tracing.LatencyTracer``) or a whole schedule at a time with
+    ``record_metrics``; histograms of the same precision merge.
+    """
+
+    __slots__ = ("wt", "tat", "response")
+
+    def __init__(self, significant_digits=3):
+        self.wt = Histogram(significant_digits)
+        self.tat = Histogram(significant_digits)
+        self.response = Histogram(significant_digits)
+
+    @classmethod
+    def from_metrics(cls, metrics, mask=None, significant_digits=3):
+        """Return the histograms of a ScheduleMetrics, optionally only of the rows selected by a boolean mask."""
+        histograms = cls(significant_digits)
+        histograms.record_metrics(metrics, mask)
+        return histograms
+
+    def __len__(self):
+        return self.wt.total
+
+    def record(self, wt, tat, response):
+        self.wt.record(wt)
+        self.tat.record(tat)
+        self.response.record(response)
+
+    def record_metrics(self, metrics, mask=None):
+        wt, tat, response = metrics.wt, metrics.tat, metrics.response
+        if mask is not None:
+            wt, tat, response = wt[mask], tat[mask], response[mask]
+        self.wt.record_array(wt)
+        self.tat.record_array(tat)
+        self.response.record_array(response)
+
+    def merge(self, other):
+        self.wt.merge(other.wt)
+        self.tat.merge(other.tat)
+        self.response.merge(other.response)
+        return self
+
+    __iadd__ = merge
+
+    def percentiles(self, percentiles=PERCENTILES):
+        return {"wt": self.wt.percentiles(percentiles), "tat": self.tat.percentiles(percentiles),
+                "response": self.response.percentiles(percentiles)}
+
+    def as_dict(self):
+        return {"wt": self.wt.as_dict(), "tat": self.tat.as_dict(), "response": self.response.as_dict()}
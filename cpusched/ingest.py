@@ -0,0 +1,269 @@
+"""Streaming import of real scheduler traces as (pid, at, bt, priority) workloads.
+
+Traces are read one line at a time, so memory grows with the number of
+tasks that are runnable at once, not with the size of the file:
+
+- ``sched``: text dumps of the sched_switch and sched_wakeup tracepoints, as
+  printed by ``perf script``, ``perf sched script`` or ftrace's ``trace``
+  file. Each CPU burst of a task, from its wakeup (or first time on a CPU)
+  until it blocks or exits, becomes one process: it arrives at the wakeup,
+  its burst time is the CPU time it got before blocking (preemptions do not
+  end a burst) and its priority is the kernel priority minus 120, which is
+  the nice value of normal tasks. The idle task (pid 0) is left out.
+- ``csv``: cluster-trace-style CSV whose header names a start time, a
+  duration (or an end time) and optionally a priority column; each row is
+  one process. Rows with an empty start or duration are skipped.
+
+Timestamps are normalized to integer time units: ``tick`` is the length of
+one time unit in the trace's own unit (seconds for sched dumps), counted
+from ``origin``: by default the first timestamp of a sched dump, which is
+in time order, and 0 for a CSV, whose rows need not be sorted by start
+time. Instants round down and durations to the nearest unit. Processes are numbered 1, 2, ... in the
+order they are emitted, which for sched dumps is when their bursts end.
+"""
+import csv
+import re
+from decimal import Decimal
+from itertools import islice
+from time import perf_counter
+
+FORMATS = ("sched", "csv")
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# "<comm>-<tid> [<cpu>] <flags> <seconds>.<fraction>: [sched:]<event>: <fields>" (ftrace and perf script alike)
+# perf script pads event names to the longest one recorded, so any run of spaces may precede them
+EVENT = re.compile(r" (\d+)\.(\d+):\s+(?:sched:)?(sched_switch|sched_wakeup_new|sched_wakeup): ")
+SWITCH = re.compile(r"prev_pid=(\d+) prev_prio=(-?\d+) prev_state=(\S+) ==> .*next_pid=(\d+) next_prio=(-?\d+)")
+WAKEUP = re.compile(r"\bpid=(\d+) prio=(-?\d+)")
+# perf's compact forms: "<comm>:<pid> [<prio>] <state> ==> <comm>:<pid> [<prio>]" and "<comm>:<pid> [<prio>] ..."
+COMPACT_SWITCH = re.compile(r":(\d+) \[(-?\d+)\] (\S+) ==> .*:(\d+) \[(-?\d+)\]")
+COMPACT_WAKEUP = re.compile(r":(\d+) \[(-?\d+)\]")
+NICE_0_PRIO = 120  # Kernel priority of a nice 0 task
+FRACTION_SCALE = tuple(10 ** (9 - digits) for digits in range(10))  # Nanoseconds per unit of the last digit
+
+# Header names recognized for each column of a cluster CSV, in order of preference
+CSV_COLUMNS = {
+    "start": ("start_time", "start", "submit_time", "arrival_time", "timestamp", "time"),
+    "duration": ("duration", "runtime", "run_time", "cpu_time"),
+    "end": ("end_time", "end", "finish_time"),
+    "priority": ("priority", "prio", "nice"),
+}
+
+
+class TraceStats:
+    """Size of a parsed trace and how fast it was parsed."""
+
+    __slots__ = ("lines", "bytes", "events", "processes", "skipped", "seconds")
+
+    def __init__(self):
+        self.lines = 0
+        self.bytes = 0
+        self.events = 0  # Scheduler events (sched) or rows (csv) used
+        self.processes = 0
+        self.skipped = 0  # CSV rows without a start or duration, or sched event lines that did not parse
+        self.seconds = 0.0  # Spent parsing, not consuming the processes
+
+    @property
+    def lines_per_second(self):
+        return self.lines / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {"lines": self.lines, "bytes": self.bytes, "events": self.events, "processes": self.processes,
+                "skipped": self.skipped, "seconds": self.seconds, "lines_per_second": self.lines_per_second,
+                "megabytes_per_second": self.megabytes_per_second}
+
+    def __str__(self):
+        skipped = f", {self.skipped} lines skipped" if self.skipped else ""
+        return (f"{self.lines} lines ({self.bytes / 1e6:.1f} MB, {self.events} events{skipped}) into "
+                f"{self.processes} processes in {self.seconds:.2f} s: {self.lines_per_second:,.0f} lines/s, "
+                f"{self.megabytes_per_second:.1f} MB/s")
+
+
+def to_nanoseconds(seconds):
+    """Return a number of seconds as exact integer nanoseconds (0.001 is 1000000, not 999999)."""
+    return int(Decimal(str(seconds)) * 10 ** 9)
+
+
+def iter_sched_trace(lines, tick=0.001, origin=None, stats=None):
+    """Yield (pid, at, bt, priority) tuples, one per CPU burst of a perf or ftrace sched dump.
+
+    ``tick`` and ``origin`` are in seconds; see the module docstring.
+    """
+    tick_ns = to_nanoseconds(tick)
+    if tick_ns < 1:
+        raise ValueError("tick must be at least one nanosecond")
+    origin_ns = None if origin is None else to_nanoseconds(origin)
+    stats = TraceStats() if stats is None else stats
+    bursts = {}  # tid -> [start, CPU time so far, on a CPU since (None if not), priority], in nanoseconds
+    count = 0
+
+    def finish(burst, line_no):
+        nonlocal count
+        start, cpu, _, priority = burst
+        if start < origin_ns:
+            raise ValueError(f"line {line_no}: timestamp before the origin; pass an earlier origin")
+        count += 1
+        return count, (start - origin_ns) // tick_ns, (cpu + tick_ns // 2) // tick_ns, priority
+
+    line_no = events = skipped = 0
+    for line_no, line in enumerate(lines, start=1):
+        if "sched_" not in line:
+            continue
+        match = EVENT.search(line)
+        if match is None:
+            if "sched_switch" in line or "sched_wakeup" in line:
+                skipped += 1  # Looks like an event, but not in a layout this parser knows
+            continue
+        seconds, fraction, event = match.groups()
+        fields = match.end()
+        now = int(seconds + fraction[:9]) * FRACTION_SCALE[min(len(fraction), 9)]
+        if origin_ns is None:
+            origin_ns = now
+        events += 1
+
+        if event != "sched_switch":
+            match = WAKEUP.search(line, fields) or COMPACT_WAKEUP.search(line, fields)
+            if match is None:
+                raise ValueError(f"line {line_no}: unrecognized {event} fields {line[fields:].strip()!r}")
+            pid = int(match.group(1))
+            if pid and pid not in bursts:
+                bursts[pid] = [now, 0, None, int(match.group(2)) - NICE_0_PRIO]
+            continue
+
+        match = SWITCH.search(line, fields) or COMPACT_SWITCH.search(line, fields)
+        if match is None:
+            raise ValueError(f"line {line_no}: unrecognized sched_switch fields {line[fields:].strip()!r}")
+        prev_pid, prev_prio, prev_state, next_pid, next_prio = match.groups()
+        if prev_pid != "0":
+            prev_pid = int(prev_pid)
+            burst = bursts.get(prev_pid)
+            if burst is None:
+                # Running when the trace began
+                burst = bursts[prev_pid] = [origin_ns, 0, origin_ns, int(prev_prio) - NICE_0_PRIO]
+            if burst[2] is not None:
+                burst[1] += now - burst[2]
+                burst[2] = None
+            if prev_state[0] != "R":  # Blocked or exited, rather than preempted
+                del bursts[prev_pid]
+                yield finish(burst, line_no)
+        if next_pid != "0":
+            next_pid = int(next_pid)
+            burst = bursts.get(next_pid)
+            if burst is None:
+                burst = bursts[next_pid] = [now, 0, None, int(next_prio) - NICE_0_PRIO]
+            burst[2] = now
+
+    stats.lines += line_no
+    stats.events += events
+    stats.skipped += skipped
+    # Bursts still open when the trace ends run until its last event
+    for burst in bursts.values():
+        if burst[2] is not None:
+            burst[1] += now - burst[2]
+        yield finish(burst, line_no)
+
+
+def find_column(header, names, option):
+    if option is not None:
+        if option.lower() not in header:
+            raise ValueError(f"header has no column {option!r}")
+        return header.index(option.lower())
+    for name in names:
+        if name in header:
+            return header.index(name)
+    return None
+
+
+def iter_cluster_csv(lines, tick=1, origin=0, stats=None, start=None, duration=None, end=None, priority=None):
+    """Yield (pid, at, bt, priority) tuples, one per row of a cluster-trace CSV.
+
+    ``start``, ``duration``, ``end`` and ``priority`` name the columns to use
+    (by default the first of ``CSV_COLUMNS`` present in the header); the
+    burst time is ``duration``, or ``end`` minus ``start`` without one.
+    ``tick`` and ``origin`` are in the trace's time unit. Blank lines and
+    lines starting with '#' are ignored.
+    """
+    if tick <= 0:
+        raise ValueError("tick must be positive")
+    stats = TraceStats() if stats is None else stats
+    header = None
+    count = line_no = 0
+    for line_no, row in enumerate(csv.reader(lines), start=1):
+        if not row or row[0].lstrip().startswith("#"):
+            continue
+        if header is None:
+            header = [field.strip().lower() for field in row]
+            start_column = find_column(header, CSV_COLUMNS["start"], start)
+            duration_column = find_column(header, CSV_COLUMNS["duration"], duration)
+            end_column = None if duration_column is not None else find_column(header, CSV_COLUMNS["end"], end)
+            priority_column = find_column(header, CSV_COLUMNS["priority"], priority)
+            if start_column is None or duration_column is None and end_column is None:
+                raise ValueError(f"line {line_no}: header needs a start column and a duration or end column")
+            continue
+
+        try:
+            start_time = row[start_column].strip()
+            length = row[duration_column if duration_column is not None else end_column].strip()
+            if not start_time or not length:
+                stats.skipped += 1
+                continue
+            start_time = float(start_time)
+            length = float(length) if duration_column is not None else float(length) - start_time
+            value = row[priority_column].strip() if priority_column is not None else ""
+            level = int(float(value)) if value else 0
+        except (IndexError, ValueError):
+            raise ValueError(f"line {line_no}: expected numeric start, duration or end and priority, got {row!r}")
+        if start_time < origin:
+            raise ValueError(f"line {line_no}: start time before the origin; pass an earlier origin")
+        if length < 0:
+            raise ValueError(f"line {line_no}: durations must be non-negative")
+        stats.events += 1
+        count += 1
+        yield count, int((start_time - origin) // tick), int(length / tick + 0.5), level
+    stats.lines += line_no
+
+
+def timed(processes, stats):
+    """Pass processes through, adding the time spent producing them (not consuming them) to ``stats``."""
+    began = perf_counter()
+    for process in processes:
+        stats.seconds += perf_counter() - began
+        stats.processes += 1
+        yield process
+        began = perf_counter()
+    stats.seconds += perf_counter() - began
+
+
+def guess_format(path):
+    return "csv" if path.lower().endswith(".csv") else "sched"
+
+
+def iter_trace(path, format=None, stats=None, **options):
+    """Yield (pid, at, bt, priority) tuples from a trace file, read incrementally.
+
+    ``format`` is one of ``FORMATS`` (by default csv for .csv files and sched
+    otherwise); ``options`` go to ``iter_sched_trace`` or ``iter_cluster_csv``
+    and ``stats``, a TraceStats, is filled in once the file has been read.
+    """
+    format = format or guess_format(path)
+    if format not in FORMATS:
+        raise ValueError(f"unknown trace format {format!r}, choose from {', '.join(FORMATS)}")
+    stats = TraceStats() if stats is None else stats
+    parse = iter_cluster_csv if format == "csv" else iter_sched_trace
+    with open(path, newline="", errors="replace", buffering=1024 * 1024) as f:
+        yield from timed(parse(f, stats=stats, **options), stats)
+        stats.bytes += f.buffer.tell()
+
+
+def chunks(processes, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Group (pid, at, bt, priority) tuples into column chunks, as ``workload.write_chunks`` takes them."""
+    processes = iter(processes)
+    while True:
+        rows = list(islice(processes, chunk_size))
+        if not rows:
+            return
+        yield tuple(zip(*rows))
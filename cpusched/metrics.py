@@ -0,0 +1,224 @@
+from itertools import chain, islice
+
+from cpusched.histogram import LatencyHistograms
+from cpusched.timeline import Timeline
+
+
+def calculate_turnaround_time(at, ct):
+    return ct - at
+
+
+def calculate_waiting_time(tat, bt):
+    return tat - bt
+
+
+class ScheduleMetrics:
+    """Per-process CT, TAT and WT arrays, in input order, plus schedule-wide summaries.
+
+    ``first_start`` is when each process was first dispatched (its arrival if
+    it never was); ``busy_time``, ``context_switches`` and ``preemptions``
+    count over the whole timeline. ``compute_metrics`` fills them all in.
+    """
+
+    def __init__(self, pid, at, bt, ct, first_start=None, busy_time=0, context_switches=0, preemptions=0):
+        self.pid = pid
+        self.at = at
+        self.bt = bt
+        self.ct = ct
+        self.tat = calculate_turnaround_time(at, ct)
+        self.wt = calculate_waiting_time(self.tat, bt)
+        self.makespan = int(ct.max()) if len(ct) else 0
+        self.first_start = at if first_start is None else first_start
+        self.response = self.first_start - at
+        self.busy_time = busy_time
+        self.context_switches = context_switches
+        self.preemptions = preemptions
+
+    def __len__(self):
+        return len(self.pid)
+
+    def averages(self, mask=None):
+        """Return (average WT, average TAT), optionally only over the processes selected by a boolean mask."""
+        wt, tat = self.wt, self.tat
+        if mask is not None:
+            wt, tat = wt[mask], tat[mask]
+        if not len(wt):
+            return 0.0, 0.0
+        return float(wt.mean()), float(tat.mean())
+
+    def summary(self):
+        avg_wt, avg_tat = self.averages()
+        return {
+            "average_waiting_time": avg_wt,
+            "average_turnaround_time": avg_tat,
+            "total_execution_time": self.makespan,
+        }
+
+
+class PerformanceMetrics:
+    """Capacity figures of a finished schedule, derived from its ScheduleMetrics.
+
+    Utilization and idle time cover [0, makespan) on every core. Throughput
+    is completions per time unit, overall and at its peak over any
+    ``throughput_window`` time units (a tenth of the makespan by default);
+    ``window_completions`` counts the completions in consecutive windows
+    (0, w], (w, 2w], ... ``latency`` holds the waiting, turnaround and
+    response time histograms that the percentiles are read from.
+    """
+
+    def __init__(self, metrics, context_switches=None, cores=1, core_busy=None, window=None):
+        import numpy as np
+
+        makespan = metrics.makespan
+        self.cores = cores
+        self.makespan = makespan
+        self.busy_time = metrics.busy_time
+        self.idle_time = cores * makespan - self.busy_time
+        self.utilization = self.busy_time / (cores * makespan) if makespan else 0.0
+        core_busy = [self.busy_time] if core_busy is None else core_busy
+        self.core_utilization = [busy / makespan if makespan else 0.0 for busy in core_busy]
+
+        window = window or max(1, -(-makespan // 10))
+        ct = np.sort(metrics.ct)
+        self.throughput = len(ct) / makespan if makespan else 0.0
+        self.throughput_window = window
+        # Most completions in any (t - window, t], found with each completion as t
+        peak = np.arange(1, len(ct) + 1) - np.searchsorted(ct, ct - window, side="right")
+        self.peak_throughput = int(peak.max()) / window if len(ct) else 0.0
+        windows = -(-makespan // window)
+        self.window_completions = np.bincount(np.maximum(ct - 1, 0) // window, minlength=windows).tolist()
+
+        self.average_response_time = float(metrics.response.mean()) if len(ct) else 0.0
+        self.max_response_time = int(metrics.response.max()) if len(ct) else 0
+        self.context_switches = metrics.context_switches if context_switches is None else context_switches
+        self.preemptions = metrics.preemptions
+        self.max_waiting_time = int(metrics.wt.max()) if len(ct) else 0
+        self.waiting_time_variance = float(metrics.wt.var()) if len(ct) else 0.0
+        self.latency = LatencyHistograms.from_metrics(metrics)
+
+    def as_dict(self):
+        return {
+            "cores": self.cores,
+            "busy_time": self.busy_time,
+            "idle_time": self.idle_time,
+            "utilization": self.utilization,
+            "core_utilization": self.core_utilization,
+            "throughput": self.throughput,
+            "throughput_window": self.throughput_window,
+            "peak_throughput": self.peak_throughput,
+            "window_completions": self.window_completions,
+            "average_response_time": self.average_response_time,
+            "max_response_time": self.max_response_time,
+            "context_switches": self.context_switches,
+            "preemptions": self.preemptions,
+            "max_waiting_time": self.max_waiting_time,
+            "waiting_time_variance": self.waiting_time_variance,
+            "percentiles": self.latency.percentiles(),
+        }
+
+
+SEGMENT_CHUNK = 65536
+
+
+def compute_metrics(timeline, pid, at, bt):
+    """Compute CT/TAT/WT for every process from a timeline of (pid, start, end) segments.
+
+    ``timeline`` is a ``Timeline`` (read in place through its NumPy views), a
+    list or array of segments, or any iterable such as a scheduler's
+    ``iter_timeline()``, which is consumed in fixed-size chunks so memory does
+    not grow with the number of segments. ``pid``, ``at`` and
+    ``bt`` are parallel sequences or arrays describing the processes. CT is
+    the end of a process's last segment; a process that never appears in the
+    timeline completes at its arrival time. The same pass records each
+    process's first dispatch, the busy time, the context switches (as
+    ``count_context_switches``) and the preemptions: non-empty segments
+    other than each process's last, since a timeline merges back-to-back runs.
+    """
+    import numpy as np
+
+    pid = np.asarray(pid, dtype=np.int64)
+    at = np.asarray(at, dtype=np.int64)
+    bt = np.asarray(bt, dtype=np.int64)
+    ct = at.copy()
+    never = np.iinfo(np.int64).max
+    first_start = np.full(len(pid), never, dtype=np.int64)
+    ran = np.zeros(len(pid), dtype=bool)
+    busy_time = switches = segments = 0
+    last_pid = None  # Of the previous chunk, for switches across chunk boundaries
+
+    for segment_pid, segment_start, segment_end in segment_chunks(timeline):
+        if not len(pid):
+            raise ValueError("timeline contains a pid that is not in the process list")
+        rows = segment_rows(pid, segment_pid)
+        np.maximum.at(ct, rows, segment_end)
+        np.minimum.at(first_start, rows, segment_start)
+        length = segment_end - segment_start
+        busy_time += int(length.sum())
+        nonempty = length > 0
+        segments += int(np.count_nonzero(nonempty))
+        ran[rows[nonempty]] = True
+        switches += int(np.count_nonzero(segment_pid[1:] != segment_pid[:-1]))
+        if last_pid is not None and last_pid != segment_pid[0]:
+            switches += 1
+        last_pid = segment_pid[-1]
+
+    first_start = np.where(first_start == never, at, first_start)
+    return ScheduleMetrics(pid, at, bt, ct, first_start, busy_time, switches, segments - int(np.count_nonzero(ran)))
+
+
+def count_context_switches(timeline):
+    """Count the dispatches that hand the CPU to a different process than the previous segment's."""
+    import numpy as np
+
+    if not isinstance(timeline, Timeline):
+        timeline = Timeline(timeline)
+    pid = timeline.arrays()[0]
+    return int(np.count_nonzero(pid[1:] != pid[:-1]))
+
+
+def segment_chunks(timeline):
+    """Yield non-empty (pid, start, end) int64 columns from a Timeline, sequence, array or iterable."""
+    import numpy as np
+
+    if isinstance(timeline, Timeline):
+        if len(timeline):
+            yield timeline.arrays()  # Zero-copy views
+        return
+
+    if isinstance(timeline, (list, tuple, np.ndarray)):
+        segments = np.asarray(timeline, dtype=np.int64).reshape(-1, 3)
+        if len(segments):
+            yield segments[:, 0], segments[:, 1], segments[:, 2]
+        return
+
+    flat = chain.from_iterable(timeline)
+    while True:
+        segments = np.fromiter(islice(flat, 3 * SEGMENT_CHUNK), dtype=np.int64).reshape(-1, 3)
+        if not len(segments):
+            return
+        yield segments[:, 0], segments[:, 1], segments[:, 2]
+
+
+def segment_rows(pid, segment_pid):
+    """Map each segment's pid to the row of that process in ``pid``."""
+    import numpy as np
+
+    low, high = int(pid.min()), int(pid.max())
+    if high - low < 4 * len(pid) + 1024:
+        # Compact pid range (the usual 1..n): direct lookup table
+        lookup = np.full(high - low + 1, -1, dtype=np.int64)
+        lookup[pid - low] = np.arange(len(pid))
+        offsets = segment_pid - low
+        valid = (offsets >= 0) & (offsets < len(lookup))
+        rows = lookup[np.where(valid, offsets, 0)]
+        if not valid.all() or (rows < 0).any():
+            raise ValueError("timeline contains a pid that is not in the process list")
+        return rows
+
+    order = np.argsort(pid, kind="stable")
+    sorted_pid = pid[order]
+    slots = np.searchsorted(sorted_pid, segment_pid)
+    slots[slots == len(pid)] = 0
+    if not np.array_equal(sorted_pid[slots], segment_pid):
+        raise ValueError("timeline contains a pid that is not in the process list")
+    return order[slots]
@@ -0,0 +1,151 @@
+import heapq
+
+from cpusched.cache import Cacheable
+from cpusched.process import ProcessTable
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE, PREEMPT
+
+
+class PriorityScheduling(Cacheable):
+    about = {
+        "preemptive": (
+            "Priority Scheduling (Preemptive):\n\n"
+            "In preemptive Priority Scheduling, each process is assigned a priority (lower number indicates higher priority), "
+            "and the CPU is allocated to the highest-priority process that has arrived. If a higher-priority process arrives, "
+            "the current process is preempted, and the new process takes over. This ensures critical tasks are handled promptly but "
+            "may cause starvation for low-priority processes if high-priority processes keep arriving."
+        ),
+        "non_preemptive": (
+            "Priority Scheduling (Non-Preemptive):\n\n"
+            "In non-preemptive Priority Scheduling, the CPU is allocated to the highest-priority process among those that have "
+            "arrived, and it runs to completion without interruption. Priorities are represented by numbers, with lower numbers "
+            "indicating higher priority. This algorithm prioritizes important tasks but may lead to longer waiting times for "
+            "low-priority processes."
+        )
+    }
+
+    algorithm = "priority"
+    uses_priority = True
+
+    def __init__(self, processes, is_preemptive, tracer=None):
+        self.processes = processes  # (pid, at, bt, priority) tuples or Process records
+        self.is_preemptive = is_preemptive
+        self.tracer = tracer
+        self.timeline = Timeline()
+
+    def add_to_ready_queue(self, processes, current_time, index, ready_queue):
+        at = processes.at
+        while index < len(at) and at[index] <= current_time:
+            # Lower priority number = higher priority, earlier arrival (lower index) breaks ties
+            heapq.heappush(ready_queue, (processes.priority[index], index))
+            if self.tracer is not None:
+                self.tracer.emit(ARRIVAL, at[index], processes.pid[index])
+            index += 1
+        return index
+
+    def iter_preemptive(self, processes):
+        pids, arrivals, remaining = processes.pid, processes.at, processes.remaining
+        current_time = 0
+        n = len(processes)
+        index = 0
+        ready_queue = []  # Min-heap of (priority, i)
+        running = None  # i of the process holding the CPU, if it has not completed
+        segment_start = 0  # Start of the running process's current segment
+        tracer = self.tracer
+
+        while index < n or ready_queue:
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if not ready_queue:
+                # CPU is idle, jump to the next arrival
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = arrivals[index]
+                continue
+
+            i = ready_queue[0][1]
+            current_pid = pids[i]
+
+            # Skip processes with zero burst time
+            if processes.bt[i] == 0:
+                remaining[i] = 0
+                heapq.heappop(ready_queue)
+                if tracer is not None:
+                    tracer.emit(COMPLETE, current_time, current_pid)
+                continue
+
+            # Back-to-back runs of the same process form a single segment, which is
+            # final once the process is preempted or completes
+            if i != running:
+                if running is not None:
+                    if tracer is not None:
+                        tracer.emit(PREEMPT, current_time, pids[running])
+                    yield (pids[running], segment_start, current_time)
+                if tracer is not None:
+                    tracer.emit(DISPATCH, current_time, current_pid)
+                segment_start = current_time
+
+            # Priorities never change, so the selected process keeps the CPU until
+            # it finishes or the next process arrives
+            start_time = current_time
+            current_time += remaining[i]
+            if index < n and arrivals[index] < current_time:
+                current_time = arrivals[index]
+            remaining[i] -= current_time - start_time
+
+            if remaining[i] == 0:  # Process completed
+                heapq.heappop(ready_queue)
+                if tracer is not None:
+                    tracer.emit(COMPLETE, current_time, current_pid)
+                running = None
+                yield (current_pid, segment_start, current_time)
+            else:
+                running = i
+
+    def iter_non_preemptive(self, processes):
+        current_time = 0
+        n = len(processes)
+        index = 0
+        ready_queue = []  # Min-heap of (priority, i)
+        tracer = self.tracer
+
+        while index < n or ready_queue:
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if not ready_queue:
+                # CPU is idle, jump to the next arrival
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = processes.at[index]
+                continue
+
+            _, i = heapq.heappop(ready_queue)
+            current_pid = processes.pid[i]
+
+            # Execute the process to completion (zero burst time gives an empty segment)
+            start_time = current_time
+            current_time += processes.remaining[i]
+            processes.remaining[i] = 0
+
+            if tracer is not None:
+                tracer.emit(DISPATCH, start_time, current_pid)
+                tracer.emit(COMPLETE, current_time, current_pid)
+
+            yield (current_pid, start_time, current_time)
+
+    def iter_timeline(self):
+        """Yield (pid, start, end) segments as soon as each one is final."""
+        # Records in arrival order; a record's index breaks priority ties
+        processes = ProcessTable(self.processes)
+
+        if self.is_preemptive:
+            return self.iter_preemptive(processes)
+        else:
+            return self.iter_non_preemptive(processes)
+
+    def calculate_completion_time(self):
+        self.timeline = Timeline(self.iter_timeline())
+        return self.timeline
+
+    def cache_params(self):
+        return {"preemptive": bool(self.is_preemptive)}
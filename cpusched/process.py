@@ -0,0 +1,81 @@
+from operator import itemgetter
+
+
+class Process:
+    """Mutable scheduling state of one process; ``remaining`` is the burst time still to run."""
+
+    __slots__ = ("pid", "at", "bt", "priority", "remaining")
+
+    def __init__(self, pid, at, bt, priority=0):
+        self.pid = pid
+        self.at = at
+        self.bt = bt
+        self.priority = priority
+        self.remaining = bt
+
+    def __repr__(self):
+        return (f"Process(pid={self.pid}, at={self.at}, bt={self.bt}, priority={self.priority}, "
+                f"remaining={self.remaining})")
+
+    def as_tuple(self):
+        return self.pid, self.at, self.bt, self.priority
+
+
+class ProcessTable:
+    """Array-backed process records in arrival order (ties keep input order).
+
+    Record ``i`` is spread over ``pid[i]``, ``at[i]``, ``bt[i]``, ``priority[i]``
+    and ``remaining[i]``, so the engines' hot loops update plain list slots
+    instead of allocating objects or rebuilding tuples. Engines use ``i`` to
+    break ties in favour of earlier arrivals. Built from (pid, at, bt[, priority])
+    tuples or Process records, which are never modified; processes whose pid
+    is in ``exclude`` are left out.
+    """
+
+    __slots__ = ("pid", "at", "bt", "priority", "remaining")
+
+    def __init__(self, processes, exclude=()):
+        if processes and isinstance(processes[0], Process):
+            processes = [process.as_tuple() for process in processes]
+        if exclude:
+            processes = [row for row in processes if row[0] not in exclude]
+        rows = sorted(processes, key=itemgetter(1))
+        self.pid = [row[0] for row in rows]
+        self.at = [row[1] for row in rows]
+        self.bt = [row[2] for row in rows]
+        self.priority = [row[3] for row in rows] if rows and len(rows[0]) > 3 else [0] * len(rows)
+        self.remaining = list(self.bt)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, i):
+        """Return record ``i`` as a Process snapshot."""
+        process = Process(self.pid[i], self.at[i], self.bt[i], self.priority[i])
+        process.remaining = self.remaining[i]
+        return process
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+
+def earliest_change(old, new):
+    """Return the earliest old or new arrival time of a process that differs between two workloads.
+
+    ``old`` and ``new`` list the same processes in the same order, as
+    (pid, at, bt[, priority]) tuples or Process records. Returns None if
+    nothing changed. No scheduling decision made before this time depends on
+    the edit.
+    """
+    if len(old) != len(new):
+        raise ValueError("workloads must list the same processes")
+    since = None
+    for old_row, new_row in zip(old, new):
+        old_row = old_row.as_tuple() if isinstance(old_row, Process) else tuple(old_row)
+        new_row = new_row.as_tuple() if isinstance(new_row, Process) else tuple(new_row)
+        if old_row != new_row:
+            if old_row[0] != new_row[0]:
+                raise ValueError("workloads must list the same processes")
+            changed = min(old_row[1], new_row[1])
+            since = changed if since is None else min(since, changed)
+    return since
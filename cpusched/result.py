@@ -0,0 +1,66 @@
+from collections import namedtuple
+
+from cpusched.metrics import PerformanceMetrics, compute_metrics
+from cpusched.process import Process
+
+ProcessMetrics = namedtuple("ProcessMetrics", ["pid", "at", "bt", "ct", "tat", "wt"])
+
+
+class ScheduleResult:
+    """A finished schedule: its Timeline, per-process metrics and summary statistics."""
+
+    __slots__ = ("timeline", "metrics")
+
+    def __init__(self, timeline, metrics):
+        self.timeline = timeline
+        self.metrics = metrics  # ScheduleMetrics, rows in input order
+
+    @classmethod
+    def from_timeline(cls, timeline, processes):
+        """Compute the metrics of ``timeline`` for (pid, at, bt[, priority]) tuples or Process records."""
+        rows = [row.as_tuple() if isinstance(row, Process) else row for row in processes]
+        metrics = compute_metrics(
+            timeline,
+            [row[0] for row in rows],
+            [row[1] for row in rows],
+            [row[2] for row in rows],
+        )
+        return cls(timeline, metrics)
+
+    def __len__(self):
+        return len(self.metrics)
+
+    def __iter__(self):
+        """Yield a ProcessMetrics row per process in input order."""
+        metrics = self.metrics
+        return map(ProcessMetrics._make, zip(
+            metrics.pid.tolist(), metrics.at.tolist(), metrics.bt.tolist(),
+            metrics.ct.tolist(), metrics.tat.tolist(), metrics.wt.tolist(),
+        ))
+
+    def process(self, pid):
+        """Return the ProcessMetrics row of ``pid``."""
+        rows = (self.metrics.pid == pid).nonzero()[0]
+        if not len(rows):
+            raise KeyError(pid)
+        metrics, row = self.metrics, int(rows[0])
+        return ProcessMetrics(pid, int(metrics.at[row]), int(metrics.bt[row]),
+                              int(metrics.ct[row]), int(metrics.tat[row]), int(metrics.wt[row]))
+
+    @property
+    def makespan(self):
+        return self.metrics.makespan
+
+    @property
+    def context_switches(self):
+        return self.metrics.context_switches
+
+    def performance(self, window=None):
+        """Return the schedule's PerformanceMetrics, with throughput peaks over ``window`` time units."""
+        return PerformanceMetrics(self.metrics, window=window)
+
+    def averages(self, mask=None):
+        return self.metrics.averages(mask)
+
+    def summary(self):
+        return self.metrics.summary()
@@ -0,0 +1,89 @@
+from collections import deque
+
+from cpusched.cache import Cacheable
+from cpusched.process import ProcessTable
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE, PREEMPT
+
+
+class RoundRobin(Cacheable):
+    about = (
+        "Round Robin (RR) Scheduling:\n\n"
+        "Round Robin is a preemptive scheduling algorithm designed for time-sharing systems. Each process is assigned a fixed "
+        "time slice (quantum) and executes for that duration before being preempted and placed back in the ready queue. If a "
+        "process completes before its quantum expires, it releases the CPU early. RR ensures fairness and responsiveness but may "
+        "increase waiting times if the quantum is too large or too small."
+    )
+
+    algorithm = "rr"
+
+    def __init__(self, processes, time_quantum, tracer=None):
+        self.processes = processes  # (pid, at, bt) tuples or Process records
+        self.time_quantum = time_quantum
+        self.tracer = tracer
+
+    def add_to_ready_queue(self, processes, current_time, index, ready_queue):
+        at = processes.at
+        while index < len(at) and at[index] <= current_time:
+            ready_queue.append(index)
+            if self.tracer is not None:
+                self.tracer.emit(ARRIVAL, at[index], processes.pid[index])
+            index += 1
+        return index
+
+    def iter_timeline(self):
+        """Yield (pid, start, end) segments as soon as each one is final."""
+        processes = ProcessTable(self.processes)
+        arrivals, remaining = processes.at, processes.remaining
+        n = len(processes)
+        current_time = 0
+        ready_queue = deque()  # Record indices into processes
+        index = 0
+        tracer = self.tracer
+
+        while index < n or ready_queue:
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if not ready_queue:
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = arrivals[index]
+                continue
+
+            i = ready_queue.popleft()
+            pid = processes.pid[i]
+            start_time = current_time
+            if tracer is not None:
+                tracer.emit(DISPATCH, start_time, pid)
+
+            if ready_queue:
+                execution_time = min(self.time_quantum, remaining[i])
+            elif index < n:
+                # Nobody else is runnable: keep running whole quanta until one ends
+                # at or after the next arrival, which then queues ahead of this process
+                quanta = max(1, -(-(arrivals[index] - current_time) // self.time_quantum))
+                execution_time = min(quanta * self.time_quantum, remaining[i])
+            else:
+                execution_time = remaining[i]
+
+            current_time += execution_time
+            remaining[i] -= execution_time
+
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if remaining[i] > 0:
+                ready_queue.append(i)
+                if tracer is not None:
+                    tracer.emit(PREEMPT, current_time, pid)
+            elif tracer is not None:
+                tracer.emit(COMPLETE, current_time, pid)
+
+            # A lone process runs all its back-to-back quanta in one step above, so the
+            # next dispatch is always a different process and this segment is final
+            yield (pid, start_time, current_time)
+
+    def calculate_completion_time(self):
+        return Timeline(self.iter_timeline())
+
+    def cache_params(self):
+        return {"quantum": self.time_quantum}
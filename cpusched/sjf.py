@@ -0,0 +1,155 @@
+import heapq
+
+from cpusched.cache import Cacheable
+from cpusched.process import ProcessTable
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE, PREEMPT
+
+
+class SJF(Cacheable):
+    about = {
+        "preemptive": (
+            "Shortest Job First (SJF) Scheduling (Preemptive):\n\n"
+            "Also known as Shortest Remaining Time First (SRTF), this algorithm preempts the currently executing process "
+            "if a new process arrives with a shorter remaining burst time. The process with the shortest remaining time is "
+            "allocated the CPU at each time unit. This minimizes average waiting time but requires knowledge of burst times "
+            "and can lead to starvation if short processes keep arriving."
+        ),
+        "non_preemptive": (
+            "Shortest Job First (SJF) Scheduling (Non-Preemptive):\n\n"
+            "In non-preemptive SJF, the CPU is allocated to the process with the shortest burst time among those that have "
+            "arrived, and it runs to completion without interruption. This algorithm reduces average waiting time compared to "
+            "FCFS but may cause longer processes to wait excessively if short processes arrive frequently."
+        )
+    }
+
+    algorithm = "sjf"
+
+    def __init__(self, processes, is_preemptive, tracer=None):
+        self.processes = processes  # (pid, at, bt) tuples or Process records
+        self.is_preemptive = is_preemptive
+        self.tracer = tracer
+
+    def add_to_ready_queue(self, processes, current_time, index, ready_queue):
+        at, remaining = processes.at, processes.remaining
+        while index < len(at) and at[index] <= current_time:
+            heapq.heappush(ready_queue, (remaining[index], processes.pid[index], index))
+            if self.tracer is not None:
+                self.tracer.emit(ARRIVAL, at[index], processes.pid[index])
+            index += 1
+        return index
+
+    def _preemptive_sjf(self):
+        processes = ProcessTable(self.processes)
+        pids, arrivals, remaining = processes.pid, processes.at, processes.remaining
+        n = len(processes)
+        current_time = 0
+        ready_queue = []  # Min-heap of (remaining, pid, i)
+        index = 0
+        running = None  # Process holding the CPU, if it has not completed
+        segment_start = 0  # Start of the running process's current segment
+        tracer = self.tracer
+
+        while index < n or ready_queue:
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if not ready_queue:
+                # CPU is idle, jump to the next arrival
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = arrivals[index]
+                continue
+
+            _, pid, i = heapq.heappop(ready_queue)
+            start_time = current_time
+
+            # Back-to-back runs of the same process form a single segment, which is
+            # final once the process is preempted or completes
+            if i != running:
+                if running is not None:
+                    if tracer is not None:
+                        tracer.emit(PREEMPT, current_time, pids[running])
+                    yield (pids[running], segment_start, current_time)
+                if tracer is not None:
+                    tracer.emit(DISPATCH, current_time, pid)
+                segment_start = current_time
+
+            # Remaining times of waiting processes never change, so the shortest job
+            # keeps the CPU until it finishes or the next process arrives
+            end_time = current_time + remaining[i]
+            if index < n and arrivals[index] < end_time:
+                end_time = arrivals[index]
+
+            current_time = end_time
+            remaining[i] -= end_time - start_time
+
+            if remaining[i] > 0:
+                heapq.heappush(ready_queue, (remaining[i], pid, i))
+                running = i
+            else:
+                if tracer is not None:
+                    tracer.emit(COMPLETE, current_time, pid)
+                running = None
+                yield (pid, segment_start, current_time)
+
+    def _non_preemptive_sjf(self, start_time=0, done=()):
+        processes = ProcessTable(self.processes, exclude=done)
+        n = len(processes)
+        current_time = start_time
+        ready_queue = []  # Min-heap of (bt, pid, i)
+        index = 0
+        tracer = self.tracer
+
+        while index < n or ready_queue:
+            index = self.add_to_ready_queue(processes, current_time, index, ready_queue)
+
+            if not ready_queue:
+                if tracer is not None:
+                    tracer.emit(IDLE, current_time)
+                current_time = processes.at[index]
+                continue
+
+            bt, pid, i = heapq.heappop(ready_queue)
+            start_time = current_time
+            current_time += bt
+            processes.remaining[i] = 0
+
+            if tracer is not None:
+                tracer.emit(DISPATCH, start_time, pid)
+                tracer.emit(COMPLETE, current_time, pid)
+
+            yield (pid, start_time, current_time)
+
+    def iter_timeline(self):
+        """Yield (pid, start, end) segments as soon as each one is final."""
+        if self.is_preemptive:
+            return self._preemptive_sjf()
+        else:
+            return self._non_preemptive_sjf()
+
+    def resume(self, start_time, done=()):
+        """Yield the non-preemptive schedule of the processes not in ``done``, with the CPU free from ``start_time``."""
+        if self.is_preemptive:
+            raise ValueError("only non-preemptive SJF can resume from a saved state")
+        return self._non_preemptive_sjf(start_time, done)
+
+    def reschedule(self, previous, since):
+        """Return the Timeline for the current processes, reusing ``previous`` up to ``since``.
+
+        ``previous`` is the timeline of an earlier version of this workload and
+        ``since`` the earliest time an edit could matter (see
+        ``cpusched.process.earliest_change``). In non-preemptive mode segments
+        starting before it are kept and scheduling resumes from the end of the
+        last one; preemptive SJF is rescheduled in full.
+        """
+        if self.is_preemptive:
+            return self.calculate_completion_time()
+        timeline = (previous if isinstance(previous, Timeline) else Timeline(previous)).before(since)
+        timeline.extend(self.resume(timeline.makespan, set(timeline.pid)))
+        return timeline
+
+    def calculate_completion_time(self):
+        return Timeline(self.iter_timeline())
+
+    def cache_params(self):
+        return {"preemptive": bool(self.is_preemptive)}
@@ -0,0 +1,370 @@
+"""Symmetric multiprocessor (SMP) scheduling: one policy on several identical cores.
+
+``SMP`` runs FCFS, SJF, Priority or Round Robin on ``cores`` cores, either
+from one global ready queue or from a queue per core. With per-core queues
+an arrival joins the least loaded core (running plus queued processes) and
+a core that runs out of work steals the next process of the longest queue.
+Preemptive policies preempt the running process that ranks worst (globally,
+or on the arrival's own core). A process goes back to the core it last ran
+on when that core is free, so a process that keeps the CPU stays in one
+lane.
+
+The simulation is event-driven: a heap of slice ends and the arrival cursor
+give the next decision time, so the cost grows with the number of
+dispatches, not with the length of the schedule or the number of idle
+cores. On one core with the global queue it reproduces the single-CPU
+engines' timelines exactly.
+"""
+import heapq
+from collections import deque
+
+from cpusched.cache import Cacheable
+from cpusched.metrics import PerformanceMetrics, count_context_switches
+from cpusched.process import ProcessTable
+from cpusched.result import ScheduleResult
+from cpusched.timeline import Timeline
+from cpusched.tracing import ARRIVAL, COMPLETE, DISPATCH, IDLE, PREEMPT
+
+POLICIES = ("fcfs", "sjf", "priority", "rr")
+QUEUES = ("global", "per-core")
+
+
+class SMPResult(ScheduleResult):
+    """A multi-core schedule: one Timeline per core in ``lanes``.
+
+    ``timeline`` holds the segments of every core ordered by end time, so
+    segments of different cores overlap; the metrics are computed from it.
+    """
+
+    __slots__ = ("lanes",)
+
+    def __init__(self, timeline, metrics, lanes):
+        super().__init__(timeline, metrics)
+        self.lanes = lanes
+
+    @classmethod
+    def from_lanes(cls, lanes, processes):
+        timeline = merge_lanes(lanes)
+        return cls(timeline, ScheduleResult.from_timeline(timeline, processes).metrics, lanes)
+
+    @property
+    def cores(self):
+        return len(self.lanes)
+
+    @property
+    def context_switches(self):
+        return sum(count_context_switches(lane) for lane in self.lanes)
+
+    def performance(self, window=None):
+        return PerformanceMetrics(self.metrics, self.context_switches, self.cores, self.busy_time(), window)
+
+    def busy_time(self):
+        """Return the time each core spent running a process."""
+        return [sum(end - start for _, start, end in zip(lane.pid, lane.start, lane.end)) for lane in self.lanes]
+
+    def utilization(self):
+        """Return the busy fraction of the makespan for each core."""
+        makespan = self.makespan
+        return [busy / makespan if makespan else 0.0 for busy in self.busy_time()]
+
+
+def merge_lanes(lanes):
+    """Return the segments of every lane as one Timeline ordered by end (then start) time."""
+    import numpy as np
+
+    columns = [lane.arrays() for lane in lanes if len(lane)]
+    if not columns:
+        return Timeline()
+    pid, start, end = (np.concatenate([column[field] for column in columns]) for field in range(3))
+    order = np.lexsort((start, end))
+    return Timeline.from_columns(pid[order], start[order], end[order])
+
+
+class SMP(Cacheable):
+    about = (
+        "Symmetric Multiprocessing (SMP):\n\n"
+        "Several identical cores run the chosen algorithm side by side. With a global ready queue every idle core takes "
+        "the next process of one shared queue; with per-core queues each arrival joins the least loaded core and a core "
+        "that runs out of work steals from the busiest one. Each core has its own lane in the Gantt chart."
+    )
+
+    algorithm = "smp"
+
+    def __init__(self, processes, cores, policy="fcfs", is_preemptive=False, time_quantum=2, queues="global",
+                 tracer=None):
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError(f"unknown policy {policy!r}, choose from {', '.join(POLICIES)}")
+        if queues not in QUEUES:
+            raise ValueError(f"unknown queues {queues!r}, choose from {', '.join(QUEUES)}")
+        if time_quantum < 1:
+            raise ValueError("quantum must be at least 1")
+        self.processes = processes  # (pid, at, bt[, priority]) tuples or Process records
+        self.cores = cores
+        self.policy = policy
+        self.is_preemptive = is_preemptive and policy in ("sjf", "priority")
+        self.time_quantum = time_quantum
+        self.queues = queues
+        self.tracer = tracer
+
+    def calculate_lanes(self):
+        """Return one Timeline of (pid, start, end) segments per core."""
+        processes = ProcessTable(self.processes)
+        pids, arrivals, bts, remaining = processes.pid, processes.at, processes.bt, processes.remaining
+        priorities = processes.priority
+        n, cores, quantum = len(processes), self.cores, self.time_quantum
+        policy, preemptive, per_core = self.policy, self.is_preemptive, self.queues == "per-core"
+        tracer = self.tracer
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        # Ready queues hold record indices (Round Robin) or heap entries ending in the index
+        if policy == "rr":
+            def push(queue, i):
+                queue.append(i)
+
+            def pop(queue):
+                return queue.popleft()
+        else:
+            if policy == "fcfs":
+                def entry(i):
+                    return (i,)
+            elif policy == "sjf":
+                def entry(i):
+                    return (remaining[i], pids[i], i)
+            else:
+                def entry(i):
+                    return (priorities[i], i)  # Earlier arrival (lower index) breaks ties
+
+            def push(queue, i):
+                heappush(queue, entry(i))
+
+            def pop(queue):
+                return heappop(queue)[-1]
+
+        def rank(head, time):
+            """Rank of a queued heap entry against running processes; lower wins."""
+            if policy == "sjf":
+                return (time + head[0],) + head[1:]  # Compared by when it would finish
+            return head
+
+        queues = [deque() if policy == "rr" else [] for _ in range(cores if per_core else 1)]
+        lanes = [Timeline() for _ in range(cores)]
+        running = [None] * cores  # Record index on each core
+        started = [0] * cores  # Start of the running slice
+        ranks = [None] * cores  # Rank of the running process (preemptive policies)
+        serial = [0] * cores  # Bumped on every dispatch and release; stale events carry an older one
+        last_core = [0] * n
+        events = []  # Min-heap of (slice end, core, serial)
+        worst = []  # Max-heap of running ranks, negated (global preemptive)
+        idle = list(range(cores))  # Min-heap of cores that may be idle
+        is_idle = [True] * cores
+        in_heap = [True] * cores
+        extended = set()  # Cores running a Round Robin slice past its quantum while nobody waits
+        loads = [0] * cores  # Running plus queued processes (per-core queues)
+        least_loaded = [(0, core) for core in range(cores)]  # Min-heap of (load, core), lazily updated
+
+        def take_idle(preferred):
+            """Claim ``preferred`` if it is idle, else the lowest idle core, or return None."""
+            if is_idle[preferred]:
+                is_idle[preferred] = False
+                return preferred
+            while idle:
+                core = heappop(idle)
+                in_heap[core] = False
+                if is_idle[core]:
+                    is_idle[core] = False
+                    return core
+            return None
+
+        def release(core):
+            running[core] = None
+            extended.discard(core)
+            serial[core] += 1
+            is_idle[core] = True
+            if not in_heap[core]:
+                in_heap[core] = True
+                heappush(idle, core)
+
+        def adjust(core, delta):
+            loads[core] += delta
+            heappush(least_loaded, (loads[core], core))
+            if len(least_loaded) > 4 * cores + 64:
+                least_loaded[:] = [(load, core) for core, load in enumerate(loads)]
+                heapq.heapify(least_loaded)
+
+        def least_loaded_core():
+            while least_loaded[0][0] != loads[least_loaded[0][1]]:
+                heappop(least_loaded)  # Outdated load
+            return least_loaded[0][1]
+
+        def dispatch(core, i, queue, time):
+            running[core] = i
+            started[core] = time
+            serial[core] += 1
+            last_core[i] = core
+            length = remaining[i]
+            if policy == "rr":
+                if queue:
+                    length = min(quantum, length)
+                elif length > quantum:
+                    # Nobody is waiting: keep running until someone is (see cut_short)
+                    extended.add(core)
+            heappush(events, (time + length, core, serial[core]))
+            if preemptive:
+                ranks[core] = rank(entry(i), time)
+                if not per_core:
+                    heappush(worst, (tuple(-value for value in ranks[core]), serial[core], core))
+            if tracer is not None:
+                tracer.emit(DISPATCH, time, pids[i])
+
+        def cut_short(core, time):
+            """End an extended Round Robin slice at its first quantum boundary at or after ``time``."""
+            extended.discard(core)
+            start = started[core]
+            boundary = start + max(1, -(-(time - start) // quantum)) * quantum
+            if boundary < start + remaining[running[core]]:
+                serial[core] += 1
+                heappush(events, (boundary, core, serial[core]))
+
+        def preempt(core, time):
+            i = running[core]
+            lanes[core].append(pids[i], started[core], time)
+            remaining[i] -= time - started[core]
+            release(core)
+            if tracer is not None:
+                tracer.emit(PREEMPT, time, pids[i])
+            return i
+
+        def worst_core():
+            while worst[0][1] != serial[worst[0][2]]:
+                heappop(worst)  # Its process has since completed or been preempted
+            return worst[0][2]
+
+        index = 0
+        waiting = 0  # Queued processes, over all queues
+        rotation = 0  # Next core to steal for when several queues are equally long
+        while True:
+            while events and events[0][2] != serial[events[0][1]]:
+                heappop(events)
+            if events:
+                time = events[0][0]
+                if index < n and arrivals[index] < time:
+                    time = arrivals[index]
+            elif index < n:
+                time = arrivals[index]
+            else:
+                break
+
+            # Slices ending now; the cores they free are decided on below
+            touched = []
+            expired = []
+            while events and events[0][0] == time:
+                _, core, stamp = heappop(events)
+                if stamp != serial[core]:
+                    continue
+                i = running[core]
+                lanes[core].append(pids[i], started[core], time)
+                remaining[i] -= time - started[core]
+                release(core)
+                if per_core:
+                    adjust(core, -1)
+                    touched.append(core)
+                if remaining[i] > 0:
+                    expired.append(i)  # Round Robin quantum
+                    if tracer is not None:
+                        tracer.emit(PREEMPT, time, pids[i])
+                elif tracer is not None:
+                    tracer.emit(COMPLETE, time, pids[i])
+
+            # Arrivals queue ahead of processes whose quantum just expired
+            while index < n and arrivals[index] <= time:
+                i = index
+                index += 1
+                if tracer is not None:
+                    tracer.emit(ARRIVAL, arrivals[i], pids[i])
+                if preemptive and policy == "priority" and bts[i] == 0:
+                    if tracer is not None:
+                        tracer.emit(COMPLETE, time, pids[i])  # Zero burst time never runs
+                    continue
+                if per_core:
+                    core = least_loaded_core()
+                    push(queues[core], i)
+                    adjust(core, 1)
+                    touched.append(core)
+                else:
+                    push(queues[0], i)
+                waiting += 1
+            for i in expired:
+                if per_core:
+                    # Back on its own core unless another one has less to do
+                    core = least_loaded_core()
+                    if loads[last_core[i]] <= loads[core]:
+                        core = last_core[i]
+                    push(queues[core], i)
+                    adjust(core, 1)
+                    touched.append(core)
+                else:
+                    push(queues[0], i)
+                waiting += 1
+
+            if not per_core:
+                queue = queues[0]
+                while queue:
+                    core = take_idle(last_core[queue[0] if policy == "rr" else queue[0][-1]])
+                    if core is not None:
+                        waiting -= 1
+                        dispatch(core, pop(queue), queue, time)
+                        continue
+                    if not preemptive:
+                        break
+                    core = worst_core()
+                    if not rank(queue[0], time) < ranks[core]:
+                        break
+                    push(queue, preempt(core, time))
+                    waiting += 1
+                if queue and extended:
+                    for core in sorted(extended):
+                        cut_short(core, time)
+                if tracer is not None and not events:
+                    tracer.emit(IDLE, time)  # Every core is idle until the next arrival
+            else:
+                for core in dict.fromkeys(touched):
+                    queue = queues[core]
+                    if running[core] is not None:
+                        if queue and core in extended:
+                            cut_short(core, time)
+                        if not (preemptive and queue and rank(queue[0], time) < ranks[core]):
+                            continue
+                        push(queue, preempt(core, time))
+                        waiting += 1
+                    if not queue and waiting:
+                        # Steal the next process of the longest queue
+                        victim = max(range(rotation, rotation + cores), key=lambda c: len(queues[c % cores])) % cores
+                        rotation = (victim + 1) % cores
+                        push(queue, pop(queues[victim]))
+                        adjust(victim, -1)
+                        adjust(core, 1)
+                    if queue:
+                        is_idle[core] = False
+                        waiting -= 1
+                        dispatch(core, pop(queue), queue, time)
+                    elif tracer is not None:
+                        tracer.emit(IDLE, time)
+
+        return lanes
+
+    def calculate_completion_time(self):
+        return merge_lanes(self.calculate_lanes())
+
+    @property
+    def uses_priority(self):
+        return self.policy == "priority"
+
+    def cache_params(self):
+        return {"cores": self.cores, "policy": self.policy, "preemptive": bool(self.is_preemptive),
+                "quantum": self.time_quantum if self.policy == "rr" else None, "queues": self.queues}
+
+    def compute_result(self):
+        """Return an SMPResult, with the timeline of each core."""
+        return SMPResult.from_lanes(self.calculate_lanes(), self.processes)
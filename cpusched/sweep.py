@@ -0,0 +1,123 @@
+"""Parallel parameter sweeps over scheduling algorithms and Round Robin quanta.
+
+Every (workload, configuration) pair is scheduled independently, so a sweep
+spreads across a ``ProcessPoolExecutor``. Workloads are handed to each worker
+once through the pool initializer; tasks only name a workload and a
+configuration and are submitted in chunks.
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from cpusched.cache import ScheduleCache
+from cpusched.cfs import CFS
+from cpusched.fcfs import FCFS
+from cpusched.priorityScheduling import PriorityScheduling
+from cpusched.roundRobin import RoundRobin
+from cpusched.sjf import SJF
+
+SweepConfig = namedtuple("SweepConfig", ["algorithm", "preemptive", "quantum"])
+
+# Same short names as the CLI; each takes (processes, config)
+SCHEDULERS = {
+    "fcfs": lambda processes, config: FCFS([(pid, at, bt) for pid, at, bt, _ in processes]),
+    "sjf": lambda processes, config: SJF(processes, config.preemptive),
+    "rr": lambda processes, config: RoundRobin(processes, config.quantum),
+    "priority": lambda processes, config: PriorityScheduling(processes, config.preemptive),
+    "cfs": lambda processes, config: CFS(processes),
+}
+
+COLUMNS = ("workload", "algorithm", "preemptive", "quantum", "average_waiting_time",
+           "average_turnaround_time", "makespan", "context_switches")
+
+# Workloads and cache of the current worker process, set once by init_worker
+worker_workloads = {}
+worker_cache = None
+
+
+def grid(algorithms=tuple(SCHEDULERS), preemptive=(False, True), quanta=(2,)):
+    """Return the SweepConfigs for every combination that applies to each algorithm.
+
+    ``preemptive`` only varies SJF and Priority, ``quanta`` only Round Robin;
+    CFS runs with its default target latency and granularity.
+    """
+    configs = []
+    for algorithm in algorithms:
+        if algorithm not in SCHEDULERS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, choose from {', '.join(SCHEDULERS)}")
+        if algorithm == "fcfs":
+            configs.append(SweepConfig(algorithm, False, None))
+        elif algorithm == "cfs":
+            configs.append(SweepConfig(algorithm, True, None))
+        elif algorithm == "rr":
+            for quantum in quanta:
+                if quantum < 1:
+                    raise ValueError("quantum must be at least 1")
+                configs.append(SweepConfig(algorithm, True, quantum))
+        else:
+            configs.extend(SweepConfig(algorithm, mode, None) for mode in preemptive)
+    return configs
+
+
+def run_config(processes, config, cache=None):
+    """Schedule (pid, at, bt, priority) tuples under one configuration and return its summary row."""
+    result = SCHEDULERS[config.algorithm](processes, config).schedule(cache)
+    avg_wt, avg_tat = result.averages()
+    return {
+        "algorithm": config.algorithm,
+        "preemptive": config.preemptive,
+        "quantum": config.quantum,
+        "average_waiting_time": avg_wt,
+        "average_turnaround_time": avg_tat,
+        "makespan": result.makespan,
+        "context_switches": result.context_switches,
+    }
+
+
+def init_worker(workloads, cache_options):
+    global worker_cache
+    worker_workloads.clear()
+    worker_workloads.update(workloads)
+    worker_cache = ScheduleCache(**cache_options) if cache_options is not None else None
+
+
+def run_task(task):
+    """Return the task's row and the (hits, disk hits, misses) it caused in the worker's cache."""
+    name, config = task
+    if worker_cache is None:
+        return {"workload": name, **run_config(worker_workloads[name], config)}, (0, 0, 0)
+
+    stats = worker_cache.stats
+    hits, disk_hits, misses = stats.hits, stats.disk_hits, stats.misses
+    row = {"workload": name, **run_config(worker_workloads[name], config, worker_cache)}
+    return row, (stats.hits - hits, stats.disk_hits - disk_hits, stats.misses - misses)
+
+
+def sweep(workloads, configs, max_workers=None, chunksize=None, cache=None):
+    """Run every configuration on every workload and return one row per pair.
+
+    ``workloads`` maps names to lists of (pid, at, bt, priority) tuples. Rows
+    are dicts keyed by ``COLUMNS``, in workload then configuration order.
+    ``max_workers`` defaults to the number of CPUs; with one worker the sweep
+    runs in this process. ``chunksize`` defaults to about four chunks per worker.
+    With a ScheduleCache, pool workers keep caches of their own on the same
+    directory (if any), and their hits and misses are added to ``cache.stats``.
+    """
+    tasks = [(name, config) for name in workloads for config in configs]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) <= 1:
+        return [{"workload": name, **run_config(workloads[name], config, cache)} for name, config in tasks]
+
+    cache_options = None
+    if cache is not None:
+        cache_options = dict(max_entries=cache.max_entries, directory=cache.directory, max_bytes=cache.max_bytes)
+    chunksize = chunksize or max(1, len(tasks) // (4 * max_workers))
+    rows = []
+    with ProcessPoolExecutor(max_workers, initializer=init_worker, initargs=(workloads, cache_options)) as executor:
+        for row, (hits, disk_hits, misses) in executor.map(run_task, tasks, chunksize=chunksize):
+            rows.append(row)
+            if cache is not None:
+                cache.stats.hits += hits
+                cache.stats.disk_hits += disk_hits
+                cache.stats.misses += misses
+    return rows
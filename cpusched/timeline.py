@@ -0,0 +1,116 @@
+"""Compact columnar storage for schedules.
+
+A ``Timeline`` keeps the pid, start and end of every segment in three
+``array('q')`` columns (24 bytes per segment instead of a tuple of boxed ints,
+well over 100 bytes on large schedules) but still iterates as ``(pid, start,
+end)`` tuples, so code written against plain lists of segments keeps working.
+"""
+from array import array
+from bisect import bisect_left
+
+
+class Timeline:
+    """Append-only, time-ordered (pid, start, end) segments.
+
+    Appending a segment that continues the previous one for the same pid
+    extends it instead of adding a new segment (run-length merging).
+    """
+
+    __slots__ = ("pid", "start", "end")
+
+    def __init__(self, segments=()):
+        self.pid = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.extend(segments)
+
+    @classmethod
+    def from_columns(cls, pid, start, end):
+        """Build a timeline from parallel pid/start/end arrays of already merged segments."""
+        timeline = cls()
+        for column, values in ((timeline.pid, pid), (timeline.start, start), (timeline.end, end)):
+            if hasattr(values, "astype"):
+                column.frombytes(values.astype(column.typecode, copy=False).tobytes())
+            else:
+                column.extend(values)
+        return timeline
+
+    def append(self, pid, start, end):
+        if self.pid and self.pid[-1] == pid and self.end[-1] == start:
+            self.end[-1] = end
+            return
+        self.pid.append(pid)
+        self.start.append(start)
+        self.end.append(end)
+
+    def extend(self, segments):
+        if isinstance(segments, Timeline) and len(segments):
+            # Only the first segment can merge with this timeline's last one
+            self.append(*segments[0])
+            self.pid.extend(segments.pid[1:])
+            self.start.extend(segments.start[1:])
+            self.end.extend(segments.end[1:])
+            return
+        append = self.append
+        for pid, start, end in segments:
+            append(pid, start, end)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        return zip(self.pid, self.start, self.end)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Timeline.from_columns(self.pid[index], self.start[index], self.end[index])
+        return self.pid[index], self.start[index], self.end[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Timeline):
+            return self.pid == other.pid and self.start == other.start and self.end == other.end
+        try:
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"Timeline({list(self)!r})"
+
+    @property
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in (self.pid, self.start, self.end))
+
+    @property
+    def makespan(self):
+        return self.end[-1] if self.end else 0
+
+    def before(self, time):
+        """Return a copy of the segments that start before ``time``, unclipped."""
+        return self[:bisect_left(self.start, time)]
+
+    def between(self, start, end):
+        """Return the segments overlapping [start, end), clipped to that range.
+
+        Zero-length segments at a time inside the range are kept.
+        """
+        first = bisect_left(self.end, start)
+        while first < len(self) and self.end[first] == start and self.start[first] < start:
+            first += 1  # Ends exactly where the range begins
+        last = bisect_left(self.start, end, first)
+
+        clipped = Timeline.from_columns(self.pid[first:last], self.start[first:last], self.end[first:last])
+        if len(clipped):
+            clipped.start[0] = max(clipped.start[0], start)
+            clipped.end[-1] = min(clipped.end[-1], end)
+        return clipped
+
+    def arrays(self):
+        """Return (pid, start, end) as NumPy int64 views sharing this timeline's memory.
+
+        While any view is alive the timeline cannot grow; appending raises BufferError.
+        """
+        import numpy as np
+
+        return tuple(np.frombuffer(column, dtype=np.int64) if len(column) else np.empty(0, dtype=np.int64)
+                     for column in (self.pid, self.start, self.end))
@@ -0,0 +1,121 @@
+import json
+from collections import Counter, deque, namedtuple
+
+from cpusched.histogram import LatencyHistograms
+
+# Event kinds emitted by the schedulers
+ARRIVAL = "arrival"
+DISPATCH = "dispatch"
+PREEMPT = "preempt"
+COMPLETE = "complete"
+IDLE = "idle"
+
+EVENT_KINDS = (ARRIVAL, DISPATCH, PREEMPT, COMPLETE, IDLE)
+
+TraceEvent = namedtuple("TraceEvent", ["kind", "time", "pid"])
+
+
+class Tracer:
+    """Base class for scheduler event sinks.
+
+    Schedulers take an optional ``tracer`` and only call ``emit`` when one is
+    attached, so an untraced run costs a single ``None`` check per decision.
+    Events are emitted in the order the scheduler makes its decisions; ``time``
+    is the simulated time the event refers to and ``pid`` is ``None`` for idle.
+    """
+
+    def emit(self, kind, time, pid=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CountingTracer(Tracer):
+    """Counts events per kind."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def emit(self, kind, time, pid=None):
+        self.counts[kind] += 1
+
+
+class RingBufferTracer(Tracer):
+    """Keeps the most recent ``capacity`` events in memory."""
+
+    def __init__(self, capacity=1024):
+        self.events = deque(maxlen=capacity)
+
+    def emit(self, kind, time, pid=None):
+        self.events.append(TraceEvent(kind, time, pid))
+
+
+class JsonLinesTracer(Tracer):
+    """Writes one JSON object per event to a file path or an open text stream."""
+
+    def __init__(self, target):
+        if isinstance(target, str):
+            self.stream = open(target, "w")
+            self.owns_stream = True
+        else:
+            self.stream = target
+            self.owns_stream = False
+
+    def emit(self, kind, time, pid=None):
+        self.stream.write(json.dumps({"event": kind, "time": time, "pid": pid}))
+        self.stream.write("\n")
+
+    def close(self):
+        if self.owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+class LatencyTracer(Tracer):
+    """Records each process's waiting, turnaround and response time as it completes.
+
+    Keeps state only for processes that have arrived and not completed, and
+    feeds ``histograms`` (a ``LatencyHistograms``, new by default),
+    so percentiles of arbitrarily long runs take fixed memory. A process that
+    completes without being dispatched (zero burst time) counts as completing
+    on arrival, as in ``compute_metrics``.
+    """
+
+    def __init__(self, histograms=None):
+        if histograms is None:
+            histograms = LatencyHistograms()
+        self.histograms = histograms
+        self.in_flight = {}  # pid -> [arrival, first dispatch, current dispatch, CPU time so far]
+
+    def emit(self, kind, time, pid=None):
+        if kind == ARRIVAL:
+            self.in_flight[pid] = [time, None, None, 0]
+            return
+        state = self.in_flight.get(pid)
+        if state is None:
+            return
+        if kind == DISPATCH:
+            if state[1] is None:
+                state[1] = time
+            if state[2] is None:
+                state[2] = time
+        elif kind == PREEMPT or kind == COMPLETE:
+            if state[2] is not None:
+                state[3] += time - state[2]
+                state[2] = None
+            if kind == COMPLETE:
+                del self.in_flight[pid]
+                arrival, first, _, cpu = state
+                if first is None:
+                    self.histograms.record(0, 0, 0)
+                else:
+                    tat = time - arrival
+                    self.histograms.record(tat - cpu, tat, first - arrival)
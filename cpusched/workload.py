@@ -0,0 +1,95 @@
+import csv
+
+COLUMNS = ("pid", "at", "bt", "priority")
+
+# Binary workloads are raw little-endian int64 rows of (pid, at, bt, priority)
+BINARY_SUFFIX = ".bin"
+BINARY_DTYPE = "<i8"
+
+
+def parse_row(row, line_no, columns):
+    values = dict(zip(columns, row))
+    try:
+        pid = int(values["pid"])
+        at = int(values["at"])
+        bt = int(values["bt"])
+        priority = int(values.get("priority") or 0)
+    except (KeyError, ValueError):
+        raise ValueError(f"line {line_no}: expected integer pid, at, bt[, priority], got {row!r}")
+    if at < 0 or bt < 0:
+        raise ValueError(f"line {line_no}: arrival and burst times must be non-negative")
+    return pid, at, bt, priority
+
+
+def iter_workload(stream):
+    """Yield (pid, at, bt, priority) tuples from a CSV workload.
+
+    The file may start with a header naming the pid, at, bt and (optional)
+    priority columns in any order; without one the columns are taken
+    positionally. Blank lines and lines starting with '#' are ignored.
+    """
+    columns = COLUMNS
+    first = True
+    for line_no, row in enumerate(csv.reader(stream), start=1):
+        if not row or row[0].lstrip().startswith("#"):
+            continue
+        row = [field.strip() for field in row]
+        if first:
+            first = False
+            if not row[0].lstrip("-").isdigit():
+                columns = tuple(field.lower() for field in row)
+                missing = {"pid", "at", "bt"} - set(columns)
+                if missing:
+                    raise ValueError(f"line {line_no}: header is missing column(s) {', '.join(sorted(missing))}")
+                continue
+        yield parse_row(row, line_no, columns)
+
+
+def iter_binary_chunks(path, chunk_rows=1_000_000):
+    """Yield (pid, at, bt, priority) column arrays from a binary workload file."""
+    import numpy as np
+
+    with open(path, "rb") as f:
+        while True:
+            rows = np.fromfile(f, dtype=BINARY_DTYPE, count=chunk_rows * len(COLUMNS))
+            if not len(rows):
+                break
+            if len(rows) % len(COLUMNS):
+                raise ValueError(f"{path}: truncated binary workload")
+            yield tuple(rows.reshape(-1, len(COLUMNS)).T.astype("int64"))
+
+
+def read_workload(path):
+    """Read a whole workload file (CSV, or binary if it ends in .bin) into a list of (pid, at, bt, priority) tuples."""
+    if path.endswith(BINARY_SUFFIX):
+        processes = []
+        for chunk in iter_binary_chunks(path):
+            processes.extend(zip(*(column.tolist() for column in chunk)))
+    else:
+        with open(path, newline="") as f:
+            processes = list(iter_workload(f))
+    if len({pid for pid, _, _, _ in processes}) != len(processes):
+        raise ValueError(f"{path}: process ids must be unique")
+    return processes
+
+
+def write_chunks(path, chunks):
+    """Stream (pid, at, bt, priority) column chunks to a CSV file, or a binary file if it ends in .bin.
+
+    Returns the number of processes written.
+    """
+    import numpy as np
+
+    count = 0
+    binary = path.endswith(BINARY_SUFFIX)
+    with open(path, "wb" if binary else "w", newline=None if binary else "") as f:
+        if not binary:
+            f.write(",".join(COLUMNS) + "\n")
+        for chunk in chunks:
+            rows = np.column_stack(chunk)
+            if binary:
+                f.write(rows.astype(BINARY_DTYPE).tobytes())
+            else:
+                np.savetxt(f, rows, fmt="%d", delimiter=",")
+            count += len(rows)
+    return count
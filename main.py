@@ -1,67 +1,419 @@
 import sys
 import json
+from bisect import bisect_left, bisect_right
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QComboBox, 
                             QMainWindow, QHBoxLayout, QSpinBox, QPushButton, 
-                            QMessageBox, QProgressBar, QFileDialog, QGridLayout)
-from PyQt5.QtGui import QFont, QPainter, QColor
-from PyQt5.QtCore import Qt, QTimer
-from fcfs import FCFS
-from sjf import SJF
-from roundRobin import RoundRobin
-from priorityScheduling import PriorityScheduling
+                            QMessageBox, QFileDialog, QGridLayout, QSlider,
+                            QTableView, QHeaderView, QStyledItemDelegate, QAbstractItemView)
+from PyQt5.QtGui import QFont, QPainter, QColor, QImage, QPixmap
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, QAbstractTableModel, QModelIndex
+from cpusched.cfs import CFS
+from cpusched.fcfs import FCFS
+from cpusched.sjf import SJF
+from cpusched.roundRobin import RoundRobin
+from cpusched.priorityScheduling import PriorityScheduling
+from cpusched.cache import ScheduleCache
+from cpusched.frames import FrameCursor, FrameIndex
+from cpusched.process import Process, earliest_change
+from cpusched.result import ScheduleResult
+from cpusched.smp import SMP
+from cpusched.timeline import Timeline
+from cpusched.workload import read_workload
+
+# Shared by every simulation window, so recompiling unchanged inputs reuses the schedule
+SCHEDULE_CACHE = ScheduleCache()
+
+MAX_PROCESSES = 100000
+MAX_CORES = 64
+CORE_LABEL_LIMIT = 8  # Busy cores listed by pid before the rest are only counted
+READY_QUEUE_LIMIT = 12  # Ready processes listed before the rest are only counted
+FRAME_INTERVAL = 33  # Milliseconds between rendered frames
+DEFAULT_SPEED = 10  # Simulated time units per second of playback
+QT_INT_MAX = 2 ** 31 - 1  # Largest value a QSpinBox or QSlider holds
+SEEK_STEPS = 10000  # Slider positions of long schedules, each covering several time units
+
+GANTT_COLORS = [QColor(255, 100, 100), QColor(100, 255, 100),
+                QColor(100, 100, 255), QColor(255, 255, 100),
+                QColor(255, 100, 255)]
 
-# Backend functions
-def calculate_turnaround_time(at, ct):
-    return ct - at
+class GanttChart(QWidget):
+    """Gantt chart of the timeline up to ``until``, painted incrementally into a cached pixmap.
 
-def calculate_waiting_time(tat, bt):
-    return tat - bt
+    Each process has a row, or with per-core ``lanes`` each core does. Only
+    segments inside the visible time range are painted; when there are more
+    of them than pixel columns, each row is drawn as the pixel runs it covers. Scroll to zoom around the cursor, drag to pan and
+    double-click to show the whole schedule again.
+    """
+
+    LABEL_SPACING = 8  # Minimum pixels between adjacent time labels
+    MIN_SPAN = 2  # Narrowest visible time range when zoomed in
 
-class GanttChart(QWidget):
     def __init__(self, timeline, processes, max_time):
         super().__init__()
+        self.pixmap = None
+        self.drag_x = None
+        self.set_schedule(timeline, processes, max_time)
+        self.setMinimumSize(600, 120)
+        self.setToolTip("Scroll to zoom, drag to pan, double-click to reset")
+
+    def set_schedule(self, timeline, processes, max_time, lanes=None):
         self.timeline = timeline
-        self.processes = processes 
+        self.lanes = [timeline] if lanes is None else lanes
+        self.by_core = lanes is not None
+        self.processes = processes  # Sorted pids, one row each unless by_core
+        self.pid_array = np.asarray(processes, dtype=np.int64)
+        self.rows = {pid: row for row, pid in enumerate(processes)}
+        self.row_count = len(self.lanes) if self.by_core else len(processes)
         self.max_time = max_time
-        self.setMinimumSize(600, 120)
+        self.until = 0  # Only the part of the timeline before this time is drawn
+        self.view_start = 0
+        self.view_span = max(1, max_time)
+        self.invalidate()
+
+    def set_until(self, until):
+        if until < self.painted_until:
+            self.invalidate()
+        self.until = until
+        self.update()
+
+    def invalidate(self):
+        self.pixmap = None
+        self.painted_until = self.view_start  # Segments before this time are already in the pixmap
+        self.update()
+
+    @property
+    def view_end(self):
+        return self.view_start + self.view_span
+
+    @property
+    def time_scale(self):
+        return self.width() / self.view_span
 
     def paintEvent(self, event):
+        if self.pixmap is None or self.pixmap.size() != self.size():
+            self.pixmap = QPixmap(self.size())
+            self.pixmap.fill(QColor(255, 255, 255))
+            self.painted_until = self.view_start
+
+        # Paint only the segments that became visible since the last update
+        limit = min(self.until, self.view_end)
+        if limit > self.painted_until:
+            painter = QPainter(self.pixmap)
+            painter.setFont(QFont("Arial", 10))
+            self.paint_segments(painter, max(self.painted_until, self.view_start), limit)
+            painter.end()
+            self.painted_until = limit
+
         painter = QPainter(self)
         painter.setFont(QFont("Arial", 10))
-        width = self.width()
+        painter.drawPixmap(0, 0, self.pixmap)
+        self.paint_time_markers(painter)
+
+    def row_bands(self):
+        """Return (bands, band height) for the current height.
+
+        Each row gets a band of its own, with a 5 pixel gap below it.
+        Once that leaves no room, ``bands`` is the pixel height and every row
+        is drawn as the one-pixel line it falls on, without labels.
+        """
+        rows = max(1, self.row_count)
+        row_height = self.height() // rows
+        if row_height > 5:
+            return rows, row_height
+        return self.height(), 1
+
+    def band_of(self, row, bands):
+        return row if bands == self.row_count else row * bands // self.row_count
+
+    def paint_segments(self, painter, t0, t1):
+        """Paint the segments overlapping [t0, t1), clipped to ``until``."""
+        spans = []  # (lane, first, last) segment ranges
+        visible = 0
+        for lane, timeline in enumerate(self.lanes):
+            first = bisect_right(timeline.end, t0)
+            last = bisect_left(timeline.start, t1)
+            if first < last:
+                spans.append((lane, first, last))
+            # Choose the level of detail from the whole view, so strips painted separately match
+            visible = max(visible, bisect_left(timeline.start, self.view_end) - bisect_right(timeline.end, self.view_start))
+        if not spans:
+            return
+        bands, band_height = self.row_bands()
+        if visible > self.width():
+            self.paint_coverage(painter, spans, bands, band_height)
+            return
+
+        time_scale = self.time_scale
+        labels = band_height > 1
+        for lane, first, last in spans:
+            timeline = self.lanes[lane]
+            for i in range(first, last):
+                pid, start, end = timeline.pid[i], timeline.start[i], min(timeline.end[i], self.until)
+                band = self.band_of(lane if self.by_core else self.rows[pid], bands)
+                y = band * band_height
+                x_start = (start - self.view_start) * time_scale
+                x_width = (end - start) * time_scale
+                # Core rows mix processes, so those are told apart by colour
+                color = GANTT_COLORS[(pid if self.by_core else band) % len(GANTT_COLORS)]
+                painter.fillRect(int(x_start), y, int(x_width), band_height - 5 if labels else 1, color)
+                if labels:
+                    painter.drawText(int(x_start) + 5, y + band_height // 2, f"P{pid}")
+
+    def paint_coverage(self, painter, spans, bands, band_height):
+        """Paint the (lane, first, last) segment ranges, more than one per pixel column, as the columns each band covers."""
+        width, time_scale = self.width(), self.time_scale
+        pieces = []
+        for lane, first, last in spans:
+            pid, start, end = (column[first:last] for column in self.lanes[lane].arrays())
+            rows = np.full(len(pid), lane) if self.by_core else np.searchsorted(self.pid_array, pid)
+            pieces.append((rows, start, end))
+        rows, start, end = (np.concatenate(column) for column in zip(*pieces))
+        band = self.band_of(rows, bands)
+        x0 = np.clip(np.floor((start - self.view_start) * time_scale), 0, width - 1).astype(np.int64)
+        x1 = np.clip(np.ceil((np.minimum(end, self.until) - self.view_start) * time_scale), 0, width).astype(np.int64)
+        x1 = np.maximum(x1, x0 + 1)  # Every segment covers at least one pixel column
+
+        # Count the segments over each (band, column) from +1/-1 edges, then draw the covered pixels as an image
+        stride = width + 1
+        size = bands * stride
+        edges = np.bincount(band * stride + x0, minlength=size) - np.bincount(band * stride + x1, minlength=size)
+        covered = (np.cumsum(edges.reshape(bands, stride), axis=1) > 0)[:, :width]
+        image = np.zeros((self.height(), width), dtype=np.uint32)  # Transparent where nothing runs
+        for band in np.flatnonzero(covered.any(axis=1)).tolist():
+            y = band * band_height
+            color = GANTT_COLORS[band % len(GANTT_COLORS)].rgba()
+            image[y:y + max(1, band_height - 5), covered[band]] = color
+        painter.drawImage(0, 0, QImage(image.data, width, image.shape[0], width * 4, QImage.Format_ARGB32))
+
+    def paint_time_markers(self, painter):
+        # Label every tick only while the labels fit; otherwise every 2, 5, 10, 20, 50... ticks
+        time_scale = self.time_scale
+        label_width = painter.fontMetrics().horizontalAdvance(str(self.max_time)) + self.LABEL_SPACING
+        step = 1
+        while step * time_scale < label_width:
+            step = step * 5 // 2 if str(step)[0] == "2" else step * 2
         height = self.height()
-        row_height = height // max(1, len(self.processes))
-        time_scale = width / max(1, self.max_time)
+        first = -(-int(self.view_start) // step) * step
+        for t in range(first, int(min(self.max_time, self.view_end)) + 1, step):
+            x = (t - self.view_start) * time_scale
+            painter.drawLine(int(x), 0, int(x), height)
+            painter.drawText(int(x), height - 15, str(t))
 
-        painter.fillRect(self.rect(), QColor(255, 255, 255))
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        full_span = max(1, self.max_time)
+        span = min(full_span, max(self.MIN_SPAN, self.view_span * 0.8 ** steps))
+        if span == self.view_span:
+            return
+        # Keep the time under the cursor in place
+        anchor = event.pos().x() / self.width()
+        time = self.view_start + anchor * self.view_span
+        self.view_span = span
+        self.view_start = min(max(0, time - anchor * span), full_span - span)
+        self.invalidate()
+
+    def mousePressEvent(self, event):
+        self.drag_x = event.pos().x()
+
+    def mouseMoveEvent(self, event):
+        if self.drag_x is not None:
+            dx = event.pos().x() - self.drag_x
+            self.drag_x = event.pos().x()
+            self.pan(dx)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.view_start = 0
+        self.view_span = max(1, self.max_time)
+        self.invalidate()
+
+    def pan(self, dx):
+        """Move the view ``dx`` pixels to the left (content to the right), reusing the pixmap."""
+        full_span = max(1, self.max_time)
+        start = min(max(0, self.view_start - dx / self.time_scale), full_span - self.view_span)
+        dx = round((self.view_start - start) * self.time_scale)
+        if dx == 0:
+            return
+        old_start = self.view_start
+        self.view_start -= dx / self.time_scale
+        if self.pixmap is None or abs(dx) >= self.width():
+            self.invalidate()
+            return
 
-        colors = [QColor(255, 100, 100), QColor(100, 255, 100), 
-                QColor(100, 100, 255), QColor(255, 255, 100), 
-                QColor(255, 100, 255)]
+        pixmap = QPixmap(self.size())
+        pixmap.fill(QColor(255, 255, 255))
+        painter = QPainter(pixmap)
+        painter.setFont(QFont("Arial", 10))
+        painter.drawPixmap(dx, 0, self.pixmap)
+        if dx > 0:
+            # Newly exposed strip on the left; the part right of it is already painted
+            painter.setClipRect(0, 0, dx, self.height())
+            self.paint_segments(painter, self.view_start, min(old_start, self.until))
+            self.painted_until = min(self.painted_until, self.view_end)
+        # Anything newly exposed on the right lies past painted_until and is painted in paintEvent
+        painter.end()
+        self.pixmap = pixmap
+        self.update()
+
+class ProcessTableModel(QAbstractTableModel):
+    """Inputs and live results of every process, one row each, for a QTableView.
+
+    Everything is kept in plain per-column lists, so the view only builds
+    what it shows for the rows on screen, and a frame's changes are reported
+    as one dataChanged range.
+    """
+
+    HEADERS = ["Priority", "Processes", "AT", "BT", "Status Bar", "CT", "TAT", "WT"]
+    PRIORITY, PROCESS, AT, BT, STATUS, CT, TAT, WT = range(len(HEADERS))
+    INPUT_RANGES = {PRIORITY: (-20, 100), AT: (0, 100), BT: (1, 1000)}
+
+    def __init__(self, count):
+        super().__init__()
+        self.load([(i + 1, 0, 1, 0) for i in range(count)])
+
+    def load(self, processes):
+        """Replace every row with (pid, at, bt[, priority]) tuples in one reset."""
+        self.beginResetModel()
+        self.pid = [row[0] for row in processes]
+        self.at = [row[1] for row in processes]
+        self.bt = [row[2] for row in processes]
+        self.priority = [row[3] if len(row) > 3 else 0 for row in processes]
+        self.inputs = {self.PRIORITY: self.priority, self.AT: self.at, self.BT: self.bt}
+        self.reset_results()
+        self.endResetModel()
+
+    def reset_results(self):
+        count = len(self.pid)
+        self.executed = [0] * count
+        self.last_run = [0] * count  # Shown as CT until the process completes
+        self.completed = [False] * count
+        self.metrics = None
+
+    def clear_results(self, metrics=None):
+        self.reset_results()
+        self.metrics = metrics
+        self.results_changed(0, len(self.pid) - 1)
+
+    def apply_frame(self, frame, completed):
+        """Take the progress of a FrameCursor frame; ``completed`` is the cursor's completion flags."""
+        if not frame.progressed and not frame.completed:
+            return
+        for row, executed, last_run in frame.progressed:
+            self.executed[row] = executed
+            self.last_run[row] = last_run
+        self.completed = completed
+        rows = [change[0] for change in frame.progressed] + frame.completed
+        self.results_changed(min(rows), max(rows))
+
+    def results_changed(self, first, last):
+        if first <= last:
+            self.dataChanged.emit(self.index(first, self.STATUS), self.index(last, self.WT))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.pid)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in self.inputs:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        row, column = index.row(), index.column()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if column in self.inputs:
+            return self.inputs[column][row]
+        if column == self.PROCESS:
+            return f"P{self.pid[row]}"
+        if column == self.STATUS:
+            bt = self.bt[row]
+            return min(int(self.executed[row] / bt * 100), 100) if bt > 0 else 0
+        if self.completed[row]:
+            column = {self.CT: self.metrics.ct, self.TAT: self.metrics.tat, self.WT: self.metrics.wt}[column]
+            return int(column[row])
+        return self.last_run[row] if column == self.CT else 0
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() not in self.inputs:
+            return False
+        self.inputs[index.column()][index.row()] = int(value)
+        self.dataChanged.emit(index, index)
+        return True
+
+
+class InputDelegate(QStyledItemDelegate):
+    """Draws the priority, AT and BT columns as input boxes and edits them with range-limited spin boxes."""
+
+    def paint(self, painter, option, index):
+        if index.column() not in ProcessTableModel.INPUT_RANGES:
+            super().paint(painter, option, index)
+            return
+        rect = option.rect.adjusted(2, 3, -2, -3)
+        painter.fillRect(rect, Qt.white)
+        painter.setPen(Qt.black)
+        painter.drawText(rect, Qt.AlignCenter, str(index.data()))
+
+    def createEditor(self, parent, option, index):
+        if index.column() not in ProcessTableModel.INPUT_RANGES:
+            return None
+        low, high = ProcessTableModel.INPUT_RANGES[index.column()]
+        value = index.data(Qt.EditRole)
+        if value > QT_INT_MAX:
+            return None  # Too large for a spin box; left read-only rather than clamped
+        editor = QSpinBox(parent)
+        # Loaded workloads may exceed the usual range; never clamp their values just by opening an editor
+        editor.setRange(low, max(high, value))
+        editor.setAlignment(Qt.AlignCenter)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setValue(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value())
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Draws the status column as a progress bar, without a widget per row."""
+
+    CHUNK_COLOR = QColor(255, 165, 0)
+
+    def paint(self, painter, option, index):
+        progress = index.data()
+        rect = option.rect.adjusted(2, 3, -2, -3)
+        painter.fillRect(rect, Qt.white)
+        chunk = rect.adjusted(0, 0, -rect.width() + rect.width() * progress // 100, 0)
+        painter.fillRect(chunk, self.CHUNK_COLOR)
+        painter.setPen(Qt.black)
+        painter.drawText(rect, Qt.AlignCenter, f"{progress}%")
 
-        # Draw each segment in the current timeline
-        for pid, start, end in self.timeline:
-            row = self.processes.index(pid)
-            y = row * row_height
-            x_start = start * time_scale
-            x_width = (end - start) * time_scale
-            color = colors[row % len(colors)]
-            painter.fillRect(int(x_start), y, int(x_width), row_height - 5, color)
-            painter.drawText(int(x_start) + 5, y + row_height // 2, f"P{pid}")
-
-        # Draw time markers
-        for t in range(self.max_time + 1):
-            x = t * time_scale
-            painter.drawLine(int(x), 0, int(x), height)
-            painter.drawText(int(x), height - 15, str(t))
 
 class InnerWindow(QMainWindow):
-    def __init__(self, algorithm_choice, process_quantity, is_preemptive, time_quantum):
+    def __init__(self, algorithm_choice, process_quantity, is_preemptive, time_quantum, cores=1,
+                 target_latency=6, min_granularity=1):
         super().__init__()
         self.algorithm_choice = algorithm_choice
         self.process_quantity = process_quantity
         self.is_preemptive = is_preemptive
         self.time_quantum = time_quantum
+        self.cores = cores
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
         self.processes = []
         self.initUI()
     
@@ -92,8 +444,13 @@ class InnerWindow(QMainWindow):
         self.layout.addLayout(self.subMainLayout3)
         self.layout.addLayout(self.subMainLayout4)
 
+        # The simulation clock advances at the chosen speed; the timer only decides how often it is shown
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_execution)
+        self.timer.timeout.connect(self.play_frame)
+        self.elapsed = QElapsedTimer()
+        self.clock = 0.0
+        self.current_time = self.max_time = 0
+        self.finished = True  # Nothing compiled yet
         self.is_paused = False
 
     def setup_averages_section(self):
@@ -107,6 +464,10 @@ class InnerWindow(QMainWindow):
         if self.algorithm_choice == "Round Robin (RR)":
             time_quantum_layout, self.timeQuantum_value = self.create_metric_layout("Time Quantum: ", str(self.time_quantum))
             self.metrics_layout.addLayout(time_quantum_layout)
+        elif self.algorithm_choice == "Completely Fair Scheduler (CFS)":
+            latency_layout, self.targetLatency_value = self.create_metric_layout(
+                "Target Latency: ", f"{self.target_latency} (min slice {self.min_granularity})")
+            self.metrics_layout.addLayout(latency_layout)
 
         waiting_time_layout, self.avgWtTime = self.create_metric_layout("Average Waiting Time: ", "0", spacing=40)
         turnaround_time_layout, self.avgTaTime = self.create_metric_layout("Average Turnaround Time: ", "0")
@@ -117,17 +478,34 @@ class InnerWindow(QMainWindow):
         self.metrics_layout.addLayout(total_exec_time_layout)
         self.metrics_layout.addStretch()
 
+        # Middle: capacity metrics of the finished schedule
+        self.performance_layout = QVBoxLayout()
+        self.performance_layout.setSpacing(0)  # Five rows in the height of the left column's four
+        utilization_layout, self.utilization = self.create_metric_layout("CPU Utilization: ", "0", spacing=12)
+        throughput_layout, self.throughput = self.create_metric_layout("Throughput: ", "0", spacing=50)
+        response_time_layout, self.avgResponseTime = self.create_metric_layout("Avg Response Time: ", "0")
+        switches_layout, self.contextSwitches = self.create_metric_layout("Context Switches: ", "0", spacing=5)
+        max_wt_layout, self.maxWtTime = self.create_metric_layout("Max Waiting Time: ", "0", spacing=2)
+
+        self.performance_layout.addLayout(utilization_layout)
+        self.performance_layout.addLayout(throughput_layout)
+        self.performance_layout.addLayout(response_time_layout)
+        self.performance_layout.addLayout(switches_layout)
+        self.performance_layout.addLayout(max_wt_layout)
+        self.performance_layout.addStretch()
+
         # Right side: Pause and Resume buttons (horizontal)
         self.button_layout = QHBoxLayout()
         self.pause_btn = self.create_styled_button("Pause", self.pause_simulation)
         self.resume_btn = self.create_styled_button("Resume", self.resume_simulation)
         
         self.button_layout.addStretch()
-        self.button_layout.addSpacing(355)
         self.button_layout.addWidget(self.pause_btn)
         self.button_layout.addWidget(self.resume_btn)
 
         self.average_layout.addLayout(self.metrics_layout)
+        self.average_layout.addSpacing(10)
+        self.average_layout.addLayout(self.performance_layout)
         self.average_layout.addStretch()
         self.average_layout.addLayout(self.button_layout)
 
@@ -139,39 +517,34 @@ class InnerWindow(QMainWindow):
             self.is_paused = True
             self.cpu_label.setText(" Paused ")
 
-            completed_count = sum(1 for process in self.processes_data if process["completed"])
-            total_wt = 0
-            total_tat = 0
-            for process in self.processes_data:
-                if process["completed"]:
-                    total_wt += int(process["waiting_time"].text())
-                    total_tat += int(process["tat"].text())
-
-            avg_wt = total_wt / completed_count if completed_count > 0 else 0
-            avg_tat = total_tat / completed_count if completed_count > 0 else 0
+            completed_count = sum(self.completed)
+            avg_wt, avg_tat = self.result.averages(self.completed)
 
-            message = f"Simulation paused.\nProcesses completed: {completed_count}/{self.process_quantity}\n"
+            message = f"Simulation paused.\nProcesses completed: {completed_count}/{len(self.processes)}\n"
             message += f"Avg Waiting Time (completed processes): {avg_wt:.2f}\n"
             message += f"Avg Turnaround Time (completed processes): {avg_tat:.2f}"
             QMessageBox.information(self, "Pause", message)
 
     def resume_simulation(self):
         if self.is_paused and not self.timer.isActive():
-            self.timer.start(100)
+            self.start_playback()
             self.is_paused = False
-            current_pid = self.find_current_process()
-            self.cpu_label.setText(f" P{current_pid} " if current_pid else " Idle ")
+            self.show_running(self.frames.index.cores_at(self.current_time))
 
     def setup_window_basics(self):
         self.setWindowTitle("Algorithm Execution")
         # Replace setGeometry with setFixedSize to prevent resizing
         self.setFixedSize(900, 700)  # Enforce strict size of 900x700 pixels
         self.centralWidget = QWidget(self)
+        self.centralWidget.setObjectName("central")
         self.setCentralWidget(self.centralWidget)
+        # Scoped to the central widget: inherited by every child, the image was decoded once per widget
         self.centralWidget.setStyleSheet("""
-            background-image: url('src/photo.jpeg');
-            background-repeat: no-repeat;
-            background-position: center;
+            #central {
+                background-image: url('src/photo.jpeg');
+                background-repeat: no-repeat;
+                background-position: center;
+            }
         """)
 
     def setup_top_section(self):
@@ -187,10 +560,12 @@ class InnerWindow(QMainWindow):
         self.label.setStyleSheet("color: yellow; background: transparent;")
         self.algo_Layout.addWidget(self.label)
 
-        if self.algorithm_choice == "Round Robin (RR)":
+        if self.algorithm_choice in ["Round Robin (RR)", "Completely Fair Scheduler (CFS)"]:
             self.is_preemptive = True
 
         algo_text = f"{self.algorithm_choice}{' (Preemptive)' if self.is_preemptive else ' (Non-Preemptive)'}"
+        if self.cores > 1:
+            algo_text += f" on {self.cores} Cores"
         self.algo_label = QLabel(algo_text)
         font = QFont()
         font.setPointSize(12)
@@ -201,7 +576,7 @@ class InnerWindow(QMainWindow):
         self.algo_Layout.addStretch()
 
         self.cpu_Layout = QHBoxLayout()
-        self.label = QLabel("CPU:")
+        self.label = QLabel("CPU:" if self.cores == 1 else "CPUs:")
         font = QFont()
         font.setPointSize(12)
         font.setBold(True)
@@ -226,37 +601,47 @@ class InnerWindow(QMainWindow):
         self.subMainLayout1.addLayout(self.top_Layout)
 
     def setup_process_table(self):
-        self.processTableLayout = QHBoxLayout()
-        self.processTableContent = QVBoxLayout()
-
-        self.heading = QVBoxLayout()
-        self.column = QHBoxLayout()
-
-        headers = ["Priority", "Processes", "AT", "BT", "Status Bar", "CT", "TAT", "WT"]
-        for title in headers:
-            label = QLabel(title)
-            font = QFont()
-            font.setPointSize(13)
-            font.setBold(True)
-            label.setFont(font)
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("color: yellow; background: transparent;")
-            label.setFixedWidth(90 if title in ["Priority", "AT", "BT"] else 110)
-            self.column.addWidget(label)
-
-        self.heading.addLayout(self.column)
-        self.processTableContent.addLayout(self.heading)
-
-        self.content = QVBoxLayout()
-        self.processes_data = []
-
-        for i in range(1, self.process_quantity + 1):
-            process_row = self.create_process_row(i)
-            self.content.addLayout(process_row)
-
-        self.processTableContent.addLayout(self.content)
-        self.processTableLayout.addLayout(self.processTableContent)
-        self.subMainLayout2.addLayout(self.processTableLayout)
+        self.process_model = ProcessTableModel(self.process_quantity)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
+        self.process_table.setItemDelegate(InputDelegate(self.process_table))
+        self.process_table.setItemDelegateForColumn(ProcessTableModel.STATUS, ProgressDelegate(self.process_table))
+        self.process_table.setFont(QFont("Arial", 13))
+        self.process_table.setStyleSheet(
+            "QTableView { color: white; background: transparent; gridline-color: transparent; border: none; }"
+            "QHeaderView, QHeaderView::section { color: yellow; background: transparent; border: none; font: bold 13pt; }"
+        )
+        self.process_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed |
+                                           QAbstractItemView.AnyKeyPressed)
+        self.process_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.process_table.setFixedHeight(220)
+
+        # Fixed row heights and column widths let the view place rows without measuring them
+        self.process_table.verticalHeader().hide()
+        self.process_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.process_table.verticalHeader().setDefaultSectionSize(36)
+        header = self.process_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        for column, title in enumerate(ProcessTableModel.HEADERS):
+            header.resizeSection(column, 90 if title in ["Priority", "AT", "BT"] else 110)
+
+        self.subMainLayout2.addWidget(self.process_table)
+
+    def load_workload(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Workload", "", "Workloads (*.csv *.bin);;All Files (*)")
+        if not path:
+            return
+        try:
+            processes = read_workload(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Load Workload", str(error))
+            return
+        if not processes or len(processes) > MAX_PROCESSES:
+            QMessageBox.warning(self, "Load Workload", f"A workload must have 1 to {MAX_PROCESSES} processes.")
+            return
+        self.timer.stop()
+        self.process_model.load(processes)
+        self.process_quantity = len(processes)
 
     def create_spin_box(self, min_val, max_val, value, width, height, font_size=13):
         spin_box = QSpinBox()
@@ -277,57 +662,6 @@ class InnerWindow(QMainWindow):
         label.setFixedWidth(width)
         return label
 
-    def create_progress_bar(self, width, height):
-        status_bar = QProgressBar()
-        status_bar.setMaximum(100)
-        status_bar.setValue(0)
-        status_bar.setStyleSheet("QProgressBar { background-color: white; } QProgressBar::chunk { background-color: orange; }")
-        status_bar.setFixedWidth(width)
-        status_bar.setFixedHeight(height)
-        status_bar.setAlignment(Qt.AlignCenter)
-        return status_bar
-
-    def create_process_row(self, i):
-        process_row = QHBoxLayout()
-
-        priority_input = self.create_spin_box(0, 100, 0, 90, 30)
-        process_row.addWidget(priority_input)
-
-        process_label = self.create_label(f"P{i}", 110)
-        process_row.addWidget(process_label)
-
-        at_input = self.create_spin_box(0, 100, 0, 90, 30)
-        process_row.addWidget(at_input)
-
-        bt_input = self.create_spin_box(1, 1000, 0, 90, 30)
-        process_row.addWidget(bt_input)
-
-        status_bar = self.create_progress_bar(110, 30)
-        process_row.addWidget(status_bar)
-
-        ct_label = self.create_label("0", 110)
-        tat_label = self.create_label("0", 110)
-        waiting_time_label = self.create_label("0", 110)
-        process_row.addWidget(ct_label)
-        process_row.addWidget(tat_label)
-        process_row.addWidget(waiting_time_label)
-
-        self.processes_data.append({
-            "priority": priority_input,
-            "at": at_input,
-            "bt": bt_input,
-            "status_bar": status_bar,
-            "ct": ct_label,
-            "tat": tat_label,
-            "waiting_time": waiting_time_label,
-            "remaining_bt": 0,
-            "current_ct": 0,
-            "slices": [],
-            "completed": False
-        })
-
-        return process_row
-
     def setup_gantt_chart(self):
         self.gantt_label = QLabel("Gantt Chart:")
         font = QFont()
@@ -338,11 +672,24 @@ class InnerWindow(QMainWindow):
         self.gantt_label.setStyleSheet("color: yellow; background: transparent;")
         self.subMainLayout2_5.addWidget(self.gantt_label)
 
-        self.gantt_widget = GanttChart([], [], 0)
+        self.gantt_widget = GanttChart(Timeline(), [], 0)
         # Set a fixed size for the Gantt chart to prevent it from resizing
         self.gantt_widget.setFixedSize(860, 120)  # Slightly less than window width to account for margins
         self.subMainLayout2_5.addWidget(self.gantt_widget)
 
+        # Playback: speed in time units per second, seeking to any time and skipping to the end
+        playback_layout = QHBoxLayout()
+        playback_layout.addWidget(self.create_label("Speed (units/s):", 130, 10))
+        self.speed_input = self.create_spin_box(1, 1000000, DEFAULT_SPEED, 90, 25, 10)
+        playback_layout.addWidget(self.speed_input)
+        self.seek_slider = QSlider(Qt.Horizontal)
+        self.seek_slider.setRange(0, 0)
+        self.seek_slider.valueChanged.connect(lambda position: self.seek_to(self.slider_time(position)))
+        playback_layout.addWidget(self.seek_slider)
+        self.fast_forward_btn = self.create_styled_button("Skip to End", self.fast_forward)
+        playback_layout.addWidget(self.fast_forward_btn)
+        self.subMainLayout2_5.addLayout(playback_layout)
+
     def create_metric_layout(self, label_text, value_text, spacing=0):
         layout = QHBoxLayout()
         label = QLabel(label_text)
@@ -360,7 +707,7 @@ class InnerWindow(QMainWindow):
         font = QFont("Arial", 12)
         value_label.setFont(font)
         value_label.setAlignment(Qt.AlignLeft)
-        value_label.setStyleSheet("color: white; background: transparent;" if label_text != "Time Quantum: " else "color: white; background: black;")
+        value_label.setStyleSheet("color: white; background: transparent;" if label_text not in ["Time Quantum: ", "Target Latency: "] else "color: white; background: black;")
         layout.addWidget(value_label)
         layout.addStretch()
         return layout, value_label
@@ -408,6 +755,9 @@ class InnerWindow(QMainWindow):
         self.subMainLayout4.addWidget(self.readyQueueContainer)
         self.subMainLayout4.addStretch()
 
+        self.load_btn = self.create_styled_button("Load", self.load_workload)
+        self.subMainLayout4.addWidget(self.load_btn)
+
         self.compile_btn = self.create_styled_button("Compile", self.compileSimulation)
         self.subMainLayout4.addWidget(self.compile_btn)
 
@@ -423,62 +773,87 @@ class InnerWindow(QMainWindow):
         self.close()
 
     def get_scheduler(self):
+        if self.cores > 1:
+            policies = {
+                "First Come First Serve (FCFS)": "fcfs",
+                "Shortest Job First (SJF)": "sjf",
+                "Round Robin (RR)": "rr",
+                "Priority Scheduling": "priority",
+            }
+            return SMP(self.processes, self.cores, policies[self.algorithm_choice], self.is_preemptive, self.time_quantum)
         schedulers = {
-            "First Come First Serve (FCFS)": lambda: FCFS([(pid, at, bt) for pid, at, bt, _ in self.processes]),
-            "Shortest Job First (SJF)": lambda: SJF([(pid, at, bt) for pid, at, bt, _ in self.processes], self.is_preemptive),
-            "Round Robin (RR)": lambda: RoundRobin([(pid, at, bt) for pid, at, bt, _ in self.processes], self.time_quantum),
-            "Priority Scheduling": lambda: PriorityScheduling(self.processes, self.is_preemptive)
+            "First Come First Serve (FCFS)": lambda: FCFS(self.processes),
+            "Shortest Job First (SJF)": lambda: SJF(self.processes, self.is_preemptive),
+            "Round Robin (RR)": lambda: RoundRobin(self.processes, self.time_quantum),
+            "Priority Scheduling": lambda: PriorityScheduling(self.processes, self.is_preemptive),
+            "Completely Fair Scheduler (CFS)": lambda: CFS(self.processes, self.target_latency, self.min_granularity)
         }
         return schedulers[self.algorithm_choice]()
 
     def initialize_processes(self):
-        self.processes = []
-        for i, process in enumerate(self.processes_data):
-            pid = i + 1
-            at = process["at"].value()
-            bt = process["bt"].value()
-            priority = process["priority"].value() if self.algorithm_choice == "Priority Scheduling" else 0
-            self.processes.append((pid, at, bt, priority))
-            
-            process["remaining_bt"] = bt
-            process["current_ct"] = 0
-            process["slices"] = []
-            process["completed"] = False
-            process["status_bar"].setValue(0)
-            process["ct"].setText("0")
-            process["tat"].setText("0")
-            process["waiting_time"].setText("0")
-
-        self.avgWtTime.setText("0")
-        self.avgTaTime.setText("0")
+        # Row i of the table is self.processes[i]; the model keeps the inputs, these records the numbers
+        model = self.process_model
+        # CFS reads the priority column as nice values
+        use_priority = self.algorithm_choice in ["Priority Scheduling", "Completely Fair Scheduler (CFS)"]
+        self.processes = [Process(pid, at, bt, priority if use_priority else 0)
+                          for pid, at, bt, priority in zip(model.pid, model.at, model.bt, model.priority)]
+        self.completed = [False] * len(self.processes)
+
+    def clear_results(self):
+        self.process_model.clear_results(self.result.metrics)
+        self.clear_averages()
+
+    def clear_averages(self):
         self.totalExecTime.setText("0")
+        for label in [self.avgWtTime, self.avgTaTime, self.utilization, self.throughput, self.avgResponseTime, self.contextSwitches, self.maxWtTime]:
+            label.setText("0")
+            label.setToolTip("")
 
-    def update_timeline_and_gantt(self):
-        self.all_processes = sorted(set(pid for pid, _, _ in self.timeline))
-        for pid, start, end in self.timeline:
-            self.processes_data[pid - 1]["slices"].append((start, end))
+    def update_timeline_and_gantt(self, timeline):
+        # Index the schedule once; each tick then only applies what changed in its frame
+        self.timeline = timeline
+        self.max_time = timeline.makespan
+        self.all_processes = sorted(set(timeline.pid))
+        lanes = getattr(self.result, "lanes", None)  # One timeline per core (SMPResult)
+        self.frames = FrameCursor(FrameIndex(timeline, self.processes, self.result.metrics.ct, lanes))
 
         self.current_time = 0
-        self.max_time = max(end for _, _, end in self.timeline) if self.timeline else 0
-        self.current_timeline = []
-
-        self.gantt_widget.processes = self.all_processes
-        self.gantt_widget.timeline = self.current_timeline
-        self.gantt_widget.max_time = self.max_time
-        self.gantt_widget.update()
+        self.finished = False
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setRange(0, min(self.max_time, SEEK_STEPS))
+        self.seek_slider.setValue(0)
+        self.seek_slider.blockSignals(False)
+
+        self.gantt_widget.set_schedule(self.timeline, self.all_processes, self.max_time, lanes)
+
+    def incremental_schedule(self, scheduler, old_processes, old_result):
+        """Return a callable rescheduling only from the earliest edited arrival, or None to run in full."""
+        if old_result is None or not hasattr(scheduler, "reschedule"):
+            return None
+        try:
+            since = earliest_change(old_processes, self.processes)
+        except ValueError:
+            return None  # A different workload was loaded
+        if since is None:
+            return None
+        return lambda: ScheduleResult.from_timeline(scheduler.reschedule(old_result.timeline, since), self.processes)
 
     def compileSimulation(self):
+        old_processes, old_result = self.processes, getattr(self, "result", None)
         self.initialize_processes()
         scheduler = self.get_scheduler()
-        self.timeline = scheduler.calculate_completion_time()
-        self.update_timeline_and_gantt()
+        self.result = SCHEDULE_CACHE.schedule(scheduler, self.incremental_schedule(scheduler, old_processes, old_result))
+        self.clear_results()
+        self.statusBar().showMessage(f"Schedule cache: {SCHEDULE_CACHE.stats}")
+        self.update_timeline_and_gantt(self.result.timeline)
         self.is_paused = False
-        self.timer.start(100)
+        self.start_playback()
 
     def check_simulation_completion(self):
         if self.current_time >= self.max_time:
             self.timer.stop()
             self.is_paused = False
+            self.finished = True
             self.calculate_averages()
             self.cpu_label.setText(" Idle ")
             self.ready_queue_display.setText("Empty")
@@ -486,119 +861,121 @@ class InnerWindow(QMainWindow):
             return True
         return False
 
-    def find_current_process(self):
-        for pid, start, end in self.timeline:
-            if start <= self.current_time < end:
-                return pid
-        return None
-
-    def can_add_to_ready_queue(self, process, pid, current_pid, current_time):
-        at = process["at"].value()
-        bt = process["bt"].value()
-        executed_time = sum(end - start for start, end in process["slices"] if end <= current_time + 1)
-        remaining_time = bt - executed_time
-        return (at <= current_time and not process["completed"] and 
-                pid != current_pid and remaining_time > 0)
-
-    def update_ready_queue(self, current_pid):
-        ready_queue = []
-        for i, process in enumerate(self.processes_data):
-            pid = i + 1
-            if self.can_add_to_ready_queue(process, pid, current_pid, self.current_time):
-                ready_queue.append((pid, process["at"].value()))
-
-        ready_queue.sort(key=lambda x: x[1])
-        display_text = " ".join(f"P{pid}" for pid, _ in ready_queue) if ready_queue else "Empty"
+    def update_ready_queue(self, ready):
+        display_text = " ".join(f"P{pid}" for pid in ready[:READY_QUEUE_LIMIT]) if ready else "Empty"
+        if len(ready) > READY_QUEUE_LIMIT:
+            display_text += f" (+{len(ready) - READY_QUEUE_LIMIT})"
         self.ready_queue_display.setText(display_text)
 
-    def calculate_executed_time(self, process):
-        executed_time = 0
-        for start, end in process["slices"]:
-            if end <= self.current_time + 1:
-                executed_time += end - start
-            elif start <= self.current_time < end:
-                executed_time += (self.current_time + 1) - start
-        return executed_time
-
-    def update_process_on_completion(self, process, pid, total_bt):
-        process["completed"] = True
-        final_ct = max(end for _, end in process["slices"]) if process["slices"] else 0
-        process["ct"].setText(str(final_ct))
-        tat = calculate_turnaround_time(process["at"].value(), final_ct)
-        wt = calculate_waiting_time(tat, total_bt)
-        process["tat"].setText(str(tat))
-        process["waiting_time"].setText(str(wt))
-
-    def update_process_status(self):
-        current_pid = self.find_current_process()
-
-        for i, process in enumerate(self.processes_data):
-            if process["completed"]:
-                continue
-
-            total_bt = process["bt"].value()
-            executed_time = self.calculate_executed_time(process)
-            progress = (executed_time / total_bt) * 100 if total_bt > 0 else 0
-            process["status_bar"].setValue(min(int(progress), 100))
-            process["current_ct"] = executed_time
-
-            pid = i + 1
-            if pid == current_pid and not process["completed"]:
-                current_ct = self.current_time + 1
-                process["ct"].setText(str(current_ct))
-
-            if executed_time >= total_bt and not process["completed"]:
-                self.update_process_on_completion(process, pid, total_bt)
+    def update_process_status(self, frame):
+        # Only rows whose executed time changed since the last frame are repainted
+        self.completed = self.frames.completed
+        self.process_model.apply_frame(frame, self.completed)
 
     def update_gantt_chart(self):
-        self.current_timeline = []
-        for pid, start, end in self.timeline:
-            if start <= self.current_time:
-                effective_end = min(end, self.current_time + 1)
-                self.current_timeline.append((pid, start, effective_end))
-            if end <= self.current_time + 1:
-                continue
-
-        self.gantt_widget.timeline = self.current_timeline
-        self.gantt_widget.max_time = self.max_time
-        self.gantt_widget.update()
-
-    def update_execution(self):
-        if self.check_simulation_completion():
-            return
+        self.gantt_widget.set_until(self.current_time)
 
-        current_pid = self.find_current_process()
-        if current_pid is not None:
-            self.cpu_label.setText(f" P{current_pid} ")
-        else:
+    def show_running(self, cores):
+        if len(cores) == 1:
+            self.cpu_label.setText(f" P{cores[0]} " if cores[0] is not None else " Idle ")
+            return
+        busy = [f"P{pid}" for pid in cores if pid is not None]
+        if not busy:
             self.cpu_label.setText(" Idle ")
-
-        self.update_ready_queue(current_pid)
-        self.update_process_status()
+            return
+        text = " ".join(busy[:CORE_LABEL_LIMIT])
+        if len(busy) > CORE_LABEL_LIMIT:
+            text += f" (+{len(busy) - CORE_LABEL_LIMIT})"
+        self.cpu_label.setText(f" {len(busy)}/{len(cores)} busy: {text} ")
+
+    def show_frame(self, frame):
+        self.show_running(frame.cores)
+
+        if frame.ready is not None:
+            self.update_ready_queue(frame.ready)
+        self.update_process_status(frame)
+
+    def seek(self, time):
+        """Show the state after ``time`` time units; costs about the same however far it jumps."""
+        time = min(max(0, time), self.max_time)
+        if time == 0:
+            self.frames = FrameCursor(self.frames.index)
+            self.completed = self.frames.completed
+            self.clear_results()
+            self.cpu_label.setText(" Idle ")
+            self.ready_queue_display.setText("Empty")
+        else:
+            self.show_frame(self.frames.frame(time - 1))
+        if time < self.max_time:
+            self.clear_averages()
+            self.finished = False
+
+        self.current_time = time
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setValue(self.slider_position(time))
+        self.seek_slider.blockSignals(False)
         self.update_gantt_chart()
 
-        self.current_time += 1
+    def slider_time(self, position):
+        """Return the time at a slider position; one position is one time unit unless the schedule is long."""
+        steps = self.seek_slider.maximum()
+        return position * self.max_time // steps if steps else 0
+
+    def slider_position(self, time):
+        steps = self.seek_slider.maximum()
+        return time * steps // self.max_time if self.max_time else 0
+
+    def seek_to(self, time):
+        # Moved by the user: restart the clock there, and let Resume continue a finished simulation
+        self.clock = time
+        self.seek(time)
+        if not self.timer.isActive():
+            self.is_paused = True
+
+    def fast_forward(self):
+        if not self.finished:
+            self.clock = self.max_time
+            self.seek(self.max_time)
+            self.check_simulation_completion()
+
+    def start_playback(self):
+        self.clock = self.current_time
+        self.elapsed.start()
+        self.timer.start(FRAME_INTERVAL)
+
+    def play_frame(self):
+        if self.check_simulation_completion():
+            return
+        self.clock += self.elapsed.restart() * self.speed_input.value() / 1000
+        if int(self.clock) > self.current_time:
+            self.seek(int(self.clock))
 
     def calculate_averages(self):
-        total_wt = 0
-        total_tat = 0
-        max_ct = 0
-        for i, process in enumerate(self.processes_data):
-            pid = i + 1
-            if not process["completed"]:
-                print(f"Warning: P{pid} did not complete!")
-                continue
-
-            final_ct = int(process["ct"].text())
-            total_wt += int(process["waiting_time"].text())
-            total_tat += int(process["tat"].text())
-            max_ct = max(max_ct, final_ct)
-
-        avg_wt = total_wt / self.process_quantity if self.process_quantity > 0 else 0
-        avg_tat = total_tat / self.process_quantity if self.process_quantity > 0 else 0
+        avg_wt, avg_tat = self.result.averages()
         self.avgWtTime.setText(f"{avg_wt:.2f}")
         self.avgTaTime.setText(f"{avg_tat:.2f}")
-        self.totalExecTime.setText(str(max_ct))
+        self.totalExecTime.setText(str(self.result.makespan))
+
+        performance = self.result.performance()
+        utilization = performance.core_utilization
+        if self.cores > 1:
+            self.utilization.setText(f"{performance.utilization:.0%} ({min(utilization):.0%}-{max(utilization):.0%})")
+            self.utilization.setToolTip("\n".join(f"CPU {core}: {value:.1%}" for core, value in enumerate(utilization))
+                                        + f"\nIdle: {performance.idle_time} core time units")
+        else:
+            self.utilization.setText(f"{performance.utilization:.0%} (idle {performance.idle_time})")
+        self.throughput.setText(f"{performance.throughput:.2f} (peak {performance.peak_throughput:.2f})")
+        self.throughput.setToolTip(f"Completions per time unit; the peak is the most within any "
+                                   f"{performance.throughput_window} time units")
+        self.avgResponseTime.setText(f"{performance.average_response_time:.2f}")
+        percentiles = {name: ", ".join(f"{key} {value}" for key, value in values.items())
+                       for name, values in performance.latency.percentiles().items()}
+        self.avgWtTime.setToolTip(f"Percentiles: {percentiles['wt']}")
+        self.avgTaTime.setToolTip(f"Percentiles: {percentiles['tat']}")
+        self.avgResponseTime.setToolTip(f"First dispatch minus arrival; longest {performance.max_response_time}\n"
+                                        f"Percentiles: {percentiles['response']}")
+        self.contextSwitches.setText(f"{performance.context_switches} ({performance.preemptions} preempt.)")
+        self.maxWtTime.setText(f"{performance.max_waiting_time} (var {performance.waiting_time_variance:.2f})")
 
 class CPUScheduler(QMainWindow):
     def __init__(self):
@@ -658,7 +1035,7 @@ class CPUScheduler(QMainWindow):
 
         self.comboBox = self.create_combo_box(
             ["First Come First Serve (FCFS)", "Shortest Job First (SJF)", 
-             "Priority Scheduling", "Round Robin (RR)"], 160, 40)
+             "Priority Scheduling", "Round Robin (RR)", "Completely Fair Scheduler (CFS)"], 160, 40)
         self.comboBox.currentIndexChanged.connect(self.updateUI)
         self.choice_layout.addWidget(self.comboBox)
 
@@ -671,16 +1048,25 @@ class CPUScheduler(QMainWindow):
         self.quantity_layout.addWidget(self.quantityLabel)
         self.quantity_layout.addSpacing(10)
 
-        self.quantitySpinBox = self.create_spin_box(1, 5, 1, 160, 35, font_size=10)
+        self.quantitySpinBox = self.create_spin_box(1, MAX_PROCESSES, 1, 160, 35, font_size=10)
         self.quantity_layout.addWidget(self.quantitySpinBox)
 
         self.testcase_layout = QHBoxLayout()
-        self.testcaseLabel = self.create_label("1 <= N <= 5", 10, 0)
+        self.testcaseLabel = self.create_label(f"1 <= N <= {MAX_PROCESSES}", 10, 0)
         self.testcase_layout.addStretch()
         self.testcase_layout.addWidget(self.testcaseLabel)
 
+        self.cores_layout = QHBoxLayout()
+        self.coresLabel = self.create_label("Cores:", 15, 140)
+        self.cores_layout.addWidget(self.coresLabel)
+        self.cores_layout.addSpacing(10)
+
+        self.coresSpinBox = self.create_spin_box(1, MAX_CORES, 1, 160, 35, font_size=10)
+        self.cores_layout.addWidget(self.coresSpinBox)
+
         self.fixed_container_layout.addLayout(self.quantity_layout)
         self.fixed_container_layout.addLayout(self.testcase_layout)
+        self.fixed_container_layout.addLayout(self.cores_layout)
         self.top_layout.addWidget(self.fixed_container, alignment=Qt.AlignHCenter)
 
         self.additional_layout = None
@@ -688,6 +1074,9 @@ class CPUScheduler(QMainWindow):
         self.extra_spacing = None
         self.newComboBox = None
         self.timeQuantumSpinBox = None
+        self.cfs_layout = None
+        self.targetLatencySpinBox = None
+        self.minGranularitySpinBox = None
 
     def setup_buttons(self):
         self.bottom_layout = QHBoxLayout()
@@ -759,13 +1148,21 @@ class CPUScheduler(QMainWindow):
         self.clear_layout(self.time_quantum_layout)
         self.time_quantum_layout = None
         self.timeQuantumSpinBox = None
+        self.clear_layout(self.cfs_layout)
+        self.cfs_layout = None
+        self.targetLatencySpinBox = None
+        self.minGranularitySpinBox = None
         self.clear_layout(self.extra_spacing)
         self.extra_spacing = None
 
+        # CFS is simulated on a single core
+        self.coresSpinBox.setEnabled(selected_text != "Completely Fair Scheduler (CFS)")
         if selected_text in ["Shortest Job First (SJF)", "Priority Scheduling"]:
             self.setup_sjf_priority_ui()
         elif selected_text == "Round Robin (RR)":
             self.setup_round_robin_ui()
+        elif selected_text == "Completely Fair Scheduler (CFS)":
+            self.setup_cfs_ui()
 
     def clear_layout(self, layout):
         if layout is not None:
@@ -807,11 +1204,34 @@ class CPUScheduler(QMainWindow):
         self.fixed_container_layout.addLayout(self.time_quantum_layout)
         self.fixed_container_layout.setAlignment(Qt.AlignHCenter)
 
+    def setup_cfs_ui(self):
+        self.extra_spacing = QVBoxLayout()
+        self.extra_spacing.addSpacing(20)
+        self.fixed_container_layout.addLayout(self.extra_spacing)
+
+        self.cfs_layout = QGridLayout()
+        self.cfs_layout.setHorizontalSpacing(10)
+        self.cfs_layout.addWidget(self.create_label("Target Latency:", 15, 200), 0, 0)
+        self.targetLatencySpinBox = self.create_spin_box(1, 100, 6, 100, 35)
+        self.cfs_layout.addWidget(self.targetLatencySpinBox, 0, 1)
+        self.cfs_layout.addWidget(self.create_label("Min Granularity:", 15, 200), 1, 0)
+        self.minGranularitySpinBox = self.create_spin_box(1, 6, 1, 100, 35)
+        self.cfs_layout.addWidget(self.minGranularitySpinBox, 1, 1)
+
+        # The minimum slice can never exceed the target latency
+        self.targetLatencySpinBox.valueChanged.connect(self.minGranularitySpinBox.setMaximum)
+
+        self.fixed_container_layout.addLayout(self.cfs_layout)
+        self.fixed_container_layout.setAlignment(Qt.AlignHCenter)
+
     def startSimulation(self):
         selected_algorithm = self.comboBox.currentText()
         process_quantity = self.quantitySpinBox.value()
         is_preemptive = self.newComboBox.currentText() == "Preemptive" if self.newComboBox else False
         time_quantum = self.timeQuantumSpinBox.value() if self.timeQuantumSpinBox else 2
+        cores = self.coresSpinBox.value() if self.coresSpinBox.isEnabled() else 1
+        target_latency = self.targetLatencySpinBox.value() if self.targetLatencySpinBox else 6
+        min_granularity = self.minGranularitySpinBox.value() if self.minGranularitySpinBox else 1
 
         algorithm_map = {
             "First Come First Serve (FCFS)": (FCFS, FCFS.about),
@@ -823,10 +1243,13 @@ class CPUScheduler(QMainWindow):
             "Priority Scheduling": (
                 PriorityScheduling,
                 PriorityScheduling.about["preemptive"] if is_preemptive else PriorityScheduling.about["non_preemptive"]
-            )
+            ),
+            "Completely Fair Scheduler (CFS)": (CFS, CFS.about)
         }
 
         algo_class, about_text = algorithm_map[selected_algorithm]
+        if cores > 1:
+            about_text += "\n\n" + SMP.about
         title = f"About {selected_algorithm}"
 
         msg = QMessageBox(self)
@@ -856,12 +1279,16 @@ class CPUScheduler(QMainWindow):
         
         msg.exec_()
 
-        self.inner_window = InnerWindow(selected_algorithm, process_quantity, is_preemptive, time_quantum)
+        self.inner_window = InnerWindow(selected_algorithm, process_quantity, is_preemptive, time_quantum, cores,
+                                        target_latency, min_granularity)
         self.inner_window.show()
         self.close()
 
-if __name__ == "__main__":
+def run():
     app = QApplication(sys.argv)
     window = CPUScheduler()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(run())
\ No newline at end of file
@@ -0,0 +1,23 @@
+import numpy as np
+
+from cpusched import FCFS, SJF
+from cpusched.cache import ScheduleCache
+
+
+def test_tuples_of_rows_differing_in_a_later_row_get_different_keys():
+    short = ((1, 0, 5), (2, 1, 3), (3, 2, 1), (4, 3, 1))
+    long = ((1, 0, 5), (2, 1, 3), (3, 2, 1), (4, 3, 100))
+    assert SJF(short, False).cache_key() != SJF(long, False).cache_key()
+    assert SJF(short, False).cache_key() == SJF(list(short), False).cache_key()
+
+    cache = ScheduleCache()
+    for processes in (short, long):
+        expected = list(SJF(processes, False).calculate_completion_time())
+        assert list(SJF(processes, False).schedule(cache).timeline) == expected
+    assert cache.stats.misses == 2
+
+
+def test_columns_and_rows_of_the_same_workload_share_a_key():
+    rows = [(1, 0, 5), (2, 1, 3), (3, 2, 1)]
+    columns = tuple(np.array(column, dtype=np.int64) for column in zip(*rows))
+    assert FCFS.from_columns(*columns).cache_key() == FCFS(rows).cache_key()
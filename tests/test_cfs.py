@@ -0,0 +1,16 @@
+from cpusched import CFS
+from cpusched.cfs import nice_weight
+
+
+def test_nice_values_split_the_cpu_by_weight():
+    # Nice 0 and nice 5 weigh 1024 and 335, so a 1359-unit period splits exactly into slices of 1024 and 335
+    assert (nice_weight(0), nice_weight(5)) == (1024, 335)
+    processes = [(1, 0, 3 * 1024, 0), (2, 0, 3 * 335, 5)]
+    timeline = list(CFS(processes, target_latency=1359).calculate_completion_time())
+    assert timeline == [(1, 0, 1024), (2, 1024, 1359), (1, 1359, 2383),
+                        (2, 2383, 2718), (1, 2718, 3742), (2, 3742, 4077)]
+
+    share = {1: 0, 2: 0}
+    for pid, start, end in timeline:
+        share[pid] += end - start
+    assert share == {1: 3 * 1024, 2: 3 * 335}
@@ -0,0 +1,247 @@
+"""Equivalence checks across the scheduling engines.
+
+The event-driven engines match reference schedulers that advance one time
+unit at a time, as the original engines did. Every engine builds the same
+schedule through ``calculate_completion_time()`` as through
+``iter_timeline()``, a one-core ``SMP`` reproduces the single-CPU engines,
+and incremental rescheduling matches scheduling from scratch. Workloads are
+random (pid, at, bt) and (pid, at, bt, priority) tuples with idle gaps, ties
+and zero burst times, plus small hand-checked cases.
+"""
+import random
+from collections import deque
+
+import pytest
+
+from cpusched import CFS, FCFS, SJF, SMP, PriorityScheduling, Process, RoundRobin
+from cpusched.process import earliest_change
+
+TRIALS = 300
+
+ENGINES = {
+    "fcfs": lambda processes, quantum: FCFS(processes),
+    "sjf": lambda processes, quantum: SJF(processes, False),
+    "srtf": lambda processes, quantum: SJF(processes, True),
+    "rr": lambda processes, quantum: RoundRobin(processes, quantum),
+    "priority": lambda processes, quantum: PriorityScheduling(processes, False),
+    "preemptive-priority": lambda processes, quantum: PriorityScheduling(processes, True),
+    "cfs": lambda processes, quantum: CFS(processes),
+}
+
+# SMP policy and preemption of each single-CPU engine it reproduces on one core
+SMP_POLICIES = {
+    "fcfs": ("fcfs", False),
+    "sjf": ("sjf", False),
+    "srtf": ("sjf", True),
+    "rr": ("rr", False),
+    "priority": ("priority", False),
+    "preemptive-priority": ("priority", True),
+}
+
+
+def random_workload(rnd, width):
+    n = rnd.randint(0, 25)
+    horizon = rnd.choice([5, 30, 100])  # Crowded to sparse, with idle gaps
+    rows = [(pid, rnd.randint(0, horizon), rnd.choice([0, rnd.randint(1, 9)]), rnd.randint(0, 4))
+            for pid in rnd.sample(range(1, 100), n)]
+    return [row[:width] for row in rows]
+
+
+def workloads(seed):
+    rnd = random.Random(seed)
+    for trial in range(TRIALS):
+        yield random_workload(rnd, 3 + trial % 2), rnd.randint(1, 4)
+
+
+def run(timeline, pid, t):
+    """Append time unit ``t`` of ``pid`` to ``timeline``, extending its segment if it ran the unit before."""
+    if timeline and timeline[-1][0] == pid and timeline[-1][2] == t:
+        timeline[-1] = (pid, timeline[-1][1], t + 1)
+    else:
+        timeline.append((pid, t, t + 1))
+
+
+def tick_schedule(processes, key, preemptive, empty_segments=True):
+    """Reference for the priority-queue engines, one time unit at a time.
+
+    At every tick (``preemptive``) or whenever the CPU is free, the arrived
+    process with the smallest ``key(i, row, remaining)`` runs, ``i`` being
+    its position in arrival order. A zero burst completes as soon as it is
+    picked, with an empty segment if ``empty_segments``.
+    """
+    rows = sorted(processes, key=lambda row: row[1])  # Ties keep input order
+    remaining = [row[2] for row in rows]
+    done = [False] * len(rows)
+    timeline = []
+    running = None
+    t = 0
+    while not all(done):
+        if running is None or preemptive:
+            ready = [i for i, row in enumerate(rows) if row[1] <= t and not done[i]]
+            if not ready:
+                t += 1
+                continue
+            running = min(ready, key=lambda i: key(i, rows[i], remaining[i]))
+            if remaining[running] == 0:
+                done[running] = True
+                if empty_segments:
+                    timeline.append((rows[running][0], t, t))
+                running = None
+                continue
+        run(timeline, rows[running][0], t)
+        t += 1
+        remaining[running] -= 1
+        if remaining[running] == 0:
+            done[running] = True
+            running = None
+    return timeline
+
+
+def tick_round_robin(processes, quantum):
+    """Reference for RoundRobin, one time unit at a time.
+
+    Processes arriving when a quantum expires queue ahead of the preempted
+    process, and a process alone in the queue keeps running.
+    """
+    rows = sorted(processes, key=lambda row: row[1])
+    remaining = [row[2] for row in rows]
+    queue = deque()
+    timeline = []
+    running = None
+    index = used = t = 0
+    while index < len(rows) or queue or running is not None:
+        while index < len(rows) and rows[index][1] <= t:
+            queue.append(index)
+            index += 1
+        if running is not None and used == quantum:
+            queue.append(running)
+            running = None
+        while running is None and queue:
+            running, used = queue.popleft(), 0
+            if remaining[running] == 0:
+                timeline.append((rows[running][0], t, t))
+                running = None
+        if running is None:
+            t += 1
+            continue
+        run(timeline, rows[running][0], t)
+        t += 1
+        used += 1
+        remaining[running] -= 1
+        if remaining[running] == 0:
+            running = None
+    return timeline
+
+
+def priority(row):
+    return row[3] if len(row) > 3 else 0
+
+
+REFERENCES = {
+    "fcfs": lambda processes, quantum: tick_schedule(processes, lambda i, row, left: i, False),
+    "sjf": lambda processes, quantum: tick_schedule(processes, lambda i, row, left: (row[2], row[0]), False),
+    "srtf": lambda processes, quantum: tick_schedule(processes, lambda i, row, left: (left, row[0]), True),
+    "rr": tick_round_robin,
+    "priority": lambda processes, quantum: tick_schedule(processes, lambda i, row, left: (priority(row), i), False),
+    # Zero bursts leave no segment in preemptive priority scheduling
+    "preemptive-priority": lambda processes, quantum: tick_schedule(
+        processes, lambda i, row, left: (priority(row), i), True, empty_segments=False),
+}
+
+
+def check_schedule(processes, timeline):
+    """Every process runs for exactly its burst time, never before it arrives, on one CPU."""
+    arrival = {row[0]: row[1] for row in processes}
+    executed = dict.fromkeys(arrival, 0)
+    end = 0
+    for pid, segment_start, segment_end in timeline:
+        assert segment_start >= max(end, arrival[pid]) or segment_start == segment_end
+        end = max(end, segment_end)
+        executed[pid] += segment_end - segment_start
+    assert executed == {row[0]: row[2] for row in processes}
+
+
+@pytest.mark.parametrize("engine", sorted(REFERENCES))
+def test_engines_match_tick_references(engine):
+    for processes, quantum in workloads(4):
+        timeline = list(ENGINES[engine](processes, quantum).calculate_completion_time())
+        assert timeline == REFERENCES[engine](processes, quantum), (processes, quantum)
+
+
+@pytest.mark.parametrize("engine, processes, quantum, expected", [
+    ("srtf", [(1, 0, 7), (2, 2, 4), (3, 4, 1), (4, 5, 4)], 1,
+     [(1, 0, 2), (2, 2, 4), (3, 4, 5), (2, 5, 7), (4, 7, 11), (1, 11, 16)]),
+    # Equal remaining times go to the lower pid, even over the running process
+    ("srtf", [(2, 0, 3), (1, 1, 2)], 1, [(2, 0, 1), (1, 1, 3), (2, 3, 5)]),
+    # A zero burst completes on arrival; the per-tick engine used to charge it one time unit
+    ("srtf", [(1, 0, 4), (2, 2, 0)], 1, [(1, 0, 2), (2, 2, 2), (1, 2, 4)]),
+    ("preemptive-priority", [(1, 0, 4, 3), (2, 1, 2, 1), (3, 2, 1, 2)], 1,
+     [(1, 0, 1), (2, 1, 3), (3, 3, 4), (1, 4, 7)]),
+    # Equal priorities never preempt: the earlier arrival keeps the CPU
+    ("preemptive-priority", [(1, 0, 3, 1), (2, 1, 2, 1)], 1, [(1, 0, 3), (2, 3, 5)]),
+    ("priority", [(1, 0, 3, 2), (2, 1, 2, 0), (3, 1, 1, 1)], 1, [(1, 0, 3), (2, 3, 5), (3, 5, 6)]),
+    # Equal priorities run in arrival order, then input order
+    ("priority", [(3, 1, 1, 0), (2, 0, 2, 0), (1, 1, 1, 0)], 1, [(2, 0, 2), (3, 2, 3), (1, 3, 4)]),
+    # An arrival at the end of a quantum queues ahead of the preempted process
+    ("rr", [(1, 0, 4), (2, 2, 2)], 2, [(1, 0, 2), (2, 2, 4), (1, 4, 6)]),
+    # Simultaneous arrivals queue in input order
+    ("rr", [(2, 0, 2), (1, 0, 2)], 1, [(2, 0, 1), (1, 1, 2), (2, 2, 3), (1, 3, 4)]),
+    # A lone process runs its quanta back to back as one segment
+    ("rr", [(1, 0, 5), (2, 7, 1)], 2, [(1, 0, 5), (2, 7, 8)]),
+])
+def test_hand_checked_schedules(engine, processes, quantum, expected):
+    assert list(ENGINES[engine](processes, quantum).calculate_completion_time()) == expected
+    assert REFERENCES[engine](processes, quantum) == expected
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_completion_time_matches_iter_timeline(engine):
+    make = ENGINES[engine]
+    for processes, quantum in workloads(1):
+        timeline = list(make(processes, quantum).calculate_completion_time())
+        assert timeline == list(make(processes, quantum).iter_timeline()), processes
+        check_schedule(processes, timeline)
+
+
+@pytest.mark.parametrize("engine", sorted(SMP_POLICIES))
+@pytest.mark.parametrize("queues", ["global", "per-core"])
+def test_one_core_smp_matches_single_cpu(engine, queues):
+    policy, preemptive = SMP_POLICIES[engine]
+    for processes, quantum in workloads(2):
+        expected = list(ENGINES[engine](processes, quantum).calculate_completion_time())
+        lanes = SMP(processes, 1, policy, preemptive, quantum, queues).calculate_lanes()
+        assert [list(lane) for lane in lanes] == [expected], processes
+
+
+@pytest.mark.parametrize("engine", ["fcfs", "sjf", "srtf"])
+def test_reschedule_matches_full_schedule(engine):
+    make = ENGINES[engine]
+    rnd = random.Random(3)
+    for processes, quantum in workloads(3):
+        if not processes:
+            continue
+        edited = list(processes)
+        i = rnd.randrange(len(edited))
+        pid, at, bt, *priority = edited[i]
+        edited[i] = (pid, rnd.randint(0, 40), rnd.randint(0, 9), *priority)
+        previous = make(processes, quantum).calculate_completion_time()
+        since = earliest_change(processes, edited)
+        if since is None:
+            continue  # Nothing changed
+        timeline = make(edited, quantum).reschedule(previous, since)
+        assert list(timeline) == list(make(edited, quantum).calculate_completion_time()), (processes, edited)
+
+
+def test_fcfs_ignores_the_priority_column():
+    scheduler = FCFS([(1, 0, 5, 2), (2, 1, 3, 1), (3, 2, 1, 0)])
+    assert list(scheduler.calculate_completion_time()) == [(1, 0, 5), (2, 5, 8), (3, 8, 9)]
+
+
+def test_fcfs_process_records():
+    scheduler = FCFS([Process(1, 0, 5, 2), Process(2, 1, 3, 1)])
+    assert list(scheduler.calculate_completion_time()) == list(scheduler.iter_timeline())
+
+
+def test_fcfs_rejects_other_widths():
+    with pytest.raises(ValueError):
+        FCFS([(1, 0)]).calculate_completion_time()
@@ -0,0 +1,33 @@
+import random
+
+from cpusched import FCFS, SJF, RoundRobin
+from cpusched.frames import FrameCursor, FrameIndex
+from cpusched.process import Process
+
+
+def test_seek_matches_stepping():
+    rnd = random.Random(17)
+    for _ in range(200):
+        processes = [Process(pid, rnd.randint(0, 20), rnd.choice([0, 0, rnd.randint(1, 6)]))
+                     for pid in range(1, rnd.randint(2, 10))]
+        for scheduler in (FCFS(processes), RoundRobin(processes, 2), SJF(processes, True)):
+            result = scheduler.schedule()
+            index = FrameIndex(result.timeline, processes, result.metrics.ct)
+            stepper = FrameCursor(index)
+            ready = stepper.seek(0).ready
+            for t in range(1, len(index) + 3):
+                frame = stepper.step(t)
+                ready = frame.ready if frame.ready is not None else ready
+                seeker = FrameCursor(index)
+                expected = [index.pid[row] for row in index.ready_at(t)]
+                assert list(seeker.seek(t).ready) == list(ready) == expected, t
+                assert seeker.completed == stepper.completed, t
+                assert seeker.executed == stepper.executed, t
+
+
+def test_zero_burst_rows_complete_on_arrival():
+    processes = [Process(1, 0, 3), Process(2, 5, 0)]
+    result = FCFS(processes).schedule()
+    cursor = FrameCursor(FrameIndex(result.timeline, processes, result.metrics.ct))
+    assert cursor.seek(1).completed == []
+    assert cursor.seek(5).completed == [0, 1]
@@ -0,0 +1,49 @@
+import io
+
+from cpusched.ingest import TraceStats, iter_cluster_csv, iter_sched_trace
+
+PERF_SCHED = """\
+            perf  1234 [001]   100.000000:       sched:sched_wakeup: bash:42 [120] CPU:001
+         swapper     0 [001]   100.000100:       sched:sched_switch: swapper/1:0 [120] R ==> bash:42 [120]
+            bash    42 [001]   100.001100: sched:sched_stat_runtime: comm=bash pid=42 runtime=1000000 [ns]
+            bash    42 [001]   100.003100:       sched:sched_switch: bash:42 [120] S ==> swapper/1:0 [120]
+"""
+
+FTRACE = """\
+# tracer: nop
+          <idle>-0     [000] d..2  50.000000: sched_wakeup: comm=make pid=7 prio=110 target_cpu=000
+          <idle>-0     [000] d..2  50.001000: sched_switch: prev_comm=swapper/0 prev_pid=0 prev_prio=120 prev_state=R ==> next_comm=make next_pid=7 next_prio=110
+            make-7     [000] d..2  50.003000: sched_switch: prev_comm=make prev_pid=7 prev_prio=110 prev_state=R+ ==> next_comm=cc1 next_pid=8 next_prio=120
+             cc1-8     [000] d..2  50.004000: sched_switch: prev_comm=cc1 prev_pid=8 prev_prio=120 prev_state=D ==> next_comm=make next_pid=7 next_prio=110
+            make-7     [000] d..2  50.006000: sched_switch: prev_comm=make prev_pid=7 prev_prio=110 prev_state=S ==> next_comm=swapper/0 next_pid=0 next_prio=120
+"""
+
+
+def test_perf_script_padded_event_names():
+    stats = TraceStats()
+    assert list(iter_sched_trace(io.StringIO(PERF_SCHED), stats=stats)) == [(1, 0, 3, 0)]
+    assert stats.events == 3 and stats.skipped == 0
+
+
+def test_ftrace_bursts_span_preemptions():
+    assert list(iter_sched_trace(io.StringIO(FTRACE))) == [(1, 3, 1, 0), (2, 0, 4, -10)]
+
+
+def test_unparsed_event_lines_are_counted():
+    stats = TraceStats()
+    lines = ["  bash 42 [001] 100: sched:sched_switch: no fractional timestamp\n"]
+    assert list(iter_sched_trace(lines, stats=stats)) == []
+    assert stats.skipped == 1
+
+
+def test_cluster_csv():
+    rows = "task,start_time,end_time,priority\n1,1000,4000,2\n2,2500,,0\n3,2000,9000,9\n"
+    stats = TraceStats()
+    assert list(iter_cluster_csv(io.StringIO(rows), tick=1000, stats=stats)) == [(1, 1, 3, 2), (2, 2, 7, 9)]
+    assert stats.skipped == 1
+
+
+def test_cluster_csv_rows_out_of_start_order():
+    rows = "start,duration\n5000,2000\n1000,1000\n3000,500\n"
+    assert list(iter_cluster_csv(io.StringIO(rows), tick=1000, origin=1000)) == [(1, 4, 2, 0), (2, 0, 1, 0), (3, 2, 1, 0)]
+    assert list(iter_cluster_csv(io.StringIO(rows), tick=1000)) == [(1, 5, 2, 0), (2, 1, 1, 0), (3, 3, 1, 0)]